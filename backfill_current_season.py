@@ -10,24 +10,22 @@ This fetches:
 Saves to static/data/snow-cover-season.json.
 
 Usage:
-    python backfill_current_season.py
+    python backfill_current_season.py [--progress-jsonl FILE]
 """
 
 import json
 import time
 import os
 import sys
-import re
-import urllib.request
-import urllib.error
-import ssl
 from datetime import datetime, timedelta
 
+# Shared NOHRSC archive cache and concurrent, resumable backfill runner
+from fetch_nohrsc_archive import backfill_nohrsc_days, make_progress_reporter
+
 # Import IMS fetcher for REAL Canada data
 from fetch_ims_snow_data import (
-    fetch_ims_file,
-    calculate_snow_cover_percentage,
-    REGION_BOUNDS
+    build_season_cube,
+    cube_region_covers
 )
 
 
@@ -36,68 +34,13 @@ def print_safe(msg):
     print(msg, flush=True)
 
 
-def fetch_url(url, timeout=15):
-    """Fetch URL content with error handling"""
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
-            return response.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        return None
-
-
-def fetch_nohrsc_for_date(year, month, day):
-    """
-    Fetch NOHRSC snow cover for a specific date.
-    Returns dict with 'cover' and 'depth_inches', or None if not available.
-    """
-    url = f"https://www.nohrsc.noaa.gov/nsa/index.html?year={year}&month={month}&day={day}"
-    content = fetch_url(url, timeout=15)
-
-    if not content:
-        return None
-
-    result = {}
-
-    # Look for "Area Covered By Snow" pattern
-    match = re.search(
-        r'Area\s+Covered\s+By\s+Snow[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*%',
-        content, re.IGNORECASE
-    )
-    if match:
-        result['cover'] = float(match.group(1))
-    else:
-        # Fallback pattern
-        match = re.search(
-            r'Area\s+Covered[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*%',
-            content, re.IGNORECASE
-        )
-        if match:
-            result['cover'] = float(match.group(1))
-
-    # Look for average depth
-    depth_match = re.search(
-        r'Average\s+Snow\s+Depth[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*(?:inches|in)',
-        content, re.IGNORECASE
-    )
-    if depth_match:
-        result['depth_inches'] = float(depth_match.group(1))
-
-    if 'cover' in result:
-        return result
-    return None
-
-
-def backfill_current_season():
+def backfill_current_season(progress_path=None):
     """
     Fetch all snow cover data from Oct 1, 2025 to today.
+
+    Args:
+        progress_path: Optional JSON lines file for structured progress
+            (done, total, rate_per_s, eta_s, ...)
     """
     print_safe("=" * 60)
     print_safe("Backfilling current season data (Oct 1, 2025 to today)")
@@ -117,19 +60,21 @@ def backfill_current_season():
     usa_history = []
     start_time = time.time()
 
-    current_date = season_start
+    # Days are fetched concurrently and checkpointed, so an interrupted
+    # backfill resumes where it stopped
+    dates = [(season_start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(total_days)]
+    results = backfill_nohrsc_days(
+        dates, f'current-season-{season_start.year}',
+        progress=make_progress_reporter(progress_path)
+    )
+
     fetched = 0
     missing = 0
 
-    while current_date <= end_date:
-        year = current_date.year
-        month = current_date.month
-        day = current_date.day
-        date_str = current_date.strftime('%Y-%m-%d')
-
-        data = fetch_nohrsc_for_date(year, month, day)
+    for date_str in dates:
+        data = results[date_str]
 
-        if data and 'cover' in data:
+        if data and data.get('cover') is not None:
             usa_history.append({
                 'date': date_str,
                 'value': data['cover'],
@@ -141,51 +86,28 @@ def backfill_current_season():
             missing += 1
             print_safe(f"  Missing data for {date_str}")
 
-        # Progress update every 10 days
-        completed = fetched + missing
-        if completed % 10 == 0:
-            elapsed = time.time() - start_time
-            rate = completed / elapsed if elapsed > 0 else 0
-            remaining = (total_days - completed) / rate if rate > 0 else 0
-            print_safe(f"  Progress: {completed}/{total_days} ({100*completed//total_days}%) - ETA: {remaining:.0f}s")
-
-        # Small delay to be nice to the server
-        time.sleep(0.15)
-        current_date += timedelta(days=1)
-
     # Fetch REAL Canada data from IMS satellite - NO DERIVATION!
     print_safe("\n" + "=" * 60)
     print_safe("Fetching REAL Canada data from NOAA IMS...")
     print_safe("=" * 60)
 
+    # Build (or extend) the season cube, then read Canada cover for every
+    # day from the packed snow masks
+    canada_covers = {}
+    cube = build_season_cube(season_start.year, end_date=end_date)
+    if cube is not None:
+        for date_str, covers in cube_region_covers(cube, ['canada']).items():
+            canada_covers[date_str] = covers['canada']['cover']
+
     canada_history = []
-    canada_bounds = REGION_BOUNDS.get('canada')
     canada_fetched = 0
     canada_missing = 0
 
     for entry in usa_history:
-        try:
-            # Parse the date
-            date_obj = datetime.strptime(entry['date'], '%Y-%m-%d')
-            year = date_obj.year
-            doy = date_obj.timetuple().tm_yday
-
-            # Fetch IMS grid for this date
-            grid = fetch_ims_file(year, doy)
-            if grid and canada_bounds:
-                stats = calculate_snow_cover_percentage(grid, canada_bounds)
-                if stats:
-                    canada_value = stats['cover']
-                    canada_fetched += 1
-                else:
-                    canada_value = None
-                    canada_missing += 1
-            else:
-                canada_value = None
-                canada_missing += 1
-        except Exception as e:
-            print_safe(f"  Warning: Could not fetch IMS for {entry['date']}: {e}")
-            canada_value = None
+        canada_value = canada_covers.get(entry['date'])
+        if canada_value is not None:
+            canada_fetched += 1
+        else:
             canada_missing += 1
 
         canada_history.append({
@@ -193,14 +115,6 @@ def backfill_current_season():
             'value': canada_value
         })
 
-        # Progress update every 10 days
-        total_canada = canada_fetched + canada_missing
-        if total_canada % 10 == 0:
-            print_safe(f"  Canada progress: {total_canada}/{len(usa_history)} (fetched: {canada_fetched}, missing: {canada_missing})")
-
-        # Small delay for IMS server
-        time.sleep(0.1)
-
     print_safe(f"\nCanada IMS data: {canada_fetched} fetched, {canada_missing} missing")
 
     # Summary
@@ -221,7 +135,11 @@ def main():
     """Main entry point"""
     print_safe(f"Starting backfill at {datetime.now().isoformat()}\n")
 
-    usa_history, canada_history = backfill_current_season()
+    progress_path = None
+    if '--progress-jsonl' in sys.argv:
+        progress_path = sys.argv[sys.argv.index('--progress-jsonl') + 1]
+
+    usa_history, canada_history = backfill_current_season(progress_path)
 
     if not usa_history:
         print_safe("ERROR: No data fetched!")
@@ -14,24 +14,23 @@ only need to be run once per year (after April 30) to include the
 newly completed season.
 
 Usage:
-    python fetch_historical_averages.py
+    python fetch_historical_averages.py [--progress-jsonl FILE]
 """
 
 import json
 import time
 import os
 import sys
-import re
-import urllib.request
-import urllib.error
-import ssl
 from datetime import datetime, timedelta
 
+# Shared NOHRSC archive cache and concurrent, resumable backfill runner
+from fetch_nohrsc_archive import backfill_nohrsc_days, make_progress_reporter
+
 # Import IMS fetcher for REAL Canada data
 from fetch_ims_snow_data import (
-    fetch_ims_file,
-    calculate_snow_cover_percentage,
-    REGION_BOUNDS
+    build_season_cube,
+    cube_dates,
+    cube_region_covers
 )
 
 
@@ -40,53 +39,6 @@ def print_safe(msg):
     print(msg, flush=True)
 
 
-def fetch_url(url, timeout=15):
-    """Fetch URL content with error handling"""
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
-            return response.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        return None
-
-
-def fetch_nohrsc_historical(year, month, day):
-    """
-    Fetch historical NOHRSC snow cover for a specific date.
-    Returns dict with 'cover', or None if not available.
-    """
-    url = f"https://www.nohrsc.noaa.gov/nsa/index.html?year={year}&month={month}&day={day}"
-    content = fetch_url(url, timeout=15)
-
-    if not content:
-        return None
-
-    # Look for "Area Covered By Snow" pattern
-    match = re.search(
-        r'Area\s+Covered\s+By\s+Snow[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*%',
-        content, re.IGNORECASE
-    )
-    if match:
-        return {'cover': float(match.group(1))}
-
-    # Fallback pattern
-    match = re.search(
-        r'Area\s+Covered[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*%',
-        content, re.IGNORECASE
-    )
-    if match:
-        return {'cover': float(match.group(1))}
-
-    return None
-
-
 def main():
     """Main entry point"""
     print_safe(f"Starting historical data fetch at {datetime.now().isoformat()}\n")
@@ -120,8 +72,6 @@ def main():
 
     print_safe(f"Season spans {len(season_dates)} days (Oct 1 - Apr 30)")
 
-    canada_bounds = REGION_BOUNDS.get('canada')
-
     # Store raw daily values for each (date, year) combination
     # This allows us to compute USA, Canada, and Combined averages without re-fetching
     usa_raw = {}    # (month, day, year) -> value
@@ -134,38 +84,37 @@ def main():
     print_safe("Phase 1: Fetching USA historical data from NOHRSC...")
     print_safe("=" * 60)
 
-    total_requests = len(season_dates) * len(years_used)
-    completed = 0
-    start_time = time.time()
-
+    # Every (date, winter) pair is one NOHRSC day; they are fetched
+    # concurrently and checkpointed, so an interrupted run resumes
+    day_keys = []
     for winter_start_year in years_used:
-        print_safe(f"\nFetching {winter_start_year}/{winter_start_year + 1} winter...")
-
         for month, day in season_dates:
             # Skip Feb 29 for non-leap years
             if month == 2 and day == 29:
                 year_to_check = winter_start_year + 1
                 if not (year_to_check % 4 == 0 and (year_to_check % 100 != 0 or year_to_check % 400 == 0)):
-                    completed += 1
                     continue
 
             if month >= 10:
                 year = winter_start_year
             else:
                 year = winter_start_year + 1
+            day_keys.append((month, day, year))
 
-            data = fetch_nohrsc_historical(year, month, day)
-            if data is not None and data['cover'] is not None:
-                usa_raw[(month, day, year)] = data['cover']
+    progress_path = None
+    if '--progress-jsonl' in sys.argv:
+        progress_path = sys.argv[sys.argv.index('--progress-jsonl') + 1]
 
-            completed += 1
-            if completed % 50 == 0:
-                elapsed = time.time() - start_time
-                rate = completed / elapsed if elapsed > 0 else 0
-                remaining = (total_requests - completed) / rate if rate > 0 else 0
-                print_safe(f"  Progress: {completed}/{total_requests} ({100*completed//total_requests}%) - ETA: {remaining:.0f}s")
+    dates = [f'{year}-{month:02d}-{day:02d}' for month, day, year in day_keys]
+    results = backfill_nohrsc_days(
+        dates, f'historical-{years_used[0]}-{years_used[-1] + 1}',
+        progress=make_progress_reporter(progress_path)
+    )
 
-            time.sleep(0.1)
+    for key, date_str in zip(day_keys, dates):
+        data = results[date_str]
+        if data is not None and data['cover'] is not None:
+            usa_raw[key] = data['cover']
 
     print_safe(f"\nUSA: {len(usa_raw)} daily values collected")
 
@@ -176,44 +125,23 @@ def main():
     print_safe("Phase 2: Fetching Canada historical data from NOAA IMS...")
     print_safe("=" * 60)
 
-    completed = 0
+    # Each winter is stored as a season cube of bit-packed daily snow masks,
+    # so only days missing from the cube are fetched and parsed
     start_time = time.time()
 
     for winter_start_year in years_used:
-        print_safe(f"\nFetching {winter_start_year}/{winter_start_year + 1} winter...")
+        print_safe(f"\nBuilding {winter_start_year}/{winter_start_year + 1} season cube...")
 
-        for month, day in season_dates:
-            # Skip Feb 29 for non-leap years
-            if month == 2 and day == 29:
-                year_to_check = winter_start_year + 1
-                if not (year_to_check % 4 == 0 and (year_to_check % 100 != 0 or year_to_check % 400 == 0)):
-                    completed += 1
-                    continue
+        cube = build_season_cube(winter_start_year)
+        if cube is None:
+            print_safe("  Could not open season cube")
+            continue
 
-            if month >= 10:
-                year = winter_start_year
-            else:
-                year = winter_start_year + 1
+        for date_str, covers in cube_region_covers(cube, ['canada']).items():
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            canada_raw[(date_obj.month, date_obj.day, date_obj.year)] = covers['canada']['cover']
 
-            try:
-                date_obj = datetime(year, month, day)
-                doy = date_obj.timetuple().tm_yday
-                grid = fetch_ims_file(year, doy)
-                if grid and canada_bounds:
-                    stats = calculate_snow_cover_percentage(grid, canada_bounds)
-                    if stats:
-                        canada_raw[(month, day, year)] = stats['cover']
-            except Exception:
-                pass
-
-            completed += 1
-            if completed % 50 == 0:
-                elapsed = time.time() - start_time
-                rate = completed / elapsed if elapsed > 0 else 0
-                remaining = (total_requests - completed) / rate if rate > 0 else 0
-                print_safe(f"  Progress: {completed}/{total_requests} ({100*completed//total_requests}%) - ETA: {remaining:.0f}s")
-
-            time.sleep(0.05)
+        print_safe(f"  {len(cube_dates(cube))} days in cube - elapsed {time.time() - start_time:.0f}s")
 
     print_safe(f"\nCanada: {len(canada_raw)} daily values collected")
 
@@ -22,33 +22,94 @@ Grid specifications (24km resolution):
   - Vertical longitude: 80°W
   - Standard parallel: 60°N
 
+The 4km (6144 x 6144) and 1km (24576 x 24576) products share the same
+extent and projection (see IMS_GRIDS). They are streamed to memory-mapped
+files under IMS_CACHE_DIR and reduced in row blocks.
+
+Downloaded files are kept in a local archive (.cache/ims/archive) and
+reused by every script that reads IMS data. Environment variables:
+  IMS_CACHE_DIR       Cache location (default: .cache/ims next to this file)
+  IMS_ARCHIVE_MAX_MB  Archive + decoded grid size limit before LRU eviction
+                      (default: 1024)
+  IMS_OFFLINE=1       Use cached files only, never download
+
 Usage:
     python fetch_ims_snow_data.py [--date YYYY-MM-DD] [--output FILE]
+    python fetch_ims_snow_data.py --benchmark FILE.asc.gz
 """
 
 import os
 import sys
+import re
 import gzip
 import math
 import json
+import hashlib
+import shutil
+import struct
+import time
+import zlib
+import threading
 import urllib.request
 import urllib.error
+import urllib.parse
 import ssl
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from io import BytesIO
 
+import numpy as np
+
 
 # IMS Grid constants (24km resolution)
 IMS_NCOLS = 1024
 IMS_NROWS = 1024
 IMS_RESOLUTION_KM = 24
 
+# Grid metadata per product resolution. All three share the same extent
+# and projection; only the cell size changes.
+IMS_GRIDS = {
+    '24km': {'nrows': 1024, 'ncols': 1024, 'resolution_km': 24},
+    '4km': {'nrows': 6144, 'ncols': 6144, 'resolution_km': 4},
+    '1km': {'nrows': 24576, 'ncols': 24576, 'resolution_km': 1},
+}
+
+# Grids larger than this are streamed to a memory-mapped file instead of
+# held in RAM, and reduced in row blocks of about IMS_BLOCK_CELLS cells
+IMS_IN_MEMORY_MAX_CELLS = IMS_NROWS * IMS_NCOLS
+IMS_BLOCK_CELLS = 2 ** 21
+
 # Polar stereographic projection parameters
 IMS_CENTER_LAT = 90.0  # North Pole
 IMS_CENTER_LON = -80.0  # 80°W vertical
 IMS_STANDARD_PARALLEL = 60.0
 IMS_EARTH_RADIUS_KM = 6371.228
 
+# Local cache for derived grid products (projection tables, region masks)
+IMS_CACHE_DIR = os.environ.get(
+    'IMS_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'ims')
+)
+
+# Downloaded .asc.gz files, stored as archive/<resolution>/<year>/<filename>.
+# Published daily files never change, so a cached copy is always reused.
+# Least recently used files are evicted once the archive, together with the
+# decoded 4km/1km grids in grids/, exceeds the limit.
+IMS_ARCHIVE_DIR = os.path.join(IMS_CACHE_DIR, 'archive')
+IMS_GRIDS_DIR = os.path.join(IMS_CACHE_DIR, 'grids')
+IMS_ARCHIVE_MAX_BYTES = int(os.environ.get('IMS_ARCHIVE_MAX_MB', '1024')) * 1024 * 1024
+IMS_BASE_URL = "https://noaadata.apps.nsidc.org/NOAA/G02156"
+
+# Backfill pipeline: parallel downloads, with a per-host cap on concurrent
+# requests and a minimum spacing between request starts
+IMS_DOWNLOAD_WORKERS = 8
+IMS_HOST_MAX_CONCURRENT = 4
+IMS_HOST_MIN_INTERVAL = 0.05
+
+# Per-host overrides for host_slot: host -> (max concurrent, min interval in seconds)
+HOST_LIMITS = {}
+
 # Grid cell values
 IMS_OUTSIDE = 0
 IMS_SEA = 1
@@ -62,7 +123,23 @@ def print_safe(msg):
     print(msg, flush=True)
 
 
-def lat_lon_to_ims_grid(lat, lon):
+def get_grid_spec(resolution='24km'):
+    """Return the IMS_GRIDS entry for a resolution ('24km', '4km' or '1km')."""
+    if resolution not in IMS_GRIDS:
+        raise ValueError(f"Unknown IMS resolution: {resolution}")
+    return IMS_GRIDS[resolution]
+
+
+def resolution_for_grid(grid):
+    """Infer the IMS resolution key from a grid's column count."""
+    ncols = grid.shape[1]
+    for resolution, spec in IMS_GRIDS.items():
+        if spec['ncols'] == ncols:
+            return resolution
+    return '24km'
+
+
+def lat_lon_to_ims_grid(lat, lon, resolution='24km'):
     """
     Convert latitude/longitude to IMS grid coordinates (row, col).
 
@@ -98,24 +175,26 @@ def lat_lon_to_ims_grid(lat, lon):
         y = -rho * math.cos(delta_lon)
 
     # Convert km to grid cells
-    # Grid is centered, so (512, 512) is approximately the pole
-    col = int(IMS_NCOLS / 2 + x / IMS_RESOLUTION_KM)
-    row = int(IMS_NROWS / 2 + y / IMS_RESOLUTION_KM)
+    # Grid is centered, so (512, 512) is approximately the pole at 24km
+    spec = get_grid_spec(resolution)
+    col = int(spec['ncols'] / 2 + x / spec['resolution_km'])
+    row = int(spec['nrows'] / 2 + y / spec['resolution_km'])
 
     # Check bounds
-    if 0 <= row < IMS_NROWS and 0 <= col < IMS_NCOLS:
+    if 0 <= row < spec['nrows'] and 0 <= col < spec['ncols']:
         return (row, col)
     return None
 
 
-def ims_grid_to_lat_lon(row, col):
+def ims_grid_to_lat_lon(row, col, resolution='24km'):
     """
     Convert IMS grid coordinates to latitude/longitude.
     Inverse of lat_lon_to_ims_grid.
     """
     # Convert grid to km from center
-    x = (col - IMS_NCOLS / 2) * IMS_RESOLUTION_KM
-    y = (row - IMS_NROWS / 2) * IMS_RESOLUTION_KM
+    spec = get_grid_spec(resolution)
+    x = (col - spec['ncols'] / 2) * spec['resolution_km']
+    y = (row - spec['nrows'] / 2) * spec['resolution_km']
 
     # Polar stereographic inverse
     center_lon_rad = math.radians(IMS_CENTER_LON)
@@ -133,25 +212,434 @@ def ims_grid_to_lat_lon(row, col):
     return (math.degrees(lat), math.degrees(lon))
 
 
-def fetch_ims_file(year, day_of_year, resolution='24km'):
+# ============================================
+# Projection Cache
+# ============================================
+
+# resolution -> (lats, lons) and resolution -> {region_name: mask}
+_projection_cache = {}
+_region_mask_cache = {}
+
+
+def cells_lat_lon(rows, cols, resolution='24km'):
     """
-    Fetch IMS ASCII data for a specific date.
+    Vectorized inverse projection for arrays of grid coordinates.
+
+    Same formulas as ims_grid_to_lat_lon; rows and cols broadcast together.
+
+    Returns:
+        (lats, lons) float64 arrays in degrees
+    """
+    spec = get_grid_spec(resolution)
+    x = (np.asarray(cols, dtype=np.float64) - spec['ncols'] / 2) * spec['resolution_km']
+    y = (np.asarray(rows, dtype=np.float64) - spec['nrows'] / 2) * spec['resolution_km']
+    x, y = np.broadcast_arrays(x, y)
+
+    k0 = (1 + math.sin(math.radians(IMS_STANDARD_PARALLEL))) / 2
+    rho = np.hypot(x, y)
+    c = 2 * np.arctan(rho / (2 * IMS_EARTH_RADIUS_KM * k0))
+
+    lats = np.degrees(np.arcsin(np.cos(c)))
+    lons = np.degrees(math.radians(IMS_CENTER_LON) + np.arctan2(x, -y))
+
+    # The pole cell is defined as (90, 0)
+    pole = rho == 0
+    lats[pole] = 90.0
+    lons[pole] = 0.0
+
+    return lats, lons
+
+
+def compute_grid_lat_lon(resolution='24km', row_start=0, row_stop=None):
+    """
+    Project every cell in a band of grid rows (the whole grid by default).
+
+    Returns:
+        (lats, lons) float64 arrays of shape (row_stop - row_start, ncols)
+    """
+    spec = get_grid_spec(resolution)
+    if row_stop is None:
+        row_stop = spec['nrows']
+    rows = np.arange(row_start, row_stop)[:, np.newaxis]
+    cols = np.arange(spec['ncols'])[np.newaxis, :]
+    return cells_lat_lon(rows, cols, resolution)
+
+
+def get_grid_lat_lon(resolution='24km'):
+    """Return cached (lats, lons) arrays for the IMS grid, computing them once."""
+    spec = get_grid_spec(resolution)
+    if spec['nrows'] * spec['ncols'] > IMS_IN_MEMORY_MAX_CELLS:
+        raise ValueError(f"{resolution} grid is too large for a full projection table; "
+                         "use compute_grid_lat_lon on row blocks")
+    if resolution not in _projection_cache:
+        _projection_cache[resolution] = compute_grid_lat_lon(resolution)
+    return _projection_cache[resolution]
+
+
+def iter_row_blocks(nrows, ncols, block_cells=None):
+    """Yield (row_start, row_stop) bands of roughly block_cells cells."""
+    block_rows = max(1, (block_cells or IMS_BLOCK_CELLS) // ncols)
+    for start in range(0, nrows, block_rows):
+        yield start, min(start + block_rows, nrows)
+
+
+def _bounds_key(bounds):
+    return (bounds['min_lat'], bounds['max_lat'], bounds['min_lon'], bounds['max_lon'])
+
+
+def _region_bounds_signature():
+    """Short hash of REGION_BOUNDS so cached masks are rebuilt when bounds change."""
+    payload = json.dumps(REGION_BOUNDS, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+def build_region_mask(bounds, resolution='24km'):
+    """Boolean mask of grid cells whose center falls inside a lat/lon box."""
+    lats, lons = get_grid_lat_lon(resolution)
+    return ((lats >= bounds['min_lat']) & (lats <= bounds['max_lat']) &
+            (lons >= bounds['min_lon']) & (lons <= bounds['max_lon']))
+
+
+def get_region_masks(resolution='24km'):
+    """
+    Return {region_name: boolean mask} for every REGION_BOUNDS entry.
+
+    Masks are built once with vectorized comparisons against the cached
+    lat/lon tables and saved to IMS_CACHE_DIR/region-masks-<resolution>.npz,
+    so later runs just load them.
+    """
+    if resolution in _region_mask_cache:
+        return _region_mask_cache[resolution]
+
+    signature = _region_bounds_signature()
+    path = os.path.join(IMS_CACHE_DIR, f'region-masks-{resolution}.npz')
+
+    masks = None
+    if os.path.exists(path):
+        try:
+            with np.load(path) as data:
+                if str(data['signature']) == signature:
+                    masks = {name: data[name] for name in REGION_BOUNDS}
+        except Exception as e:
+            print_safe(f"  Warning: Ignoring unreadable region mask cache {path}: {e}")
+
+    if masks is None:
+        masks = {name: build_region_mask(bounds, resolution)
+                 for name, bounds in REGION_BOUNDS.items()}
+        try:
+            os.makedirs(IMS_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, signature=np.array(signature), **masks)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print_safe(f"  Warning: Could not save region mask cache: {e}")
+
+    _region_mask_cache[resolution] = masks
+    return masks
+
+
+def get_region_mask(region_bounds, resolution='24km'):
+    """Mask for a bounds dict; named REGION_BOUNDS entries come from the mask cache."""
+    key = _bounds_key(region_bounds)
+    masks = get_region_masks(resolution)
+    for name, bounds in REGION_BOUNDS.items():
+        if _bounds_key(bounds) == key:
+            return masks[name]
+    return build_region_mask(region_bounds, resolution)
+
+
+# First line made up only of grid digits marks the end of the text header
+_IMS_DATA_START = re.compile(rb'^[ \t]*[0-4][0-4 \t]*\r?$', re.MULTILINE)
+
+
+def parse_ims_grid(raw, ncols=IMS_NCOLS, nrows=IMS_NROWS):
+    """
+    Parse a decompressed IMS ASCII file into a uint8 numpy array.
+
+    The header is skipped with a single byte search for the first all-digit
+    line; the remaining bytes are viewed in place with np.frombuffer, so no
+    per-character Python work is done.
 
     Args:
-        year: Year (e.g., 2025)
-        day_of_year: Day of year (1-366)
-        resolution: '24km', '4km', or '1km'
+        raw: Decompressed file contents (bytes)
+        ncols, nrows: Expected grid dimensions
+
+    Returns:
+        uint8 numpy array of shape (rows, ncols), or None if no grid data found
+    """
+    match = _IMS_DATA_START.search(raw)
+    if not match:
+        print_safe("  Warning: No grid data found in IMS file")
+        return None
+
+    data = np.frombuffer(raw, dtype=np.uint8, offset=match.start())
+
+    # Keep only the digit bytes (drops newlines, CRs and any padding) and
+    # turn ASCII '0'..'4' into 0..4
+    values = data - ord('0')
+    values = values[values <= IMS_SNOW]
+
+    rows = values.size // ncols
+    if rows != nrows:
+        print_safe(f"  Warning: Expected {nrows} rows, got {rows}")
+    if rows == 0:
+        return None
+
+    return values[:rows * ncols].reshape(rows, ncols)
+
+
+def stream_ims_grid_to_file(fileobj, path, resolution, chunk_size=1 << 22):
+    """
+    Decompress an IMS .asc.gz stream straight into a memory-mapped uint8 file.
+
+    Only one chunk of the decompressed text is in memory at a time, so even
+    the 1km grid (~600MB of characters) never needs to fit in RAM.
+
+    Args:
+        fileobj: Readable binary stream of the gzip-compressed file
+        path: Destination .u8 file (raw row-major uint8, nrows x ncols)
+        resolution: IMS_GRIDS key
+
+    Returns:
+        Read-only np.memmap of shape (nrows, ncols), or None on failure
+    """
+    spec = get_grid_spec(resolution)
+    total = spec['nrows'] * spec['ncols']
+    tmp_path = path + '.tmp'
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    out = np.memmap(tmp_path, dtype=np.uint8, mode='w+', shape=(total,))
+    written = 0
+    header = b''
+    in_data = False
+
+    with gzip.GzipFile(fileobj=fileobj) as gz:
+        while written < total:
+            chunk = gz.read(chunk_size)
+            if not chunk:
+                break
+
+            if not in_data:
+                # Only search complete lines so a split header line can't match
+                header += chunk
+                last_newline = header.rfind(b'\n')
+                match = _IMS_DATA_START.search(header, 0, last_newline + 1) if last_newline >= 0 else None
+                if not match:
+                    continue
+                chunk = header[match.start():]
+                header = b''
+                in_data = True
+
+            values = np.frombuffer(chunk, dtype=np.uint8) - ord('0')
+            values = values[values <= IMS_SNOW][:total - written]
+            out[written:written + values.size] = values
+            written += values.size
+
+    out.flush()
+    del out
+
+    if written != total:
+        print_safe(f"  Warning: Expected {total:,} cells, got {written:,}")
+        os.remove(tmp_path)
+        return None
+
+    os.replace(tmp_path, path)
+    return np.memmap(path, dtype=np.uint8, mode='r', shape=(spec['nrows'], spec['ncols']))
+
+
+def _parse_ims_grid_lines(raw):
+    """Original per-character list-of-lists parser, kept for benchmarking."""
+    lines = raw.decode('ascii', errors='ignore').strip().split('\n')
+
+    data_start = 0
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped and all(c in '01234' for c in stripped):
+            data_start = i
+            break
+
+    grid = []
+    for line in lines[data_start:]:
+        row = [int(c) for c in line.strip() if c in '01234']
+        if len(row) > 0:
+            grid.append(row)
+    return grid
+
+
+def benchmark_parser(raw, repeat=5):
+    """
+    Time the list-of-lists parser against parse_ims_grid on the same bytes.
+
+    Returns dict with best-of-N seconds for each parser and the speedup.
+    """
+    def best_of(func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(raw)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    legacy = best_of(_parse_ims_grid_lines)
+    vectorized = best_of(parse_ims_grid)
+
+    # Both parsers must agree cell for cell
+    if not np.array_equal(np.array(_parse_ims_grid_lines(raw), dtype=np.uint8), parse_ims_grid(raw)):
+        print_safe("  Warning: Parser outputs differ")
+
+    return {
+        'legacy_s': legacy,
+        'numpy_s': vectorized,
+        'speedup': legacy / vectorized if vectorized > 0 else None
+    }
+
+
+# ============================================
+# IMS Archive Cache
+# ============================================
+
+def ims_offline():
+    """True when IMS_OFFLINE is set: serve only cached files, never download."""
+    return os.environ.get('IMS_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+
+def ims_filename(year, day_of_year, resolution='24km'):
+    """NSIDC file name for one day of IMS data."""
+    return f"ims{year}{day_of_year:03d}_00UTC_{resolution}_v1.3.asc.gz"
+
+
+def ims_archive_path(year, day_of_year, resolution='24km'):
+    """Location of a day's .asc.gz file in the local archive."""
+    return os.path.join(IMS_ARCHIVE_DIR, resolution, str(year),
+                        ims_filename(year, day_of_year, resolution))
+
+
+def verify_gzip_file(path, chunk_size=1 << 20):
+    """
+    Check a .gz file against its trailer (CRC32 and uncompressed size).
+
+    Decompresses in chunks so large 1km files are verified in bounded memory.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read(2) != b'\x1f\x8b':
+                return False
+            f.seek(-8, os.SEEK_END)
+            expected_crc, expected_size = struct.unpack('<II', f.read(8))
+            f.seek(0)
+
+            decomp = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            crc = 0
+            size = 0
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                data = decomp.decompress(chunk)
+                crc = zlib.crc32(data, crc)
+                size += len(data)
+                if decomp.eof:
+                    break
+            data = decomp.flush()
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+
+        return decomp.eof and crc == expected_crc and (size & 0xffffffff) == expected_size
+    except (OSError, zlib.error, struct.error):
+        return False
+
+
+def evict_ims_archive(max_bytes=None):
+    """
+    Delete least recently used archive files and decoded grids until their
+    combined size fits max_bytes.
+    """
+    if max_bytes is None:
+        max_bytes = IMS_ARCHIVE_MAX_BYTES
+
+    entries = []
+    for directory, suffix in ((IMS_ARCHIVE_DIR, '.asc.gz'), (IMS_GRIDS_DIR, '.u8')):
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(suffix):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+# host -> {'semaphore', 'min_interval', 'next_start'}
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+
+@contextmanager
+def host_slot(url):
+    """
+    Politeness limit for requests to one host, shared across threads.
+
+    At most IMS_HOST_MAX_CONCURRENT requests run at once per host, and
+    request starts are spaced at least IMS_HOST_MIN_INTERVAL seconds apart,
+    unless HOST_LIMITS sets other limits for the host.
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            max_concurrent, min_interval = HOST_LIMITS.get(host, (IMS_HOST_MAX_CONCURRENT, IMS_HOST_MIN_INTERVAL))
+            _host_limits[host] = {
+                'semaphore': threading.BoundedSemaphore(max_concurrent),
+                'min_interval': min_interval,
+                'next_start': 0.0
+            }
+        limit = _host_limits[host]
+
+    with limit['semaphore']:
+        with _host_limits_lock:
+            now = time.monotonic()
+            wait = limit['next_start'] - now
+            limit['next_start'] = max(now, limit['next_start']) + limit['min_interval']
+        if wait > 0:
+            time.sleep(wait)
+        yield
+
+
+def fetch_ims_archive(year, day_of_year, resolution='24km', timeout=60):
+    """
+    Return the local path of a day's IMS .asc.gz, downloading it if needed.
+
+    Cache hits are touched so eviction is least-recently-used. New downloads
+    go to a temp file, are verified against the gzip trailer, then moved into
+    place atomically. In offline mode (IMS_OFFLINE=1) only cached files are
+    returned.
 
     Returns:
-        2D list of grid values, or None if fetch failed
+        Path to the verified file, or None if unavailable
     """
-    # Format day of year with leading zeros
-    doy_str = f"{day_of_year:03d}"
+    path = ims_archive_path(year, day_of_year, resolution)
+    if os.path.exists(path):
+        os.utime(path)
+        return path
 
-    # Build URL
-    base_url = "https://noaadata.apps.nsidc.org/NOAA/G02156"
-    filename = f"ims{year}{doy_str}_00UTC_{resolution}_v1.3.asc.gz"
-    url = f"{base_url}/{resolution}/{year}/{filename}"
+    if ims_offline():
+        return None
+
+    url = f"{IMS_BASE_URL}/{resolution}/{year}/{ims_filename(year, day_of_year, resolution)}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
 
     try:
         # Create SSL context that doesn't verify (NSIDC sometimes has cert issues)
@@ -163,44 +651,95 @@ def fetch_ims_file(year, day_of_year, resolution='24km'):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Python Snow Cover Tool'
         })
 
-        with urllib.request.urlopen(req, timeout=60, context=ctx) as response:
-            compressed_data = response.read()
+        with host_slot(url), urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response, f)
 
-        # Decompress
-        decompressed = gzip.decompress(compressed_data)
-        content = decompressed.decode('ascii', errors='ignore')
+        if not verify_gzip_file(tmp_path):
+            print_safe(f"  Integrity check failed for {url}")
+            os.remove(tmp_path)
+            return None
 
-        # Parse ASCII grid
-        lines = content.strip().split('\n')
+        os.replace(tmp_path, path)
+        evict_ims_archive()
+        return path
+
+    except urllib.error.HTTPError as e:
+        if e.code != 404:  # 404 = data not available for this date
+            print_safe(f"  HTTP Error {e.code}: {url}")
+    except Exception as e:
+        print_safe(f"  Error fetching {url}: {e}")
+
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    return None
 
-        # Skip header lines (look for first line that's all digits)
-        data_start = 0
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped and all(c in '01234' for c in stripped):
-                data_start = i
-                break
 
-        # Parse grid data
-        grid = []
-        for line in lines[data_start:]:
-            row = [int(c) for c in line.strip() if c in '01234']
-            if len(row) > 0:
-                grid.append(row)
+def fetch_ims_file(year, day_of_year, resolution='24km'):
+    """
+    Fetch IMS ASCII data for a specific date.
 
-        # Verify dimensions
-        if len(grid) != IMS_NROWS:
-            print_safe(f"  Warning: Expected {IMS_NROWS} rows, got {len(grid)}")
+    Files come from the local archive when present (see fetch_ims_archive).
 
-        return grid
+    Args:
+        year: Year (e.g., 2025)
+        day_of_year: Day of year (1-366)
+        resolution: '24km', '4km', or '1km'
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None  # Data not available for this date
-        print_safe(f"  HTTP Error {e.code}: {url}")
+    Returns:
+        uint8 numpy array of shape (nrows, ncols), or None if fetch failed.
+        Grids larger than IMS_IN_MEMORY_MAX_CELLS (4km, 1km) are returned
+        as a read-only np.memmap backed by a file in IMS_CACHE_DIR/grids.
+    """
+    spec = get_grid_spec(resolution)
+    in_memory = spec['nrows'] * spec['ncols'] <= IMS_IN_MEMORY_MAX_CELLS
+
+    # Large grids are decoded once to disk; reuse an existing decode
+    grid_path = _decoded_grid_path(year, day_of_year, resolution)
+    if not in_memory and os.path.exists(grid_path) and \
+            os.path.getsize(grid_path) == spec['nrows'] * spec['ncols']:
+        os.utime(grid_path)
+        return np.memmap(grid_path, dtype=np.uint8, mode='r', shape=(spec['nrows'], spec['ncols']))
+
+    path = fetch_ims_archive(year, day_of_year, resolution)
+    if path is None:
         return None
+
+    return read_ims_archive_file(path, year, day_of_year, resolution)
+
+
+def _decoded_grid_path(year, day_of_year, resolution):
+    return os.path.join(IMS_GRIDS_DIR, f"ims{year}{day_of_year:03d}_{resolution}.u8")
+
+
+def read_ims_archive_file(path, year, day_of_year, resolution='24km'):
+    """
+    Parse a local IMS .asc.gz file (see fetch_ims_file for the return value).
+
+    A file that fails to decode is removed so the next fetch downloads it again.
+    """
+    spec = get_grid_spec(resolution)
+    in_memory = spec['nrows'] * spec['ncols'] <= IMS_IN_MEMORY_MAX_CELLS
+
+    try:
+        with open(path, 'rb') as f:
+            if not in_memory:
+                grid = stream_ims_grid_to_file(f, _decoded_grid_path(year, day_of_year, resolution),
+                                               resolution)
+                evict_ims_archive()
+                return grid
+            compressed_data = f.read()
+
+        # Decompress and parse straight into a uint8 array
+        return parse_ims_grid(gzip.decompress(compressed_data), spec['ncols'], spec['nrows'])
+
     except Exception as e:
-        print_safe(f"  Error fetching {url}: {e}")
+        # Corrupt cache entry: drop it so the next call downloads again
+        print_safe(f"  Error reading {path}: {e}")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
         return None
 
 
@@ -209,34 +748,37 @@ def calculate_snow_cover_percentage(grid, region_bounds=None):
     Calculate snow cover percentage from IMS grid.
 
     Args:
-        grid: 2D list of IMS values
+        grid: 2D numpy array (or list of lists) of IMS values
         region_bounds: Optional dict with 'min_lat', 'max_lat', 'min_lon', 'max_lon'
                       If None, calculates for entire grid
 
     Returns:
         Dict with 'cover' percentage, 'snow_cells', 'land_cells'
     """
-    if not grid:
+    if grid is None or len(grid) == 0:
         return None
 
-    snow_cells = 0
-    land_cells = 0  # Land includes snow-covered land
+    grid = np.asarray(grid, dtype=np.uint8)
+    resolution = resolution_for_grid(grid)
 
-    for row_idx, row in enumerate(grid):
-        for col_idx, val in enumerate(row):
-            # If region specified, check bounds
-            if region_bounds:
-                lat, lon = ims_grid_to_lat_lon(row_idx, col_idx)
-                if not (region_bounds['min_lat'] <= lat <= region_bounds['max_lat'] and
-                        region_bounds['min_lon'] <= lon <= region_bounds['max_lon']):
-                    continue
+    if grid.size > IMS_IN_MEMORY_MAX_CELLS:
+        counts = count_region_cells_blocked(grid, {'region': region_bounds}, resolution)
+        return _cover_stats(*counts['region'])
+
+    if region_bounds:
+        mask = get_region_mask(region_bounds, resolution)
+        if mask.shape != grid.shape:
+            mask = mask[:grid.shape[0], :grid.shape[1]]
+        grid = grid[mask]
 
-            if val == IMS_LAND:
-                land_cells += 1
-            elif val == IMS_SNOW:
-                snow_cells += 1
-                land_cells += 1  # Snow is on land
+    snow_cells = int(np.count_nonzero(grid == IMS_SNOW))
+    land_cells = int(np.count_nonzero(grid == IMS_LAND)) + snow_cells  # Snow is on land
 
+    return _cover_stats(snow_cells, land_cells)
+
+
+def _cover_stats(snow_cells, land_cells):
+    """Build the {'cover', 'snow_cells', 'land_cells'} dict used by all region stats."""
     if land_cells == 0:
         return {'cover': 0, 'snow_cells': 0, 'land_cells': 0}
 
@@ -248,6 +790,46 @@ def calculate_snow_cover_percentage(grid, region_bounds=None):
     }
 
 
+def count_region_cells_blocked(grid, regions, resolution):
+    """
+    Count snow and land cells per region, reading the grid in row blocks.
+
+    Used for 4km/1km grids (typically memory-mapped) where full-grid
+    projection tables and masks would not fit in memory. Only land and snow
+    cells of each block are projected.
+
+    Args:
+        grid: 2D array or np.memmap of IMS values
+        regions: Dict of name -> bounds dict (None bounds = whole grid)
+        resolution: IMS_GRIDS key
+
+    Returns:
+        Dict of name -> (snow_cells, land_cells)
+    """
+    totals = {name: [0, 0] for name in regions}
+
+    for start, stop in iter_row_blocks(grid.shape[0], grid.shape[1]):
+        block = np.asarray(grid[start:stop])
+        rows, cols = np.nonzero((block == IMS_LAND) | (block == IMS_SNOW))
+        if rows.size == 0:
+            continue
+
+        is_snow = block[rows, cols] == IMS_SNOW
+        lats, lons = cells_lat_lon(rows + start, cols, resolution)
+
+        for name, bounds in regions.items():
+            if bounds:
+                inside = ((lats >= bounds['min_lat']) & (lats <= bounds['max_lat']) &
+                          (lons >= bounds['min_lon']) & (lons <= bounds['max_lon']))
+                totals[name][0] += int(np.count_nonzero(inside & is_snow))
+                totals[name][1] += int(np.count_nonzero(inside))
+            else:
+                totals[name][0] += int(np.count_nonzero(is_snow))
+                totals[name][1] += int(rows.size)
+
+    return {name: tuple(counts) for name, counts in totals.items()}
+
+
 # Pre-defined region bounds for countries/regions
 REGION_BOUNDS = {
     'usa': {
@@ -325,6 +907,134 @@ REGION_BOUNDS = {
 }
 
 
+# ============================================
+# Multi-Region Aggregation
+# ============================================
+
+# (resolution, region names) -> (combo raster, membership matrix)
+_region_label_cache = {}
+
+# Map IMS values to aggregation classes: 0 = other, 1 = bare land, 2 = snow
+_CLASS_LOOKUP = np.zeros(256, dtype=np.intp)
+_CLASS_LOOKUP[IMS_LAND] = 1
+_CLASS_LOOKUP[IMS_SNOW] = 2
+_NUM_CLASSES = 3
+
+
+def build_region_label_layers(regions, resolution='24km'):
+    """
+    Pack region masks into a small stack of integer label rasters.
+
+    Regions that don't overlap share a layer (label i+1 for the i-th region
+    in that layer, 0 for none); overlapping regions such as usa and
+    rocky_mountain go into separate layers.
+
+    Returns:
+        (layers, assignments) where layers is a list of int arrays and
+        assignments maps region name -> (layer index, label)
+    """
+    masks = get_region_masks(resolution)
+    layers = []
+    occupied = []
+    assignments = {}
+
+    for name in regions:
+        mask = masks[name] if name in masks else build_region_mask(REGION_BOUNDS[name], resolution)
+        for idx, used in enumerate(occupied):
+            if not np.any(used & mask):
+                break
+        else:
+            idx = len(layers)
+            layers.append(np.zeros(mask.shape, dtype=np.int32))
+            occupied.append(np.zeros(mask.shape, dtype=bool))
+
+        label = int(layers[idx].max()) + 1
+        layers[idx][mask] = label
+        occupied[idx] |= mask
+        assignments[name] = (idx, label)
+
+    return layers, assignments
+
+
+def _get_region_labels(regions, resolution='24km'):
+    """
+    Collapse the label layer stack into one raster of layer combinations.
+
+    Every distinct tuple of labels across layers becomes one combo id, so a
+    single bincount over the grid covers all regions. The membership matrix
+    (combos x regions) maps combo counts back to each region.
+    """
+    key = (resolution, tuple(regions))
+    if key in _region_label_cache:
+        return _region_label_cache[key]
+
+    layers, assignments = build_region_label_layers(regions, resolution)
+
+    # Encode each cell's label tuple as one integer, then renumber densely
+    base = max(int(layer.max()) for layer in layers) + 1 if layers else 1
+    encoded = np.zeros(layers[0].shape if layers else (0,), dtype=np.int64)
+    for layer in reversed(layers):
+        encoded = encoded * base + layer
+    combos, combo_raster = np.unique(encoded.reshape(-1), return_inverse=True)
+
+    membership = np.zeros((len(combos), len(regions)), dtype=np.int64)
+    for col, name in enumerate(regions):
+        layer_idx, label = assignments[name]
+        membership[:, col] = (combos // base ** layer_idx) % base == label
+
+    result = (combo_raster.reshape(-1).astype(np.intp), membership)
+    _region_label_cache[key] = result
+    return result
+
+
+def compute_region_covers(grid, regions=None):
+    """
+    Calculate snow cover for many regions in a single pass over the grid.
+
+    Uses np.bincount over (combo label, class) pairs, where the combo label
+    encodes which regions each cell belongs to (see _get_region_labels).
+
+    4km/1km grids are reduced in row blocks instead (see
+    count_region_cells_blocked).
+
+    Args:
+        grid: 2D numpy array (or np.memmap) of IMS values
+        regions: List of REGION_BOUNDS names, or None for all
+
+    Returns:
+        Dict mapping region name to {'cover', 'snow_cells', 'land_cells'},
+        the same shape as calculate_snow_cover_percentage
+    """
+    if grid is None or len(grid) == 0:
+        return None
+
+    grid = np.asarray(grid, dtype=np.uint8)
+    if regions is None:
+        regions = list(REGION_BOUNDS.keys())
+    regions = [r for r in regions if r in REGION_BOUNDS]
+    resolution = resolution_for_grid(grid)
+
+    if grid.size > IMS_IN_MEMORY_MAX_CELLS:
+        counts = count_region_cells_blocked(grid, {r: REGION_BOUNDS[r] for r in regions}, resolution)
+        return {name: _cover_stats(*counts[name]) for name in regions}
+
+    combo_raster, membership = _get_region_labels(regions, resolution)
+    if combo_raster.size != grid.size:
+        # Truncated grid: fall back to per-region masks
+        return {r: calculate_snow_cover_percentage(grid, REGION_BOUNDS[r]) for r in regions}
+
+    classes = _CLASS_LOOKUP[grid.reshape(-1)]
+    counts = np.bincount(combo_raster * _NUM_CLASSES + classes,
+                         minlength=membership.shape[0] * _NUM_CLASSES)
+    counts = counts.reshape(-1, _NUM_CLASSES)
+
+    # (regions x classes) totals
+    region_counts = membership.T @ counts
+
+    return {name: _cover_stats(snow, bare + snow)
+            for name, (_, bare, snow) in zip(regions, region_counts.tolist())}
+
+
 def get_metro_snow_cover(grid, lat, lon, radius_km=50):
     """
     Get snow cover percentage around a metro area.
@@ -332,38 +1042,33 @@ def get_metro_snow_cover(grid, lat, lon, radius_km=50):
     Args:
         grid: IMS data grid
         lat, lon: Metro center coordinates
-        radius_km: Radius to check (default 50km = ~2 grid cells at 24km)
+        radius_km: Radius to check (default 50km = ~2 grid cells at 24km,
+                   50 cells at 1km)
 
     Returns:
         Snow cover percentage (0-100) or None if location outside grid
     """
-    if not grid:
+    if grid is None or len(grid) == 0:
         return None
 
-    center = lat_lon_to_ims_grid(lat, lon)
+    grid = np.asarray(grid, dtype=np.uint8)
+    resolution = resolution_for_grid(grid)
+
+    center = lat_lon_to_ims_grid(lat, lon, resolution)
     if not center:
         return None
 
     center_row, center_col = center
 
     # Calculate grid cell radius
-    cell_radius = max(1, int(radius_km / IMS_RESOLUTION_KM))
+    cell_radius = max(1, int(radius_km / get_grid_spec(resolution)['resolution_km']))
 
-    snow_cells = 0
-    land_cells = 0
+    # Square window around the center, clipped to the grid edges
+    window = grid[max(0, center_row - cell_radius):center_row + cell_radius + 1,
+                  max(0, center_col - cell_radius):center_col + cell_radius + 1]
 
-    for dr in range(-cell_radius, cell_radius + 1):
-        for dc in range(-cell_radius, cell_radius + 1):
-            row = center_row + dr
-            col = center_col + dc
-
-            if 0 <= row < len(grid) and 0 <= col < len(grid[row]):
-                val = grid[row][col]
-                if val == IMS_LAND:
-                    land_cells += 1
-                elif val == IMS_SNOW:
-                    snow_cells += 1
-                    land_cells += 1
+    snow_cells = int(np.count_nonzero(window == IMS_SNOW))
+    land_cells = int(np.count_nonzero(window == IMS_LAND)) + snow_cells
 
     if land_cells == 0:
         return 0
@@ -371,13 +1076,179 @@ def get_metro_snow_cover(grid, lat, lon, radius_km=50):
     return round(100 * snow_cells / land_cells, 1)
 
 
-def fetch_ims_for_date(date, regions=None):
+# ============================================
+# Metro Snow Cover (vectorized)
+# ============================================
+
+# (resolution, metro coordinates) -> metro index
+_metro_index_cache = {}
+
+
+def build_metro_index(metros, resolution='24km'):
+    """
+    Precompute the grid cell of every metro center.
+
+    Args:
+        metros: List of dicts with 'city', 'lat' and 'lon' (METRO_AREAS style;
+                'lng' is also accepted) or (name, lat, lon) tuples
+        resolution: IMS_GRIDS key
+
+    Returns:
+        Dict with 'names', and int arrays 'rows'/'cols' (-1 when the metro
+        falls outside the grid)
+    """
+    points = []
+    for metro in metros:
+        if isinstance(metro, dict):
+            points.append((metro.get('city'), metro.get('lat'), metro.get('lon', metro.get('lng'))))
+        else:
+            points.append(tuple(metro))
+
+    key = (resolution, tuple(points))
+    if key in _metro_index_cache:
+        return _metro_index_cache[key]
+
+    rows = np.full(len(points), -1, dtype=np.int64)
+    cols = np.full(len(points), -1, dtype=np.int64)
+    for i, (_, lat, lon) in enumerate(points):
+        if lat is None or lon is None:
+            continue
+        cell = lat_lon_to_ims_grid(lat, lon, resolution)
+        if cell:
+            rows[i], cols[i] = cell
+
+    index = {'names': [p[0] for p in points], 'rows': rows, 'cols': cols, 'resolution': resolution}
+    _metro_index_cache[key] = index
+    return index
+
+
+def compute_integral_images(grid):
+    """
+    Summed-area tables of snow and land cells (land includes snow).
+
+    Each table has a leading row/column of zeros, so the count over rows
+    r0..r1-1 and cols c0..c1-1 is T[r1,c1] - T[r0,c1] - T[r1,c0] + T[r0,c0].
+    """
+    grid = np.asarray(grid, dtype=np.uint8)
+    snow = grid == IMS_SNOW
+    land = snow | (grid == IMS_LAND)
+
+    tables = []
+    for mask in (snow, land):
+        table = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(mask, axis=0, dtype=np.int32), axis=1, out=table[1:, 1:])
+        tables.append(table)
+    return tables[0], tables[1]
+
+
+def _box_sums(table, rows, cols, radius):
+    """Sum of each (2r+1)^2 box around (rows, cols), clipped to the grid."""
+    nrows, ncols = table.shape[0] - 1, table.shape[1] - 1
+    r0 = np.clip(rows - radius, 0, nrows)
+    r1 = np.clip(rows + radius + 1, 0, nrows)
+    c0 = np.clip(cols - radius, 0, ncols)
+    c1 = np.clip(cols + radius + 1, 0, ncols)
+    return table[r1, c1] - table[r0, c1] - table[r1, c0] + table[r0, c0]
+
+
+def _disk_sums(row_prefix, rows, cols, radius):
+    """Sum over a disk of cell radius around (rows, cols), one row strip at a time."""
+    nrows, ncols = row_prefix.shape[0], row_prefix.shape[1] - 1
+    total = np.zeros(rows.shape, dtype=np.int64)
+    for dy in range(-radius, radius + 1):
+        half = int(math.isqrt(radius * radius - dy * dy))
+        r = rows + dy
+        inside = (r >= 0) & (r < nrows)
+        r = np.clip(r, 0, nrows - 1)
+        c0 = np.clip(cols - half, 0, ncols)
+        c1 = np.clip(cols + half + 1, 0, ncols)
+        total += np.where(inside, row_prefix[r, c1] - row_prefix[r, c0], 0)
+    return total
+
+
+def compute_metro_covers(grid, metro_index, radii_km=(50,), circular=False, integral_images=None):
+    """
+    Snow cover around every metro, for several radii, in one call.
+
+    Square windows (same as get_metro_snow_cover) are O(1) per metro via
+    summed-area tables. Circular windows sum one row strip per cell of
+    radius from per-row prefix sums. Both are vectorized over all metros.
+
+    Args:
+        grid: 2D numpy array of IMS values
+        metro_index: From build_metro_index (same resolution as grid)
+        radii_km: Sequence of radii in km
+        circular: Use a disk instead of a square window
+        integral_images: Optional (snow, land) tables from compute_integral_images,
+                         to reuse across calls on the same grid
+
+    Returns:
+        float array (n_metros, n_radii) of cover percentages, NaN for metros
+        outside the grid
+    """
+    grid = np.asarray(grid, dtype=np.uint8)
+    res_km = get_grid_spec(metro_index['resolution'])['resolution_km']
+    rows, cols = metro_index['rows'], metro_index['cols']
+    valid = rows >= 0
+    covers = np.full((len(rows), len(radii_km)), np.nan)
+    if not valid.any():
+        return covers
+
+    rows, cols = rows[valid], cols[valid]
+    radii = [max(1, int(r / res_km)) for r in radii_km]
+
+    if integral_images is None and grid.size <= IMS_IN_MEMORY_MAX_CELLS:
+        # Only the box around all metros (plus the largest radius) is needed,
+        # so build the tables on that crop instead of the whole hemisphere
+        pad = max(radii) + 1
+        r_lo, c_lo = max(0, int(rows.min()) - pad), max(0, int(cols.min()) - pad)
+        r_hi, c_hi = int(rows.max()) + pad + 1, int(cols.max()) + pad + 1
+        grid = grid[r_lo:r_hi, c_lo:c_hi]
+        rows, cols = rows - r_lo, cols - c_lo
+
+    if grid.size > IMS_IN_MEMORY_MAX_CELLS:
+        # Full-grid tables would not fit in memory; slice each window instead
+        snow_counts = np.zeros((len(rows), len(radii)), dtype=np.int64)
+        land_counts = np.zeros_like(snow_counts)
+        for j, radius in enumerate(radii):
+            for i, (row, col) in enumerate(zip(rows, cols)):
+                window = np.asarray(grid[max(0, row - radius):row + radius + 1,
+                                         max(0, col - radius):col + radius + 1])
+                if circular:
+                    dy, dx = np.ogrid[max(0, row - radius) - row:min(grid.shape[0], row + radius + 1) - row,
+                                      max(0, col - radius) - col:min(grid.shape[1], col + radius + 1) - col]
+                    window = window[dy * dy + dx * dx <= radius * radius]
+                snow_counts[i, j] = np.count_nonzero(window == IMS_SNOW)
+                land_counts[i, j] = np.count_nonzero((window == IMS_SNOW) | (window == IMS_LAND))
+    elif circular:
+        snow = grid == IMS_SNOW
+        land = snow | (grid == IMS_LAND)
+        prefixes = []
+        for mask in (snow, land):
+            prefix = np.zeros((grid.shape[0], grid.shape[1] + 1), dtype=np.int32)
+            np.cumsum(mask, axis=1, dtype=np.int32, out=prefix[:, 1:])
+            prefixes.append(prefix)
+        snow_counts = np.stack([_disk_sums(prefixes[0], rows, cols, r) for r in radii], axis=1)
+        land_counts = np.stack([_disk_sums(prefixes[1], rows, cols, r) for r in radii], axis=1)
+    else:
+        snow_table, land_table = integral_images or compute_integral_images(grid)
+        snow_counts = np.stack([_box_sums(snow_table, rows, cols, r) for r in radii], axis=1)
+        land_counts = np.stack([_box_sums(land_table, rows, cols, r) for r in radii], axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pct = np.where(land_counts > 0, 100 * snow_counts / np.maximum(land_counts, 1), 0.0)
+    covers[valid] = np.round(pct, 1)
+    return covers
+
+
+def fetch_ims_for_date(date, regions=None, resolution='24km'):
     """
     Fetch IMS data for a specific date and calculate snow cover for regions.
 
     Args:
         date: datetime object
         regions: List of region names to calculate, or None for all
+        resolution: '24km', '4km', or '1km'
 
     Returns:
         Dict with region snow cover percentages
@@ -385,8 +1256,8 @@ def fetch_ims_for_date(date, regions=None):
     year = date.year
     day_of_year = date.timetuple().tm_yday
 
-    grid = fetch_ims_file(year, day_of_year)
-    if not grid:
+    grid = fetch_ims_file(year, day_of_year, resolution)
+    if grid is None:
         return None
 
     if regions is None:
@@ -397,21 +1268,392 @@ def fetch_ims_for_date(date, regions=None):
         'regions': {}
     }
 
-    for region in regions:
-        if region in REGION_BOUNDS:
-            bounds = REGION_BOUNDS[region]
-            stats = calculate_snow_cover_percentage(grid, bounds)
-            if stats:
-                results['regions'][region] = stats['cover']
+    covers = compute_region_covers(grid, regions)
+    for region, stats in covers.items():
+        if stats:
+            results['regions'][region] = stats['cover']
 
     return results
 
 
+# ============================================
+# Backfill Pipeline (parallel fetch and reduce)
+# ============================================
+
+def _reduce_ims_day(task):
+    """
+    Process-pool worker: parse one archived day and reduce it.
+
+    Returns (date_str, covers, masks) where masks is (packed snow, packed
+    land) when requested, so grids never travel between processes. A
+    truncated grid gets masks None (its covers fall back as in
+    compute_region_covers).
+    """
+    date_str, path, resolution, regions, pack_masks = task
+    date = datetime.strptime(date_str, '%Y-%m-%d')
+    grid = read_ims_archive_file(path, date.year, date.timetuple().tm_yday, resolution)
+    if grid is None:
+        return date_str, None, None
+
+    # regions=[] (season cubes) wants masks only; skip the pass over the grid
+    covers = compute_region_covers(grid, regions) if regions != [] else {}
+    masks = None
+    spec = get_grid_spec(resolution)
+    if pack_masks and grid.shape != (spec['nrows'], spec['ncols']):
+        print_safe(f"  Warning: {date_str} grid is {grid.shape}, expected "
+                   f"{(spec['nrows'], spec['ncols'])}; not packing masks")
+    elif pack_masks:
+        snow = grid == IMS_SNOW
+        masks = (np.packbits(snow), np.packbits(snow | (grid == IMS_LAND)))
+    return date_str, covers, masks
+
+
+def iter_ims_days(dates, regions=None, resolution='24km', pack_masks=False,
+                  download_workers=None, process_workers=None):
+    """
+    Fetch and reduce many IMS days concurrently, yielding results as they finish.
+
+    Downloads run in a thread pool (bounded per host by host_slot); each
+    downloaded file is handed to a process pool that parses it and reduces
+    it to regional covers. Results arrive in completion order, not date order.
+
+    Args:
+        dates: Iterable of datetime objects
+        regions: REGION_BOUNDS names for compute_region_covers (None = all, [] = masks only)
+        resolution: '24km', '4km', or '1km'
+        pack_masks: Also return bit-packed snow/land masks (for season cubes)
+        download_workers: Download threads (default IMS_DOWNLOAD_WORKERS)
+        process_workers: Parse/reduce processes (default os.cpu_count())
+
+    Yields:
+        (date, covers, masks); covers is None when the day is unavailable
+    """
+    dates = list(dates)
+    if not dates:
+        return
+
+    with ThreadPoolExecutor(max_workers=download_workers or IMS_DOWNLOAD_WORKERS) as downloads, \
+            ProcessPoolExecutor(max_workers=process_workers) as reducers:
+        download_futures = {
+            downloads.submit(fetch_ims_archive, d.year, d.timetuple().tm_yday, resolution): d
+            for d in dates
+        }
+        reduce_futures = set()
+
+        def finished_reductions(block):
+            done = as_completed(reduce_futures) if block else [f for f in reduce_futures if f.done()]
+            for future in list(done):
+                reduce_futures.discard(future)
+                date_str, covers, masks = future.result()
+                yield datetime.strptime(date_str, '%Y-%m-%d'), covers, masks
+
+        for future in as_completed(download_futures):
+            date = download_futures[future]
+            path = future.result()
+            if path is None:
+                yield date, None, None
+            else:
+                task = (date.strftime('%Y-%m-%d'), path, resolution, regions, pack_masks)
+                reduce_futures.add(reducers.submit(_reduce_ims_day, task))
+
+            yield from finished_reductions(block=False)
+
+        yield from finished_reductions(block=True)
+
+
+# ============================================
+# Season Cube (bit-packed daily snow masks)
+# ============================================
+#
+# File layout (all offsets in bytes):
+#   0      magic b'IMSCUBE1'
+#   8      JSON metadata, space padded to CUBE_HEADER_SIZE
+#   4096   presence flags, one uint8 per day slot (1 = day written)
+#   8192   shared land mask, np.packbits of (land or snow), nrows*ncols/8
+#   after  one packed snow mask per day slot, in date order from 'start'
+#
+# Day slots are fixed size, so appending a day is a single positional
+# write and the whole snow block can be opened as a 2D np.memmap.
+
+CUBE_MAGIC = b'IMSCUBE1'
+CUBE_HEADER_SIZE = 4096
+CUBE_PRESENCE_SIZE = 4096
+CUBE_LAND_OFFSET = CUBE_HEADER_SIZE + CUBE_PRESENCE_SIZE
+
+# Popcount of every byte value, for counting set bits in packed masks
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def season_cube_path(season_start_year, resolution='24km'):
+    """Cube file for the winter starting in season_start_year (Oct 1 - Apr 30)."""
+    return os.path.join(IMS_CACHE_DIR, 'cubes',
+                        f"ims-{season_start_year}-{season_start_year + 1}-{resolution}.cube")
+
+
+def create_season_cube(path, start_date, num_days, resolution='24km'):
+    """
+    Create an empty cube with num_days daily slots beginning at start_date.
+
+    The file is allocated sparse at full size, so unwritten days take no disk.
+    """
+    spec = get_grid_spec(resolution)
+    mask_bytes = (spec['nrows'] * spec['ncols'] + 7) // 8
+    if num_days > CUBE_PRESENCE_SIZE:
+        raise ValueError(f"Cube holds at most {CUBE_PRESENCE_SIZE} days")
+
+    meta = {
+        'resolution': resolution,
+        'nrows': spec['nrows'],
+        'ncols': spec['ncols'],
+        'start': start_date.strftime('%Y-%m-%d'),
+        'num_days': num_days,
+        'mask_bytes': mask_bytes
+    }
+    header = CUBE_MAGIC + json.dumps(meta).encode('utf-8')
+    if len(header) > CUBE_HEADER_SIZE:
+        raise ValueError("Cube metadata too large")
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header.ljust(CUBE_HEADER_SIZE, b' '))
+        f.truncate(CUBE_LAND_OFFSET + mask_bytes * (num_days + 1))
+    os.replace(tmp_path, path)
+    return path
+
+
+def open_season_cube(path, mode='r'):
+    """
+    Open a cube file.
+
+    Args:
+        path: Cube file path
+        mode: 'r' for read-only, 'r+' to allow appending days
+
+    Returns:
+        Dict with 'path', 'meta', 'start' (datetime), 'present' (uint8 memmap
+        of day flags), 'land' (packed land mask memmap) and 'snow' (packed
+        (num_days, mask_bytes) memmap), or None if the file is missing/invalid
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'rb') as f:
+        header = f.read(CUBE_HEADER_SIZE)
+    if not header.startswith(CUBE_MAGIC):
+        print_safe(f"  Warning: {path} is not an IMS season cube")
+        return None
+    meta = json.loads(header[len(CUBE_MAGIC):].decode('utf-8').strip())
+
+    num_days = meta['num_days']
+    mask_bytes = meta['mask_bytes']
+    return {
+        'path': path,
+        'meta': meta,
+        'start': datetime.strptime(meta['start'], '%Y-%m-%d'),
+        'present': np.memmap(path, dtype=np.uint8, mode=mode,
+                             offset=CUBE_HEADER_SIZE, shape=(num_days,)),
+        'land': np.memmap(path, dtype=np.uint8, mode=mode,
+                          offset=CUBE_LAND_OFFSET, shape=(mask_bytes,)),
+        'snow': np.memmap(path, dtype=np.uint8, mode=mode,
+                          offset=CUBE_LAND_OFFSET + mask_bytes, shape=(num_days, mask_bytes)),
+    }
+
+
+def cube_day_index(cube, date):
+    """Slot index for a date, or None if outside the cube's range."""
+    idx = (datetime(date.year, date.month, date.day) - cube['start']).days
+    if 0 <= idx < cube['meta']['num_days']:
+        return idx
+    return None
+
+
+def cube_dates(cube):
+    """Dates of all written days, in order."""
+    return [cube['start'] + timedelta(days=int(i)) for i in np.flatnonzero(cube['present'])]
+
+
+def append_cube_day(cube, date, grid):
+    """
+    Store one day's snow mask in a cube opened with mode='r+'.
+
+    The shared land mask is widened to include this day's land cells.
+
+    Returns:
+        True if written, False if the date is outside the cube
+    """
+    grid = np.asarray(grid, dtype=np.uint8)
+    if grid.shape != (cube['meta']['nrows'], cube['meta']['ncols']):
+        raise ValueError(f"Grid shape {grid.shape} does not match cube")
+
+    snow = grid == IMS_SNOW
+    return append_cube_masks(cube, date, np.packbits(snow), np.packbits(snow | (grid == IMS_LAND)))
+
+
+def append_cube_masks(cube, date, snow_packed, land_packed):
+    """Like append_cube_day, for masks already packed with np.packbits."""
+    idx = cube_day_index(cube, date)
+    if idx is None:
+        return False
+
+    cube['snow'][idx] = snow_packed
+    merged = cube['land'] | land_packed
+    if not np.array_equal(merged, cube['land']):
+        cube['land'][:] = merged
+    cube['present'][idx] = 1
+
+    cube['snow'].flush()
+    cube['land'].flush()
+    cube['present'].flush()
+    return True
+
+
+def build_season_cube(season_start_year, resolution='24km', end_date=None):
+    """
+    Create or extend the cube for a winter (Oct 1 - Apr 30) from IMS files.
+
+    Days already in the cube are skipped, so this can be rerun to append
+    newly available days or to resume an interrupted build. Missing days
+    are fetched and packed in parallel (see iter_ims_days) and written to
+    the cube as each one completes.
+
+    Returns:
+        Cube dict opened read-only, or None if the cube could not be created
+    """
+    start = datetime(season_start_year, 10, 1)
+    end = datetime(season_start_year + 1, 4, 30)
+    if end_date is not None:
+        end = min(end, datetime(end_date.year, end_date.month, end_date.day))
+
+    path = season_cube_path(season_start_year, resolution)
+    if not os.path.exists(path):
+        create_season_cube(path, start, (datetime(season_start_year + 1, 4, 30) - start).days + 1,
+                           resolution)
+
+    cube = open_season_cube(path, mode='r+')
+    if cube is None:
+        return None
+
+    # Days already in the cube are the resume point for an interrupted build
+    missing = []
+    date = start
+    while date <= end:
+        idx = cube_day_index(cube, date)
+        if idx is not None and not cube['present'][idx]:
+            missing.append(date)
+        date += timedelta(days=1)
+
+    added = 0
+    completed = 0
+    start_time = time.time()
+    for date, covers, masks in iter_ims_days(missing, regions=[], resolution=resolution, pack_masks=True):
+        # Written as each day completes, so progress survives a crash; a bad
+        # day is skipped (left missing) rather than ending the build
+        try:
+            if masks is not None and append_cube_masks(cube, date, *masks):
+                added += 1
+        except (ValueError, OSError) as e:
+            print_safe(f"  Skipping {date.strftime('%Y-%m-%d')}: {e}")
+
+        completed += 1
+        if completed % 50 == 0:
+            elapsed = time.time() - start_time
+            rate = completed / elapsed if elapsed > 0 else 0
+            remaining = (len(missing) - completed) / rate if rate > 0 else 0
+            print_safe(f"  Progress: {completed}/{len(missing)} days - ETA: {remaining:.0f}s")
+
+    if added:
+        print_safe(f"  Season cube {season_start_year}/{season_start_year + 1}: added {added} days")
+
+    return open_season_cube(path)
+
+
+def cube_region_covers(cube, regions=None):
+    """
+    Regional snow cover for every day in a cube, without unpacking the grids.
+
+    Each region's land cells are packed once; per-day snow counts are then a
+    popcount of (day mask AND region land) over all days at once. Land counts
+    come from the shared land mask.
+
+    Returns:
+        Dict mapping 'YYYY-MM-DD' -> {region: {'cover', 'snow_cells', 'land_cells'}}
+    """
+    if regions is None:
+        regions = list(REGION_BOUNDS.keys())
+    regions = [r for r in regions if r in REGION_BOUNDS]
+
+    resolution = cube['meta']['resolution']
+    days = np.flatnonzero(cube['present'])
+    land = np.unpackbits(cube['land'])[:cube['meta']['nrows'] * cube['meta']['ncols']]
+    land = land.reshape(cube['meta']['nrows'], cube['meta']['ncols']).astype(bool)
+
+    date_strs = [(cube['start'] + timedelta(days=int(i))).strftime('%Y-%m-%d') for i in days]
+    results = {date_str: {} for date_str in date_strs}
+
+    # (days, mask_bytes) block of packed snow masks, ~128KB per day at 24km
+    snow = np.asarray(cube['snow'][days])
+
+    for name in regions:
+        region_land = get_region_mask(REGION_BOUNDS[name], resolution) & land
+        land_cells = int(np.count_nonzero(region_land))
+        packed = np.packbits(region_land)
+
+        snow_counts = _POPCOUNT[snow & packed].sum(axis=1, dtype=np.int64)
+        for date_str, snow_cells in zip(date_strs, snow_counts.tolist()):
+            results[date_str][name] = _cover_stats(snow_cells, land_cells)
+
+    return results
+
+
+def cube_cell_history(cube, row, col):
+    """
+    Snow/no-snow history of one grid cell across the cube.
+
+    Returns:
+        Dict mapping 'YYYY-MM-DD' -> True/False for every written day
+    """
+    flat = row * cube['meta']['ncols'] + col
+    byte_idx, bit = divmod(flat, 8)
+    column = cube['snow'][:, byte_idx]
+    days = np.flatnonzero(cube['present'])
+    return {
+        (cube['start'] + timedelta(days=int(i))).strftime('%Y-%m-%d'): bool((column[i] >> (7 - bit)) & 1)
+        for i in days
+    }
+
+
+def cube_snow_frequency(cube):
+    """Fraction of written days with snow, per cell (float32 nrows x ncols)."""
+    nrows, ncols = cube['meta']['nrows'], cube['meta']['ncols']
+    days = np.flatnonzero(cube['present'])
+    counts = np.zeros(nrows * ncols, dtype=np.uint16)
+    for i in days:
+        counts += np.unpackbits(cube['snow'][i])[:nrows * ncols]
+    if len(days) == 0:
+        return counts.reshape(nrows, ncols).astype(np.float32)
+    return (counts / len(days)).astype(np.float32).reshape(nrows, ncols)
+
+
 def main():
     """Test IMS data fetching"""
     print_safe("IMS Snow Data Fetcher")
     print_safe("=" * 50)
 
+    # --benchmark FILE.asc.gz: compare parser speed on a local IMS file
+    if '--benchmark' in sys.argv:
+        idx = sys.argv.index('--benchmark')
+        if idx + 1 >= len(sys.argv):
+            print_safe("Usage: python fetch_ims_snow_data.py --benchmark FILE.asc.gz")
+            return 1
+        with open(sys.argv[idx + 1], 'rb') as f:
+            raw = gzip.decompress(f.read())
+        timings = benchmark_parser(raw)
+        print_safe(f"List-of-lists parser: {timings['legacy_s'] * 1000:.1f} ms")
+        print_safe(f"NumPy parser:         {timings['numpy_s'] * 1000:.1f} ms")
+        print_safe(f"Speedup:              {timings['speedup']:.0f}x")
+        return 0
+
     # Test with today's date
     today = datetime.now()
     yesterday = today - timedelta(days=1)
@@ -426,16 +1668,15 @@ def main():
 
     grid = fetch_ims_file(year, doy)
 
-    if grid:
-        print_safe(f"Grid loaded: {len(grid)} rows x {len(grid[0])} cols")
+    if grid is not None:
+        print_safe(f"Grid loaded: {grid.shape[0]} rows x {grid.shape[1]} cols")
 
         # Calculate for key regions
         print_safe("\nSnow cover by region:")
-        for region_name, bounds in REGION_BOUNDS.items():
-            if region_name in ['usa', 'canada', 'british_columbia', 'ontario', 'quebec']:
-                stats = calculate_snow_cover_percentage(grid, bounds)
-                if stats:
-                    print_safe(f"  {region_name}: {stats['cover']}% ({stats['snow_cells']:,} snow / {stats['land_cells']:,} land cells)")
+        covers = compute_region_covers(grid, ['usa', 'canada', 'british_columbia', 'ontario', 'quebec'])
+        for region_name, stats in covers.items():
+            if stats:
+                print_safe(f"  {region_name}: {stats['cover']}% ({stats['snow_cells']:,} snow / {stats['land_cells']:,} land cells)")
 
         # Test metro lookup
         print_safe("\nMetro snow cover:")
@@ -447,9 +1688,10 @@ def main():
             ('Montreal', 45.5017, -73.5673),
             ('Chicago', 41.8781, -87.6298),
         ]
-        for name, lat, lon in metros:
-            cover = get_metro_snow_cover(grid, lat, lon)
-            print_safe(f"  {name}: {cover}%")
+        metro_index = build_metro_index(metros, resolution_for_grid(grid))
+        covers = compute_metro_covers(grid, metro_index, radii_km=(25, 50, 100))
+        for name, (r25, r50, r100) in zip(metro_index['names'], covers.tolist()):
+            print_safe(f"  {name}: {r50}% (25km: {r25}%, 100km: {r100}%)")
     else:
         print_safe("Failed to fetch IMS data")
 
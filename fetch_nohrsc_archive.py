@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fetch daily NOHRSC National Snow Analysis (NSA) values with a local cache.
+
+The NSA archive page for a past date (/nsa/index.html?year=&month=&day=)
+never changes, so the parsed snow cover and average depth are stored per
+date in a small SQLite table and served from there on later runs. Every
+script that reads NOHRSC history (update_snow_cover.py,
+backfill_current_season.py, fetch_historical_averages.py) goes through
+fetch_nohrsc_day.
+
+Each row records how it was produced:
+  ok            Cover parsed (depth may still be None)
+  parse_failed  Page fetched but no cover found; kept so the date is not
+                refetched on every run, until NSA_PARSER_VERSION changes
+Network failures are never cached. Dates newer than NOHRSC_FINAL_DAYS are
+fetched every time, since NOHRSC may still revise them.
+
+backfill_nohrsc_days fetches long date ranges on a small worker pool,
+checkpointing collected dates under .cache/nohrsc/checkpoints so an
+interrupted backfill resumes where it stopped, and reports progress
+(throughput, ETA) as dicts to a callback.
+
+Environment variables:
+  NOHRSC_CACHE_DIR   Cache location (default: .cache/nohrsc next to this file)
+  NOHRSC_OFFLINE=1   Use cached values only, never fetch
+
+Usage:
+    python fetch_nohrsc_archive.py --stats
+    python fetch_nohrsc_archive.py --date YYYY-MM-DD [--refresh]
+    python fetch_nohrsc_archive.py --refresh-range START END
+    python fetch_nohrsc_archive.py --refresh-failures
+"""
+
+import os
+import sys
+import re
+import json
+import time
+import sqlite3
+import threading
+import urllib.request
+import urllib.error
+import ssl
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from fetch_ims_snow_data import host_slot, HOST_LIMITS
+
+
+# ============================================
+# Configuration
+# ============================================
+
+NOHRSC_NSA_URL = "https://www.nohrsc.noaa.gov/nsa/index.html?year={year}&month={month}&day={day}"
+
+NOHRSC_CACHE_DIR = os.environ.get(
+    'NOHRSC_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'nohrsc')
+)
+NOHRSC_CACHE_PATH = os.path.join(NOHRSC_CACHE_DIR, 'nsa-days.sqlite3')
+
+# Dates at least this many days old are treated as final and cached
+NOHRSC_FINAL_DAYS = 2
+
+# Bump when parse_nsa_page changes so cached parse failures are retried
+NSA_PARSER_VERSION = 1
+
+HOST_LIMITS.setdefault('www.nohrsc.noaa.gov', (4, 0.1))
+
+# Backfill runs (backfill_nohrsc_days): worker pool size, dates between
+# checkpoints, and where per-job checkpoints are kept
+NOHRSC_BACKFILL_WORKERS = 4
+NOHRSC_CHECKPOINT_EVERY = 25
+NOHRSC_CHECKPOINT_DIR = os.path.join(NOHRSC_CACHE_DIR, 'checkpoints')
+NOHRSC_CHECKPOINT_VERSION = 1
+
+# Cache connection (shared across threads, guarded by _cache_lock) and counters
+_cache_lock = threading.Lock()
+_cache_conn = None
+CACHE_STATS = {'hits': 0, 'fetched': 0, 'parse_failed': 0, 'fetch_failed': 0}
+
+
+def print_safe(msg):
+    """Print with fallback for encoding errors"""
+    try:
+        print(msg, flush=True)
+    except UnicodeEncodeError:
+        print(msg.encode('ascii', 'replace').decode('ascii'), flush=True)
+
+
+# ============================================
+# Fetching and Parsing
+# ============================================
+
+def fetch_url(url, timeout=15):
+    """Fetch page text, or None on any error"""
+    try:
+        req = urllib.request.Request(url, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) NixVir Snow Dashboard/1.0'
+        })
+
+        # Create SSL context that doesn't verify (some gov sites have cert issues)
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+
+        with host_slot(url), urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
+            return response.read().decode('utf-8', errors='replace')
+    except urllib.error.HTTPError as e:
+        print_safe(f"  ! HTTP {e.code} fetching {url}")
+        return None
+    except Exception as e:
+        print_safe(f"  ! Error fetching {url}: {e}")
+        return None
+
+
+def parse_nsa_page(content):
+    """
+    Parse snow cover and average depth from an NSA page.
+
+    Returns:
+        Dict with 'cover' (percent) and 'depth_inches', either may be None
+    """
+    result = {'cover': None, 'depth_inches': None}
+
+    # Look for "Area Covered By Snow" pattern
+    match = re.search(
+        r'Area\s+Covered\s+By\s+Snow[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*%',
+        content, re.IGNORECASE
+    )
+    if match:
+        result['cover'] = float(match.group(1))
+    else:
+        # Fallback pattern
+        match = re.search(
+            r'Area\s+Covered[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*%',
+            content, re.IGNORECASE
+        )
+        if match:
+            result['cover'] = float(match.group(1))
+
+    # Look for average depth - format varies:
+    # Current page: "Average Snow Depth:</td><td...>X.X in</td>"
+    # Historical: "Snow Depth</th>...<tr><td>Average:</td><td>X.X in</td>"
+    depth_match = re.search(
+        r'(?:Average\s+)?Snow\s+Depth[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*in',
+        content, re.IGNORECASE
+    )
+    if depth_match:
+        result['depth_inches'] = float(depth_match.group(1))
+    else:
+        # Look for "Snow Depth" header followed by "Average:" row
+        depth_section = re.search(
+            r'Snow\s+Depth.*?Average[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*in',
+            content, re.IGNORECASE | re.DOTALL
+        )
+        if depth_section:
+            depth = float(depth_section.group(1))
+            if 0 < depth < 50:  # Reasonable average depth range
+                result['depth_inches'] = depth
+        else:
+            # Fallback depth pattern
+            depth_fallback = re.search(
+                r'Snow\s+Depth[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*in',
+                content, re.IGNORECASE
+            )
+            if depth_fallback:
+                depth = float(depth_fallback.group(1))
+                if 0 < depth < 50:  # Reasonable average depth range
+                    result['depth_inches'] = depth
+
+    return result
+
+
+# ============================================
+# SQLite Cache
+# ============================================
+
+def _count(name):
+    with _cache_lock:
+        CACHE_STATS[name] += 1
+
+
+def _cache():
+    """Open (once) the cache database; call with _cache_lock held"""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(NOHRSC_CACHE_DIR, exist_ok=True)
+        _cache_conn = sqlite3.connect(NOHRSC_CACHE_PATH, check_same_thread=False)
+        _cache_conn.execute("""
+            CREATE TABLE IF NOT EXISTS nsa_days (
+                date TEXT PRIMARY KEY,
+                cover REAL,
+                depth_inches REAL,
+                status TEXT NOT NULL,
+                parser_version INTEGER NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        _cache_conn.commit()
+    return _cache_conn
+
+
+def get_cached_day(date_str):
+    """
+    Cached row for a date.
+
+    Returns:
+        Dict with 'cover', 'depth_inches', 'status', 'parser_version',
+        'fetched_at', or None if the date is not cached
+    """
+    with _cache_lock:
+        row = _cache().execute(
+            "SELECT cover, depth_inches, status, parser_version, fetched_at FROM nsa_days WHERE date = ?",
+            (date_str,)
+        ).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('cover', 'depth_inches', 'status', 'parser_version', 'fetched_at'), row))
+
+
+def store_day(date_str, parsed):
+    """Record a parsed page (cover None is stored as a parse failure)"""
+    status = 'ok' if parsed['cover'] is not None else 'parse_failed'
+    with _cache_lock:
+        conn = _cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO nsa_days VALUES (?, ?, ?, ?, ?, ?)",
+            (date_str, parsed['cover'], parsed['depth_inches'], status,
+             NSA_PARSER_VERSION, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        )
+        conn.commit()
+
+
+def nohrsc_offline():
+    """True when NOHRSC_OFFLINE is set: serve only cached values, never fetch."""
+    return os.environ.get('NOHRSC_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+
+def is_final(date_obj, today=None):
+    """Whether NOHRSC data for a date is old enough to cache"""
+    today = today or datetime.now()
+    return (today.date() - date_obj.date()).days >= NOHRSC_FINAL_DAYS
+
+
+def fetch_nohrsc_day(year, month, day, refresh=False):
+    """
+    NOHRSC snow cover and average depth for a date, from the cache when
+    possible.
+
+    Args:
+        year, month, day: Date to fetch
+        refresh: Refetch even if the date is cached
+
+    Returns:
+        Dict with 'cover' and 'depth_inches', or None if not available
+    """
+    date_obj = datetime(year, month, day)
+    date_str = date_obj.strftime('%Y-%m-%d')
+    final = is_final(date_obj)
+
+    if final and not refresh:
+        cached = get_cached_day(date_str)
+        if cached is not None and (cached['status'] == 'ok' or cached['parser_version'] == NSA_PARSER_VERSION):
+            _count('hits')
+            if cached['status'] != 'ok':
+                return None
+            return {'cover': cached['cover'], 'depth_inches': cached['depth_inches']}
+
+    if nohrsc_offline():
+        return None
+
+    content = fetch_url(NOHRSC_NSA_URL.format(year=year, month=month, day=day), timeout=15)
+    if not content:
+        _count('fetch_failed')
+        return None
+
+    parsed = parse_nsa_page(content)
+    _count('fetched')
+    if parsed['cover'] is None:
+        _count('parse_failed')
+    if final:
+        store_day(date_str, parsed)
+
+    if parsed['cover'] is not None:
+        return parsed
+    return None
+
+
+def cache_summary():
+    """Row counts by status and the cached date range"""
+    with _cache_lock:
+        conn = _cache()
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM nsa_days GROUP BY status").fetchall())
+        first, last = conn.execute("SELECT MIN(date), MAX(date) FROM nsa_days").fetchone()
+    return {'counts': counts, 'first': first, 'last': last}
+
+
+def cached_failures():
+    """Dates recorded as parse failures"""
+    with _cache_lock:
+        rows = _cache().execute("SELECT date FROM nsa_days WHERE status != 'ok' ORDER BY date").fetchall()
+    return [row[0] for row in rows]
+
+
+# ============================================
+# Backfill Runner
+# ============================================
+
+def load_checkpoint(path):
+    """Collected values from a checkpoint file ({date_str: {'cover', 'depth_inches'}})"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if checkpoint.get('version') != NOHRSC_CHECKPOINT_VERSION:
+        return {}
+    return checkpoint.get('results', {})
+
+
+def save_checkpoint(path, results):
+    """Write collected values atomically"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': NOHRSC_CHECKPOINT_VERSION, 'results': results}, f)
+    os.replace(tmp_path, path)
+
+
+def make_progress_reporter(jsonl_path=None):
+    """
+    Progress callback for backfill_nohrsc_days: prints a one-line summary
+    and, if jsonl_path is given, appends each progress dict as a JSON line.
+    """
+    def report(progress):
+        eta = f"{progress['eta_s']:.0f}s" if progress['eta_s'] is not None else '?'
+        print_safe(f"  Progress: {progress['done']}/{progress['total']} "
+                   f"({100 * progress['done'] // max(progress['total'], 1)}%) - "
+                   f"{progress['rate_per_s']:.1f} days/s - ETA: {eta}")
+        if jsonl_path:
+            with open(jsonl_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(progress) + '\n')
+    return report
+
+
+def backfill_nohrsc_days(dates, job, workers=NOHRSC_BACKFILL_WORKERS,
+                         batch_size=NOHRSC_CHECKPOINT_EVERY, progress=None):
+    """
+    Fetch NOHRSC values for many dates on a bounded worker pool.
+
+    Collected values are written to a per-job checkpoint after every
+    batch_size completed dates (and when the run is interrupted), so a
+    restarted job only fetches dates it has not collected yet. Like the
+    SQLite cache, the checkpoint only keeps final dates (see is_final);
+    recent days are always refetched. The checkpoint is removed once every
+    date has a value.
+
+    Args:
+        dates: List of 'YYYY-MM-DD' strings
+        job: Checkpoint name (file NOHRSC_CHECKPOINT_DIR/<job>.json)
+        workers: Concurrent fetches (host_slot still limits NOHRSC load)
+        batch_size: Completed dates between checkpoints and progress reports
+        progress: Optional callback(dict) with job, total, done, resumed,
+            collected, missing, elapsed_s, rate_per_s (days fetched per
+            second this run), eta_s and cache_hits
+
+    Returns:
+        {date_str: {'cover', 'depth_inches'} or None} for every date
+    """
+    checkpoint_path = os.path.join(NOHRSC_CHECKPOINT_DIR, f'{job}.json')
+    def final(date_str):
+        return is_final(datetime.strptime(date_str, '%Y-%m-%d'))
+
+    wanted = set(dates)
+    collected = {date_str: value for date_str, value in load_checkpoint(checkpoint_path).items()
+                 if date_str in wanted and final(date_str)}
+    todo = [date_str for date_str in dates if date_str not in collected]
+    if collected:
+        print_safe(f"  Resuming {job}: {len(collected)} dates from checkpoint, {len(todo)} to fetch")
+
+    results = dict(collected)
+    missing = 0
+    start_time = time.time()
+    hits_before = CACHE_STATS['hits']
+
+    def snapshot(fetched):
+        elapsed = time.time() - start_time
+        rate = fetched / elapsed if elapsed > 0 else 0.0
+        return {
+            'job': job,
+            'total': len(dates),
+            'done': len(collected) + fetched,
+            'resumed': len(collected),
+            'collected': len(results) - missing,
+            'missing': missing,
+            'elapsed_s': round(elapsed, 1),
+            'rate_per_s': round(rate, 2),
+            'eta_s': round((len(todo) - fetched) / rate, 1) if rate > 0 else None,
+            'cache_hits': CACHE_STATS['hits'] - hits_before,
+        }
+
+    def fetch(date_str):
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        return fetch_nohrsc_day(date_obj.year, date_obj.month, date_obj.day)
+
+    def checkpoint():
+        save_checkpoint(checkpoint_path, {d: v for d, v in results.items() if v is not None and final(d)})
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(fetch, date_str): date_str for date_str in todo}
+        fetched = 0
+        for future in as_completed(futures):
+            value = future.result()
+            results[futures[future]] = value
+            if value is None:
+                missing += 1
+            fetched += 1
+            if fetched % batch_size == 0 or fetched == len(todo):
+                checkpoint()
+                if progress:
+                    progress(snapshot(fetched))
+    except BaseException:
+        # Keep what was collected (e.g. on Ctrl-C) so a restart resumes here
+        executor.shutdown(wait=False, cancel_futures=True)
+        checkpoint()
+        raise
+    executor.shutdown()
+
+    if missing == 0 and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    return {date_str: results.get(date_str) for date_str in dates}
+
+
+# ============================================
+# Main
+# ============================================
+
+def refresh_dates(dates):
+    """Refetch dates ('YYYY-MM-DD') and report the new values"""
+    for date_str in dates:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        data = fetch_nohrsc_day(date_obj.year, date_obj.month, date_obj.day, refresh=True)
+        if data:
+            print_safe(f"  {date_str}: {data['cover']}%, depth: {data['depth_inches']}")
+        else:
+            print_safe(f"  {date_str}: not available")
+
+
+def main():
+    """Main entry point"""
+    if '--stats' in sys.argv:
+        summary = cache_summary()
+        print_safe(f"Cache: {NOHRSC_CACHE_PATH}")
+        print_safe(f"Dates: {summary['first']} to {summary['last']}")
+        for status, count in sorted(summary['counts'].items()):
+            print_safe(f"  {status}: {count}")
+        return 0
+
+    if '--refresh-failures' in sys.argv:
+        failures = cached_failures()
+        print_safe(f"Refetching {len(failures)} dates recorded as parse failures...")
+        refresh_dates(failures)
+        return 0
+
+    if '--refresh-range' in sys.argv:
+        i = sys.argv.index('--refresh-range')
+        start = datetime.strptime(sys.argv[i + 1], '%Y-%m-%d')
+        end = datetime.strptime(sys.argv[i + 2], '%Y-%m-%d')
+        dates = [(start + timedelta(days=n)).strftime('%Y-%m-%d') for n in range((end - start).days + 1)]
+        print_safe(f"Refetching {len(dates)} dates...")
+        refresh_dates(dates)
+        return 0
+
+    if '--date' in sys.argv:
+        date_str = sys.argv[sys.argv.index('--date') + 1]
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        data = fetch_nohrsc_day(date_obj.year, date_obj.month, date_obj.day,
+                                refresh='--refresh' in sys.argv)
+        print_safe(f"{date_str}: {data}")
+        return 0 if data else 1
+
+    print_safe(__doc__)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,15 +16,20 @@ Requires: matplotlib, cartopy, numpy, pillow
 Install: pip install matplotlib cartopy numpy pillow
 
 Output: static/images/snow-globe.png
+
+Season animation (daily snow change from the local IMS season cube):
+    python generate_snow_globe.py --animate [--season YYYY] [--format gif|webp|mp4]
+        [--fps N] [--workers N] [--output PATH]
+MP4 output requires ffmpeg on PATH.
 """
 
 import os
 import sys
 import json
-import math
-import gzip
-import urllib.request
-import ssl
+import time
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from io import BytesIO
 
@@ -35,8 +40,17 @@ try:
     matplotlib.use('Agg')  # Non-interactive backend for server use
     import matplotlib.pyplot as plt
     from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+    from matplotlib.collections import QuadMesh
     import cartopy.crs as ccrs
     import cartopy.feature as cfeature
+    # Shared fetcher reads from the local IMS archive cache before downloading
+    from fetch_ims_snow_data import (
+        fetch_ims_file,
+        calculate_snow_cover_percentage,
+        get_grid_lat_lon,
+        resolution_for_grid,
+        build_season_cube
+    )
     HAS_VISUALIZATION = True
 except ImportError as e:
     print(f"Warning: Missing visualization libraries: {e}")
@@ -44,17 +58,6 @@ except ImportError as e:
     HAS_VISUALIZATION = False
 
 
-# IMS Grid constants (24km resolution)
-IMS_NCOLS = 1024
-IMS_NROWS = 1024
-IMS_RESOLUTION_KM = 24
-
-# Polar stereographic projection parameters
-IMS_CENTER_LAT = 90.0
-IMS_CENTER_LON = -80.0
-IMS_STANDARD_PARALLEL = 60.0
-IMS_EARTH_RADIUS_KM = 6371.228
-
 # Grid cell values
 IMS_OUTSIDE = 0
 IMS_SEA = 1
@@ -68,77 +71,6 @@ def print_safe(msg):
     print(msg, flush=True)
 
 
-def ims_grid_to_lat_lon(row, col):
-    """Convert IMS grid coordinates to latitude/longitude."""
-    x = (col - IMS_NCOLS / 2) * IMS_RESOLUTION_KM
-    y = (row - IMS_NROWS / 2) * IMS_RESOLUTION_KM
-
-    center_lon_rad = math.radians(IMS_CENTER_LON)
-    std_parallel_rad = math.radians(IMS_STANDARD_PARALLEL)
-    k0 = (1 + math.sin(std_parallel_rad)) / 2
-
-    rho = math.sqrt(x*x + y*y)
-    if rho == 0:
-        return (90.0, 0.0)
-
-    c = 2 * math.atan(rho / (2 * IMS_EARTH_RADIUS_KM * k0))
-    lat = math.asin(math.cos(c))
-    lon = center_lon_rad + math.atan2(x, -y)
-
-    return (math.degrees(lat), math.degrees(lon))
-
-
-def fetch_ims_file(year, day_of_year, resolution='24km'):
-    """Fetch IMS ASCII data for a specific date."""
-    doy_str = f"{day_of_year:03d}"
-    base_url = "https://noaadata.apps.nsidc.org/NOAA/G02156"
-    filename = f"ims{year}{doy_str}_00UTC_{resolution}_v1.3.asc.gz"
-    url = f"{base_url}/{resolution}/{year}/{filename}"
-
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) NixVir Snow Globe Generator'
-        })
-
-        with urllib.request.urlopen(req, timeout=120, context=ctx) as response:
-            compressed_data = response.read()
-
-        decompressed = gzip.decompress(compressed_data)
-        content = decompressed.decode('ascii', errors='ignore')
-
-        lines = content.strip().split('\n')
-
-        # Skip header lines
-        data_start = 0
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped and all(c in '01234' for c in stripped):
-                data_start = i
-                break
-
-        # Parse grid data
-        grid = []
-        for line in lines[data_start:]:
-            row = [int(c) for c in line.strip() if c in '01234']
-            if len(row) > 0:
-                grid.append(row)
-
-        return grid
-
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None
-        print_safe(f"  HTTP Error {e.code}: {url}")
-        return None
-    except Exception as e:
-        print_safe(f"  Error fetching {url}: {e}")
-        return None
-
-
 def get_ims_grid_for_date(target_date):
     """Fetch IMS grid for a specific date, trying multiple days if needed."""
     for days_offset in range(5):  # Try target date and up to 4 days back
@@ -149,7 +81,7 @@ def get_ims_grid_for_date(target_date):
         print_safe(f"  Trying {check_date.strftime('%Y-%m-%d')} (DOY {doy})...")
         grid = fetch_ims_file(year, doy)
 
-        if grid:
+        if grid is not None:
             print_safe(f"  Got data for {check_date.strftime('%Y-%m-%d')}")
             return grid, check_date
 
@@ -166,66 +98,86 @@ def compute_difference_grid(current_grid, prior_grid):
     +1: Snow gained (wasn't there, now is) - BLUE
      2: Snow both years - WHITE
     """
-    if not current_grid or not prior_grid:
+    if current_grid is None or prior_grid is None:
         return None
 
-    rows = min(len(current_grid), len(prior_grid))
-    cols = min(len(current_grid[0]), len(prior_grid[0]))
-
-    diff = np.zeros((rows, cols), dtype=np.int8)
-
-    for r in range(rows):
-        for c in range(cols):
-            curr_val = current_grid[r][c] if c < len(current_grid[r]) else 0
-            prior_val = prior_grid[r][c] if c < len(prior_grid[r]) else 0
-
-            curr_snow = curr_val == IMS_SNOW
-            prior_snow = prior_val == IMS_SNOW
-            curr_land = curr_val in [IMS_LAND, IMS_SNOW]
-            prior_land = prior_val in [IMS_LAND, IMS_SNOW]
-
-            # Only consider land areas
-            if not (curr_land or prior_land):
-                diff[r, c] = -99  # Not land
-            elif curr_snow and prior_snow:
-                diff[r, c] = 2  # Snow both years
-            elif curr_snow and not prior_snow:
-                diff[r, c] = 1  # Snow gained
-            elif not curr_snow and prior_snow:
-                diff[r, c] = -1  # Snow lost
-            else:
-                diff[r, c] = 0  # No snow either year
+    rows = min(current_grid.shape[0], prior_grid.shape[0])
+    cols = min(current_grid.shape[1], prior_grid.shape[1])
+    current = np.asarray(current_grid)[:rows, :cols]
+    prior = np.asarray(prior_grid)[:rows, :cols]
+
+    curr_snow = current == IMS_SNOW
+    prior_snow = prior == IMS_SNOW
+    any_land = curr_snow | prior_snow | (current == IMS_LAND) | (prior == IMS_LAND)
+
+    # Only consider land areas; first matching condition wins
+    diff = np.select(
+        [~any_land, curr_snow & prior_snow, curr_snow, prior_snow],
+        [-99, 2, 1, -1],
+        default=0  # No snow either year
+    ).astype(np.int8)
 
     return diff
 
 
-def generate_globe_image(diff_grid, output_path, current_date, prior_date, snow_stats):
+# North America window used for the globe layer
+NA_BOUNDS = {'min_lat': 20, 'max_lat': 75, 'min_lon': -170, 'max_lon': -50}
+
+
+def crop_to_bounds(lats, lons, bounds):
     """
-    Generate a clean globe visualization - just the map with a simple legend.
-    Stats are displayed via HTML overlay, not baked into the image.
-    Image is square for clean display in widget.
+    Row/column slices of the smallest grid rectangle covering a lat/lon box.
+
+    Returns (row_slice, col_slice, mask) where mask is the in-box test for the
+    cropped cells.
     """
-    if not HAS_VISUALIZATION:
-        print_safe("Cannot generate image - missing visualization libraries")
-        return False
+    mask = ((lats >= bounds['min_lat']) & (lats <= bounds['max_lat']) &
+            (lons >= bounds['min_lon']) & (lons <= bounds['max_lon']))
+    row_idx = np.flatnonzero(mask.any(axis=1))
+    col_idx = np.flatnonzero(mask.any(axis=0))
+    if row_idx.size == 0:
+        return slice(0, 0), slice(0, 0), mask[:0, :0]
+    rows = slice(row_idx[0], row_idx[-1] + 1)
+    cols = slice(col_idx[0], col_idx[-1] + 1)
+    return rows, cols, mask[rows, cols]
+
+
+def prepare_globe_grid(diff_grid):
+    """
+    Crop a difference grid to North America and mask non-land cells.
 
-    print_safe("Generating globe visualization...")
+    Lat/lon come from the cached projection tables, and only the grid
+    rectangle covering NA_BOUNDS is kept, so just that part is meshed.
 
-    # Build lat/lon arrays from IMS grid
+    Returns:
+        (lats, lons, masked_diff, crop) where crop is (row_slice, col_slice, na_mask)
+        for cropping further grids the same way
+    """
     rows, cols = diff_grid.shape
-    lats = np.zeros((rows, cols))
-    lons = np.zeros((rows, cols))
+    lats, lons = get_grid_lat_lon(resolution_for_grid(diff_grid))
+    lats, lons = lats[:rows, :cols], lons[:rows, :cols]
+    row_slice, col_slice, na_mask = crop_to_bounds(lats, lons, NA_BOUNDS)
+    lats, lons = lats[row_slice, col_slice], lons[row_slice, col_slice]
+
+    crop = (row_slice, col_slice, na_mask)
+    return lats, lons, mask_globe_diff(diff_grid, crop), crop
 
-    print_safe("  Converting grid coordinates to lat/lon...")
-    for r in range(rows):
-        for c in range(cols):
-            lat, lon = ims_grid_to_lat_lon(r, c)
-            lats[r, c] = lat
-            lons[r, c] = lon
 
-    # Filter to North America region
-    na_mask = (lats >= 20) & (lats <= 75) & (lons >= -170) & (lons <= -50)
+def mask_globe_diff(diff_grid, crop):
+    """Crop a difference grid and mask out non-land and non-NA cells."""
+    row_slice, col_slice, na_mask = crop
+    diff_grid = diff_grid[row_slice, col_slice]
+    return np.ma.masked_where((diff_grid == -99) | ~na_mask, diff_grid)
 
+
+def build_globe_figure(lats, lons, masked_diff, legend_items=None):
+    """
+    Build the globe figure: base map, snow difference mesh and legend.
+
+    Returns:
+        (fig, mesh) - the mesh's data can be swapped with set_array to draw
+        other days on the same map
+    """
     # Create square figure - globe fills most of it
     fig = plt.figure(figsize=(6, 6), facecolor='#0f1a2e')
 
@@ -265,17 +217,8 @@ def generate_globe_image(diff_grid, output_path, current_date, prior_date, snow_
     # Create discrete colormap
     cmap = ListedColormap(colors_list)
 
-    # Plot the difference data
-    print_safe("  Rendering snow difference layer...")
-
-    # Mask out non-land and non-NA areas
-    masked_diff = np.ma.masked_where(
-        (diff_grid == -99) | ~na_mask,
-        diff_grid
-    )
-
     # Plot using pcolormesh
-    ax.pcolormesh(
+    mesh = ax.pcolormesh(
         lons, lats, masked_diff,
         cmap=cmap,
         vmin=-1.5, vmax=2.5,
@@ -290,11 +233,12 @@ def generate_globe_image(diff_grid, output_path, current_date, prior_date, snow_
 
     # === SIMPLE LEGEND AT BOTTOM - Large colored squares with short labels ===
     legend_y = 0.04
-    legend_items = [
-        ('#4090f0', 'More'),
-        ('#f8f8ff', 'Same'),
-        ('#f05050', 'Less'),
-    ]
+    if legend_items is None:
+        legend_items = [
+            ('#4090f0', 'More'),
+            ('#f8f8ff', 'Same'),
+            ('#f05050', 'Less'),
+        ]
 
     # Center the legend horizontally
     total_legend_width = 0.7
@@ -311,11 +255,44 @@ def generate_globe_image(diff_grid, output_path, current_date, prior_date, snow_
         fig.text(x_pos + 0.07, legend_y + 0.01, label, ha='left', va='center',
                  fontsize=16, color='white', fontweight='bold', fontfamily='sans-serif')
 
+    return fig, mesh
+
+
+def generate_globe_image(diff_grid, output_path, current_date, prior_date, snow_stats, timings=None):
+    """
+    Generate a clean globe visualization - just the map with a simple legend.
+    Stats are displayed via HTML overlay, not baked into the image.
+    Image is square for clean display in widget.
+
+    If a timings dict is passed, seconds spent in each rendering stage are
+    added to it.
+    """
+    if timings is None:
+        timings = {}
+    if not HAS_VISUALIZATION:
+        print_safe("Cannot generate image - missing visualization libraries")
+        return False
+
+    print_safe("Generating globe visualization...")
+
+    stage_start = time.perf_counter()
+    lats, lons, masked_diff, _ = prepare_globe_grid(diff_grid)
+    print_safe(f"  Cropped grid to {masked_diff.shape[0]}x{masked_diff.shape[1]} North America cells")
+    timings['projection'] = time.perf_counter() - stage_start
+
+    # Plot the difference data
+    print_safe("  Rendering snow difference layer...")
+    stage_start = time.perf_counter()
+    build_globe_figure(lats, lons, masked_diff)
+    timings['figure'] = time.perf_counter() - stage_start
+
     # Save at high DPI for crisp rendering at small sizes
+    stage_start = time.perf_counter()
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     plt.savefig(output_path, dpi=200, facecolor='#0f1a2e',
                 edgecolor='none', bbox_inches='tight', pad_inches=0.02)
     plt.close()
+    timings['save_png'] = time.perf_counter() - stage_start
 
     print_safe(f"  Saved globe image to {output_path}")
     return True
@@ -337,27 +314,11 @@ def calculate_stats_from_grids(current_grid, prior_grid):
     }
 
     def calc_cover(grid, bounds):
-        """Calculate snow cover for a region."""
-        snow_cells = 0
-        land_cells = 0
-
-        for r, row in enumerate(grid):
-            for c, val in enumerate(row):
-                lat, lon = ims_grid_to_lat_lon(r, c)
-
-                if not (bounds['min_lat'] <= lat <= bounds['max_lat'] and
-                        bounds['min_lon'] <= lon <= bounds['max_lon']):
-                    continue
-
-                if val == IMS_LAND:
-                    land_cells += 1
-                elif val == IMS_SNOW:
-                    snow_cells += 1
-                    land_cells += 1
-
-        if land_cells == 0:
+        """Calculate snow cover for a region using the cached region masks."""
+        stats = calculate_snow_cover_percentage(grid, bounds)
+        if not stats or stats['land_cells'] == 0:
             return None
-        return round(100 * snow_cells / land_cells, 1)
+        return stats['cover']
 
     usa_cover = calc_cover(current_grid, usa_bounds)
     canada_cover = calc_cover(current_grid, canada_bounds)
@@ -373,8 +334,8 @@ def calculate_stats_from_grids(current_grid, prior_grid):
         combined = usa_cover or canada_cover
 
     # Calculate prior year stats for comparison
-    usa_prior = calc_cover(prior_grid, usa_bounds) if prior_grid else None
-    canada_prior = calc_cover(prior_grid, canada_bounds) if prior_grid else None
+    usa_prior = calc_cover(prior_grid, usa_bounds) if prior_grid is not None else None
+    canada_prior = calc_cover(prior_grid, canada_bounds) if prior_grid is not None else None
 
     # Calculate combined prior (weighted by land area, same as combined_cover)
     combined_prior = None
@@ -411,6 +372,299 @@ def save_globe_metadata(output_path, current_date, prior_date, snow_stats):
     print_safe(f"  Saved metadata to {json_path}")
 
 
+# ============================================
+# Season Animation
+# ============================================
+# Frames are daily snow change (vs the previous available day) read from the
+# season cube, so no IMS files are parsed while rendering. Each worker
+# process builds the map once and records which mesh cell lands on each
+# pixel; a frame is then a color lookup per pixel plus the date label and
+# overlays, blitted over the cached background.
+
+ANIMATION_FORMATS = ('gif', 'webp', 'mp4')
+ANIMATION_DPI = 100
+ANIMATION_FPS = 8
+
+_frame_state = {}
+
+
+def get_argv_value(flag, default=None):
+    """Value following a command-line flag, or default if absent."""
+    if flag in sys.argv:
+        idx = sys.argv.index(flag)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
+
+def cube_day_grid(cube, idx, land):
+    """Rebuild an IMS-style grid (snow/land/sea) for one cube day."""
+    nrows, ncols = cube['meta']['nrows'], cube['meta']['ncols']
+    snow = np.unpackbits(cube['snow'][idx])[:nrows * ncols].reshape(nrows, ncols).astype(bool)
+    return np.where(snow, IMS_SNOW, np.where(land, IMS_LAND, IMS_SEA)).astype(np.uint8)
+
+
+def build_season_frames(cube, crop):
+    """
+    Cropped day-over-day difference grids for every day in a cube.
+
+    Args:
+        cube: Season cube dict (see fetch_ims_snow_data.open_season_cube)
+        crop: (row_slice, col_slice, na_mask) from prepare_globe_grid
+
+    Returns:
+        List of (date_str, int8 difference grid) with non-land/non-NA cells -99
+    """
+    row_slice, col_slice, na_mask = crop
+    nrows, ncols = cube['meta']['nrows'], cube['meta']['ncols']
+    land = np.unpackbits(cube['land'])[:nrows * ncols].reshape(nrows, ncols).astype(bool)
+
+    frames = []
+    prior_grid = None
+    for idx in np.flatnonzero(cube['present']):
+        grid = cube_day_grid(cube, idx, land)
+        if prior_grid is not None:
+            diff = compute_difference_grid(grid, prior_grid)[row_slice, col_slice]
+            diff = np.where(na_mask, diff, -99).astype(np.int8)
+            date_str = (cube['start'] + timedelta(days=int(idx))).strftime('%Y-%m-%d')
+            frames.append((date_str, diff))
+        prior_grid = grid
+
+    return frames
+
+
+def _mesh_cell_index(fig, mesh):
+    """
+    Map each canvas pixel to the mesh cell drawn there.
+
+    The mesh is drawn alone with every cell in a unique opaque color, so the
+    rasterization done by pcolormesh is captured once and frames can then be
+    colored per pixel without redrawing 100k+ quads.
+
+    Returns:
+        int32 (height, width) array of flat cell indexes, -1 where no cell is drawn
+    """
+    ax = mesh.axes
+    hidden = [a for a in fig.findobj() if a not in (fig, ax, mesh) and a.get_visible()]
+    for artist in hidden:
+        artist.set_visible(False)
+
+    ids = np.arange(1, mesh.get_array().size + 1)
+    # Drop the data so the facecolors are drawn as given (cartopy's
+    # GeoQuadMesh.set_array does not accept None)
+    QuadMesh.set_array(mesh, None)
+    mesh.set_facecolor(np.stack([(ids >> 16) & 255, (ids >> 8) & 255, ids & 255,
+                                 np.full_like(ids, 255)], axis=1) / 255.0)
+    mesh.set_alpha(1.0)
+    mesh.set_antialiased(False)
+    fig.canvas.draw()
+
+    pixels = np.asarray(fig.canvas.buffer_rgba()).astype(np.int32)
+    index = ((pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]) - 1
+    index[pixels[..., 3] != 255] = -1
+
+    for artist in hidden:
+        artist.set_visible(True)
+    return index
+
+
+def _init_frame_worker(lats, lons, shape, frames_dir, dpi):
+    """Build the globe figure once per worker process and cache its background."""
+    fig, mesh = build_globe_figure(lats, lons, np.ma.masked_all(shape, dtype=np.int8))
+    fig.set_dpi(dpi)
+    label = fig.text(0.04, 0.95, '', ha='left', va='center', fontsize=14,
+                     color='white', fontweight='bold', fontfamily='sans-serif')
+
+    # RGBA for difference values -1, 0, 1, 2 and masked, as the mesh draws them
+    lut = mesh.to_rgba(np.ma.masked_invalid([-1.0, 0.0, 1.0, 2.0, np.nan]),
+                       alpha=mesh.get_alpha(), bytes=True).astype(np.uint16)
+    cell_index = _mesh_cell_index(fig, mesh).ravel()
+    pixels = np.flatnonzero(cell_index >= 0)
+
+    # Frames are blended into the canvas buffer in the mesh's place
+    mesh.set_visible(False)
+
+    # Artists drawn above the mesh must be redrawn after it on every frame
+    ax = mesh.axes
+    overlays = [a for a in ax.get_children()
+                if a.get_visible() and a.get_zorder() > mesh.get_zorder()]
+    for artist in [label] + overlays:
+        artist.set_animated(True)
+
+    fig.canvas.draw()
+    _frame_state.update({
+        'fig': fig,
+        'ax': ax,
+        'label': label,
+        'overlays': overlays,
+        'lut': lut,
+        'pixels': pixels,
+        'pixel_cells': cell_index[pixels],
+        'background': fig.canvas.copy_from_bbox(fig.bbox),
+        'frames_dir': frames_dir,
+    })
+
+
+def _render_frame(task):
+    """
+    Render one animation frame into the worker's figure and write it as PNG.
+
+    Args:
+        task: (frame index, date_str, cropped difference grid)
+
+    Returns:
+        (frame path, seconds drawing, seconds encoding)
+    """
+    from PIL import Image
+
+    index, date_str, diff = task
+    state = _frame_state
+    fig = state['fig']
+
+    draw_start = time.perf_counter()
+    fig.canvas.restore_region(state['background'])
+
+    # Blend each mesh pixel's cell color over the background, as Agg would
+    # when drawing the mesh (LUT slot 0-3 for -1..2, 4 for masked)
+    codes = np.where(diff == -99, 4, diff + 1).ravel()[state['pixel_cells']]
+    rgba = state['lut'][codes]
+    alpha = rgba[:, 3:]
+    canvas = np.asarray(fig.canvas.buffer_rgba()).reshape(-1, 4)
+    base = canvas[state['pixels'], :3].astype(np.uint16)
+    canvas[state['pixels'], :3] = (rgba[:, :3] * alpha + base * (255 - alpha) + 127) // 255
+
+    state['label'].set_text(date_str)
+    for artist in state['overlays']:
+        state['ax'].draw_artist(artist)
+    fig.draw_artist(state['label'])
+    pixels = fig.canvas.buffer_rgba()
+    draw_seconds = time.perf_counter() - draw_start
+
+    encode_start = time.perf_counter()
+    path = os.path.join(state['frames_dir'], f"frame-{index:04d}.png")
+    Image.frombuffer('RGBA', fig.canvas.get_width_height(), pixels, 'raw', 'RGBA', 0, 1).save(path)
+    return path, draw_seconds, time.perf_counter() - encode_start
+
+
+def assemble_animation(frame_paths, output_path, fmt, fps):
+    """
+    Combine frame PNGs into an animated GIF/WebP (Pillow) or MP4 (ffmpeg).
+
+    Returns:
+        True on success, False otherwise
+    """
+    import subprocess
+    from PIL import Image
+
+    duration = int(1000 / fps)
+    if fmt in ('gif', 'webp'):
+        images = [Image.open(p).convert('RGB') for p in frame_paths]
+        if fmt == 'gif':
+            images = [im.quantize(colors=64) for im in images]
+        images[0].save(output_path, save_all=True, append_images=images[1:],
+                       duration=duration, loop=0)
+        return True
+
+    ffmpeg = shutil.which('ffmpeg')
+    if not ffmpeg:
+        print_safe("  ffmpeg not found - cannot write MP4")
+        return False
+    pattern = os.path.join(os.path.dirname(frame_paths[0]), 'frame-%04d.png')
+    result = subprocess.run(
+        [ffmpeg, '-y', '-loglevel', 'error', '-framerate', str(fps), '-i', pattern,
+         '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', output_path],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print_safe(f"  ffmpeg failed: {result.stderr.strip()}")
+        return False
+    return True
+
+
+def generate_season_animation(season_start_year, output_path, fmt='gif', fps=ANIMATION_FPS,
+                              workers=None, dpi=ANIMATION_DPI, timings=None):
+    """
+    Render a season time-lapse of daily snow cover change.
+
+    Days come from the season cube (built/extended from the local IMS
+    archive as needed; set IMS_OFFLINE=1 to use only cached files).
+
+    Returns:
+        True on success, False otherwise
+    """
+    if timings is None:
+        timings = {}
+    if fmt not in ANIMATION_FORMATS:
+        print_safe(f"Unknown animation format: {fmt} (expected one of {', '.join(ANIMATION_FORMATS)})")
+        return False
+
+    stage_start = time.perf_counter()
+    cube = build_season_cube(season_start_year, end_date=datetime.now())
+    timings['season_cube'] = time.perf_counter() - stage_start
+    if cube is None or int(np.count_nonzero(cube['present'])) < 2:
+        print_safe("ERROR: Need at least two days of IMS data for an animation")
+        return False
+
+    stage_start = time.perf_counter()
+    shape = (cube['meta']['nrows'], cube['meta']['ncols'])
+    lats, lons, _, crop = prepare_globe_grid(np.zeros(shape, dtype=np.int8))
+    frames = build_season_frames(cube, crop)
+    timings['frames'] = time.perf_counter() - stage_start
+    print_safe(f"  {len(frames)} frames, {frames[0][0]} to {frames[-1][0]}")
+
+    frames_dir = tempfile.mkdtemp(prefix='snow-globe-frames-')
+    try:
+        stage_start = time.perf_counter()
+        tasks = [(i, date_str, diff) for i, (date_str, diff) in enumerate(frames)]
+        workers = workers or min(os.cpu_count() or 1, 8)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_frame_worker,
+                                 initargs=(lats, lons, lats.shape, frames_dir, dpi)) as pool:
+            results = list(pool.map(_render_frame, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+        timings['render'] = time.perf_counter() - stage_start
+
+        draw_avg = sum(r[1] for r in results) / len(results)
+        encode_avg = sum(r[2] for r in results) / len(results)
+        print_safe(f"  Rendered with {workers} workers - per frame: draw {draw_avg * 1000:.0f}ms, "
+                   f"PNG encode {encode_avg * 1000:.0f}ms")
+
+        stage_start = time.perf_counter()
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        success = assemble_animation([r[0] for r in results], output_path, fmt, fps)
+        timings['assemble'] = time.perf_counter() - stage_start
+    finally:
+        shutil.rmtree(frames_dir, ignore_errors=True)
+
+    if success:
+        print_safe(f"  Saved season animation to {output_path}")
+    return success
+
+
+def animate_main():
+    """
+    Entry point for --animate [--season YYYY] [--format gif|webp|mp4]
+    [--fps N] [--workers N] [--output PATH].
+    """
+    today = datetime.now()
+    default_season = today.year if today.month >= 10 else today.year - 1
+    season = int(get_argv_value('--season', default_season))
+    fmt = get_argv_value('--format', 'gif').lower()
+    fps = int(get_argv_value('--fps', ANIMATION_FPS))
+    workers = int(get_argv_value('--workers', 0)) or None
+    output_path = get_argv_value('--output', f'static/images/snow-globe-season.{fmt}')
+
+    print_safe(f"\nRendering {season}/{season + 1} season animation...")
+    timings = {}
+    if not generate_season_animation(season, output_path, fmt, fps, workers, timings=timings):
+        print_safe("ERROR: Failed to generate season animation")
+        return 1
+
+    print_safe("\nTiming by stage:")
+    for stage, seconds in timings.items():
+        print_safe(f"  {stage:<14} {seconds:7.2f}s")
+    print_safe(f"  {'total':<14} {sum(timings.values()):7.2f}s")
+    return 0
+
+
 def main():
     """Main entry point."""
     print_safe("=" * 60)
@@ -422,6 +676,9 @@ def main():
         print_safe("Install with: pip install matplotlib cartopy numpy")
         return 1
 
+    if '--animate' in sys.argv:
+        return animate_main()
+
     # Determine dates
     today = datetime.now()
     prior_year_date = today.replace(year=today.year - 1)
@@ -429,25 +686,36 @@ def main():
     print_safe(f"\nCurrent date target: {today.strftime('%Y-%m-%d')}")
     print_safe(f"Prior year target: {prior_year_date.strftime('%Y-%m-%d')}")
 
+    # Seconds per stage, reported at the end
+    timings = {}
+    stage_start = time.perf_counter()
+
     # Fetch current data
     print_safe("\nFetching current snow cover data...")
     current_grid, current_actual_date = get_ims_grid_for_date(today)
 
-    if not current_grid:
+    if current_grid is None:
         print_safe("ERROR: Could not fetch current IMS data")
         return 1
 
+    timings['fetch_current'] = time.perf_counter() - stage_start
+    stage_start = time.perf_counter()
+
     # Fetch prior year data
     print_safe("\nFetching prior year snow cover data...")
     prior_grid, prior_actual_date = get_ims_grid_for_date(prior_year_date)
 
-    if not prior_grid:
+    if prior_grid is None:
         print_safe("ERROR: Could not fetch prior year IMS data")
         return 1
 
+    timings['fetch_prior'] = time.perf_counter() - stage_start
+
     # Compute difference
     print_safe("\nComputing snow cover difference...")
+    stage_start = time.perf_counter()
     diff_grid = compute_difference_grid(current_grid, prior_grid)
+    timings['difference'] = time.perf_counter() - stage_start
 
     if diff_grid is None:
         print_safe("ERROR: Could not compute difference grid")
@@ -455,7 +723,9 @@ def main():
 
     # Calculate statistics
     print_safe("\nCalculating statistics...")
+    stage_start = time.perf_counter()
     snow_stats = calculate_stats_from_grids(current_grid, prior_grid)
+    timings['statistics'] = time.perf_counter() - stage_start
     print_safe(f"  USA: {snow_stats['usa_cover']}% (vs {snow_stats['usa_prior']}% last year)")
     print_safe(f"  Canada: {snow_stats['canada_cover']}% (vs {snow_stats['canada_prior']}% last year)")
     print_safe(f"  Combined: {snow_stats['combined_cover']}%")
@@ -467,7 +737,8 @@ def main():
         output_path,
         current_actual_date,
         prior_actual_date,
-        snow_stats
+        snow_stats,
+        timings
     )
 
     if not success:
@@ -477,6 +748,11 @@ def main():
     # Save metadata
     save_globe_metadata(output_path, current_actual_date, prior_actual_date, snow_stats)
 
+    print_safe("\nTiming by stage:")
+    for stage, seconds in timings.items():
+        print_safe(f"  {stage:<14} {seconds:7.2f}s")
+    print_safe(f"  {'total':<14} {sum(timings.values()):7.2f}s")
+
     print_safe("\n" + "=" * 60)
     print_safe("SUCCESS - Globe visualization generated")
     print_safe("=" * 60)
@@ -0,0 +1,132 @@
+"""
+Combined penalty/boost pattern sets (apply_contextual_penalties,
+analytical_boost) against the per-pattern re.search versions they replaced.
+
+Run directly to time both on the committed review queue and feed:
+
+    python tests/benchmarks/test_pattern_parity.py [repeat]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+import update_ski_news as news  # noqa: E402
+
+PATTERN_SETS = [news.PROMOTIONAL_RE, news.PROMOTIONAL_EXCEPTIONS_RE, news.CONSUMER_CONTENT_RE,
+                news.CONSUMER_CONTENT_EXCEPTIONS_RE, news.ANALYTICAL_CONTENT_RE]
+
+
+def apply_contextual_penalties_search(text, title):
+    """Per-pattern re.search version of apply_contextual_penalties (the reference)."""
+    penalty = 0
+    text_lower = text.lower()
+    title_lower = title.lower()
+    combined_text = f"{title_lower} {text_lower}"
+
+    for pattern, points in news.PROMOTIONAL_PATTERNS:
+        if re.search(pattern, title_lower, re.IGNORECASE):
+            is_exception = any(
+                re.search(exc, text_lower, re.IGNORECASE)
+                for exc in news.PROMOTIONAL_EXCEPTIONS
+            )
+            if not is_exception:
+                penalty += points
+                continue
+
+        if re.search(pattern, text_lower, re.IGNORECASE):
+            is_exception = any(
+                re.search(exc, text_lower, re.IGNORECASE)
+                for exc in news.PROMOTIONAL_EXCEPTIONS
+            )
+            if not is_exception:
+                penalty += points // 2
+
+    for pattern, points in news.CONSUMER_CONTENT_PATTERNS:
+        if re.search(pattern, combined_text, re.IGNORECASE):
+            has_business_context = any(
+                re.search(exc, combined_text, re.IGNORECASE)
+                for exc in news.CONSUMER_CONTENT_EXCEPTIONS
+            )
+            if not has_business_context:
+                if re.search(pattern, title_lower, re.IGNORECASE):
+                    penalty += points
+                else:
+                    penalty += points // 2
+
+    return penalty
+
+
+def analytical_boost_search(title, text):
+    """Per-pattern re.search version of analytical_boost (the reference)."""
+    boost_total = 0
+    for pattern, boost in news.ANALYTICAL_CONTENT_PATTERNS:
+        if re.search(pattern, title, re.IGNORECASE):
+            boost_total += boost * 1.5
+        elif re.search(pattern, text, re.IGNORECASE):
+            boost_total += boost
+    return boost_total
+
+
+def combined(text, title):
+    return (news.apply_contextual_penalties(text, title),
+            news.analytical_boost(news.article_pattern_hits(text, title)))
+
+
+def search(text, title):
+    return apply_contextual_penalties_search(text, title), analytical_boost_search(title, text)
+
+
+def load_fields():
+    """(text, title) pairs for the review queue and published feed, as rescore_article builds them."""
+    articles = []
+    for name, keys in (('ski-news-review.json', ('pending', 'rejected')), ('ski-news.json', ('articles',))):
+        path = os.path.join(REPO_ROOT, 'static', 'data', name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key in keys:
+                articles.extend(data.get(key, []))
+    return [(f"{a.get('title', '')} {a.get('description', '')} {a.get('content', '')}".lower(),
+             a.get('title', '').lower()) for a in articles]
+
+
+def run(func, fields, repeat):
+    """Results and best time over repeat passes, memo caches cleared before each pass."""
+    best = None
+    for _ in range(repeat):
+        for pattern_set in PATTERN_SETS:
+            pattern_set['cache'].clear()
+        start = time.perf_counter()
+        results = [func(text, title) for text, title in fields]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def test_pattern_parity():
+    fields = load_fields()
+    if not fields:
+        pytest.skip('static/data news files not present')
+    new, _ = run(combined, fields, 1)
+    old, _ = run(search, fields, 1)
+    assert new == old
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    fields = load_fields()
+    new, new_time = run(combined, fields, repeat)
+    old, old_time = run(search, fields, repeat)
+    mismatches = sum(1 for n, o in zip(new, old) if n != o)
+    print(f"contextual penalties + analytical boost: {len(fields)} articles, "
+          f"{'match' if not mismatches else f'{mismatches} MISMATCHES'} "
+          f"(combined {new_time:.3f}s, re.search {old_time:.3f}s, best of {repeat})")
+    sys.exit(1 if mismatches else 0)
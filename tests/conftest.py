@@ -0,0 +1,162 @@
+"""
+Shared fixtures: repo root on sys.path, and a local stub of the Anthropic
+messages / Message Batches API for the LLM scoring tests.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def article_number(prompt):
+    """The N in a test article titled 'Article N'."""
+    return int(re.search(r'Title: Article (\d+)', prompt).group(1))
+
+
+def score_text(n):
+    """Response text the stub returns for article N."""
+    return json.dumps({'score': n % 10 + 1, 'category': 'resort-operations', 'reason': f'article {n}'})
+
+
+class StubState:
+    """What the stub was asked and how it should answer; handlers update it under lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.message_requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = lambda n: 0.0
+        self.fail_429_once = set()   # article numbers answered 429 on their first request
+        self.seen_429 = set()
+        self.batches = {}
+        self.polls_until_ended = 1   # None: the batch never ends
+        self.batch_result = None     # function(custom_id, prompt) -> JSONL line
+        self.cancelled = []
+        self.results_fetched = []
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, payload, headers=None):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def do_POST(self):
+        state = self.server.state
+        payload = self.read_json()
+
+        if self.path == '/v1/messages':
+            prompt = payload['messages'][0]['content']
+            n = article_number(prompt)
+            with state.lock:
+                state.message_requests.append(n)
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                rate_limited = n in state.fail_429_once and n not in state.seen_429
+                if rate_limited:
+                    state.seen_429.add(n)
+            try:
+                threading.Event().wait(state.delay(n))
+                if rate_limited:
+                    self.send_json(429, {'type': 'error', 'error': {'type': 'rate_limit_error'}},
+                                   {'retry-after': '0'})
+                else:
+                    self.send_json(200, {'content': [{'type': 'text', 'text': score_text(n)}]})
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+            return
+
+        if self.path == '/v1/messages/batches':
+            with state.lock:
+                batch_id = f'msgbatch_{len(state.batches) + 1}'
+                state.batches[batch_id] = {'requests': payload['requests'], 'polls': 0}
+            self.send_json(200, {'id': batch_id, 'processing_status': 'in_progress'})
+            return
+
+        match = re.fullmatch(r'/v1/messages/batches/(\w+)/cancel', self.path)
+        if match:
+            with state.lock:
+                state.cancelled.append(match.group(1))
+            self.send_json(200, {'id': match.group(1), 'processing_status': 'canceling'})
+            return
+
+        self.send_json(404, {'error': 'not found'})
+
+    def do_GET(self):
+        state = self.server.state
+
+        match = re.fullmatch(r'/v1/messages/batches/(\w+)/results', self.path)
+        if match:
+            batch = state.batches[match.group(1)]
+            with state.lock:
+                state.results_fetched.append(match.group(1))
+            lines = [state.batch_result(r['custom_id'], r['params']['messages'][0]['content'])
+                     for r in reversed(batch['requests'])]   # results come back in no particular order
+            self.send_json(200, '\n'.join(lines).encode('utf-8'))
+            return
+
+        match = re.fullmatch(r'/v1/messages/batches/(\w+)', self.path)
+        if match:
+            batch_id = match.group(1)
+            with state.lock:
+                batch = state.batches[batch_id]
+                batch['polls'] += 1
+                ended = state.polls_until_ended is not None and batch['polls'] >= state.polls_until_ended
+            if ended:
+                host = self.headers['Host']
+                self.send_json(200, {
+                    'id': batch_id, 'processing_status': 'ended',
+                    'request_counts': {'succeeded': len(batch['requests']), 'errored': 0, 'expired': 0},
+                    'results_url': f'http://{host}/v1/messages/batches/{batch_id}/results',
+                })
+            else:
+                self.send_json(200, {'id': batch_id, 'processing_status': 'in_progress'})
+            return
+
+        self.send_json(404, {'error': 'not found'})
+
+
+@pytest.fixture
+def anthropic_stub(monkeypatch):
+    """
+    Start a stub Anthropic API server and point update_ski_news at it
+    (ANTHROPIC_API_URL) with a dummy API key. Yields (module, state).
+    """
+    import update_ski_news
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(update_ski_news, 'ANTHROPIC_API_URL', f'http://127.0.0.1:{server.server_port}/v1/messages')
+    monkeypatch.setattr(update_ski_news, 'ANTHROPIC_API_KEY', 'test-key')
+    try:
+        yield update_ski_news, server.state
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,227 @@
+"""
+LSH dedup (deduplicate_articles, deduplicate_against_existing) against the
+pairwise difflib versions it replaced, on the review queue and published
+feed in static/data and on a small set of near-duplicates.
+"""
+
+import copy
+import difflib
+import json
+import os
+from datetime import datetime, timedelta
+from collections import defaultdict
+
+import pytest
+
+import update_ski_news as news
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def deduplicate_articles_difflib(articles, similarity_threshold=0.85):
+    """
+    Pairwise difflib version of deduplicate_articles (every selected article
+    is compared), kept as the reference for the parity tests.
+    """
+    if not articles:
+        return []
+
+    # First pass: group by normalized title
+    groups = defaultdict(list)
+    for article in articles:
+        key = news.normalize_title(article.get('title', ''))
+        groups[key].append(article)
+
+    unique_articles = []
+    processed_keys = set()
+
+    # Sort groups by best score in group
+    sorted_groups = sorted(
+        groups.items(),
+        key=lambda x: max(a.get('score', 0) for a in x[1]),
+        reverse=True
+    )
+
+    for key, group in sorted_groups:
+        if key in processed_keys:
+            continue
+
+        # Get best article from this group
+        best = max(group, key=lambda x: (x.get('score', 0), x.get('source_boost', 0)))
+
+        # Record other sources if duplicates exist
+        if len(group) > 1:
+            best['other_sources'] = [
+                {'source': a['source'], 'url': a['url']}
+                for a in group if a['url'] != best['url']
+            ]
+
+        # Check for fuzzy matches against already-selected articles
+        is_duplicate = False
+        best_title = best.get('title', '').lower()
+        best_title_stripped = news._strip_source_suffix(best_title)
+        best_lead = news.get_lead_paragraph(best)
+
+        for existing in unique_articles:
+            existing_title = existing.get('title', '').lower()
+            existing_title_stripped = news._strip_source_suffix(existing_title)
+            existing_lead = news.get_lead_paragraph(existing)
+
+            # Check title similarity (both raw and with source suffix stripped)
+            title_similarity = difflib.SequenceMatcher(None, best_title, existing_title).ratio()
+            stripped_similarity = difflib.SequenceMatcher(None, best_title_stripped, existing_title_stripped).ratio()
+            effective_title_sim = max(title_similarity, stripped_similarity)
+
+            # Check lead paragraph similarity (catches same story with different headlines)
+            lead_similarity = difflib.SequenceMatcher(None, best_lead, existing_lead).ratio() if best_lead and existing_lead else 0
+
+            # Consider duplicate if either title or lead paragraph is very similar
+            if effective_title_sim >= similarity_threshold or (lead_similarity >= 0.80 and len(best_lead) > 50):
+                is_duplicate = True
+                # Add to existing article's other sources
+                if 'other_sources' not in existing:
+                    existing['other_sources'] = []
+                existing['other_sources'].append({
+                    'source': best['source'],
+                    'url': best['url']
+                })
+                break
+
+        if not is_duplicate:
+            unique_articles.append(best)
+
+        processed_keys.add(key)
+
+    return unique_articles
+
+
+def deduplicate_against_existing_difflib(new_articles, existing_articles, similarity_threshold=0.85,
+                                         max_age_days=news.MAX_ARTICLE_AGE_DAYS):
+    """
+    Pairwise difflib version of deduplicate_against_existing, kept as the
+    reference for the parity tests.
+    """
+    if not new_articles or not existing_articles:
+        return new_articles
+
+    # Only compare against recent articles (within expiration window)
+    cutoff_date = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+    recent_existing = [
+        a for a in existing_articles.values()
+        if a.get('pub_date', a.get('approved_date', '')) >= cutoff_date
+    ]
+
+    if not recent_existing:
+        return new_articles
+
+    filtered = []
+    duplicates_found = 0
+
+    for article in new_articles:
+        article_title = article.get('title', '').lower()
+        article_lead = news.get_lead_paragraph(article)
+        is_duplicate = False
+
+        article_title_stripped = news._strip_source_suffix(article_title)
+
+        for existing in recent_existing:
+            existing_title = existing.get('title', '').lower()
+            existing_title_stripped = news._strip_source_suffix(existing_title)
+            existing_lead = news.get_lead_paragraph(existing)
+
+            # Check title similarity (both raw and with source suffix stripped)
+            title_similarity = difflib.SequenceMatcher(None, article_title, existing_title).ratio()
+            stripped_similarity = difflib.SequenceMatcher(None, article_title_stripped, existing_title_stripped).ratio()
+            effective_title_sim = max(title_similarity, stripped_similarity)
+
+            # Check lead paragraph similarity
+            lead_similarity = 0
+            if article_lead and existing_lead and len(article_lead) > 50:
+                lead_similarity = difflib.SequenceMatcher(None, article_lead, existing_lead).ratio()
+
+            # Consider duplicate if title or lead is very similar
+            if effective_title_sim >= similarity_threshold or lead_similarity >= 0.80:
+                is_duplicate = True
+                duplicates_found += 1
+                break
+
+        if not is_duplicate:
+            filtered.append(article)
+
+    if duplicates_found > 0:
+        news.print_safe(f"  Historical dedup: filtered {duplicates_found} articles matching recent feed")
+
+    return filtered
+
+
+def summary(result):
+    return [(a['id'], [o['url'] for o in a.get('other_sources', [])]) for a in result]
+
+
+def load_repo_articles():
+    """(candidates, published-by-id) from the committed review queue and feed."""
+    feed_path = os.path.join(REPO_ROOT, 'static', 'data', 'ski-news.json')
+    queue_path = os.path.join(REPO_ROOT, 'static', 'data', 'ski-news-review.json')
+    if not (os.path.exists(feed_path) and os.path.exists(queue_path)):
+        pytest.skip('static/data news files not present')
+    with open(feed_path, 'r', encoding='utf-8') as f:
+        published = {a['id']: a for a in json.load(f).get('articles', [])}
+    with open(queue_path, 'r', encoding='utf-8') as f:
+        queue = json.load(f)
+    candidates = queue.get('pending', []) + list(published.values())
+    return candidates, published
+
+
+def near_duplicates():
+    """Reworded headlines and a shared lead paragraph, plus unrelated stories."""
+    lead = ('Vail Resorts reported season pass sales down three percent in units but up '
+            'in dollars, citing price increases and weaker demand from regional skiers.')
+    articles = [
+        {'title': 'Vail Resorts pass sales fall 3% in units', 'content': lead, 'score': 8},
+        {'title': 'Vail Resorts Pass Sales Fall 3% In Units - Ski Area Management', 'content': lead, 'score': 7},
+        {'title': 'Epic Pass sales slip as prices climb', 'content': lead, 'score': 6},
+        {'title': 'Alterra buys a ski area in Utah', 'content': 'Alterra Mountain Company has agreed to acquire a resort.', 'score': 7},
+        {'title': 'Alterra buys ski area in Utah', 'content': 'The deal closes next month.', 'score': 5},
+        {'title': 'Snowmaking upgrades at Killington', 'content': 'New fan guns arrive for the coming winter.', 'score': 4},
+    ]
+    for n, article in enumerate(articles):
+        article.update({'id': f'a{n}', 'url': f'https://example.com/{n}', 'source': f'Source {n}',
+                        'pub_date': datetime.now().strftime('%Y-%m-%d')})
+    return articles
+
+
+def test_deduplicate_articles_matches_difflib():
+    candidates, _ = load_repo_articles()
+    for articles in (candidates, near_duplicates()):
+        lsh = news.deduplicate_articles(copy.deepcopy(articles))
+        reference = deduplicate_articles_difflib(copy.deepcopy(articles))
+        assert summary(lsh) == summary(reference)
+
+
+def test_near_duplicates_are_merged():
+    result = news.deduplicate_articles(near_duplicates())
+    assert [a['id'] for a in result] == ['a0', 'a3', 'a5']
+    assert [o['url'] for o in result[0]['other_sources']] == ['https://example.com/1', 'https://example.com/2']
+
+
+def test_deduplicate_against_existing_matches_difflib():
+    candidates, published = load_repo_articles()
+    existing = {a['id']: a for a in near_duplicates()[:4]}
+    for articles, against in ((candidates, published), (near_duplicates(), existing)):
+        lsh = news.deduplicate_against_existing(copy.deepcopy(articles), copy.deepcopy(against),
+                                                max_age_days=100000)
+        reference = deduplicate_against_existing_difflib(copy.deepcopy(articles), copy.deepcopy(against),
+                                                         max_age_days=100000)
+        assert [a['id'] for a in lsh] == [a['id'] for a in reference]
+
+
+def test_sync_dedup_index_refreshes_edited_lead():
+    articles = {a['id']: a for a in near_duplicates()}
+    index = {'version': news.DEDUP_INDEX_VERSION, 'articles': {}}
+    assert news.sync_dedup_index(index, articles) == (len(articles), 0)
+    assert news.sync_dedup_index(index, articles) == (0, 0)
+
+    articles['a5'] = dict(articles['a5'], content='Killington now plans to replace its lift network '
+                                                  'over three summers, according to the resort.')
+    assert news.sync_dedup_index(index, articles) == (1, 0)
+    assert index['articles']['a5']['lead'] == news.get_lead_paragraph(articles['a5'])
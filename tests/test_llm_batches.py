@@ -0,0 +1,95 @@
+"""
+Message Batches scoring (run_llm_batch, rescore_review_queue) against the
+local stub of /v1/messages/batches from conftest.
+"""
+
+import json
+
+from conftest import article_number, score_text
+
+
+def make_articles(count):
+    return [{'title': f'Article {n}', 'source': 'Test', 'content': f'Body of article {n}'}
+            for n in range(count)]
+
+
+def batch_line(custom_id, prompt):
+    """Article 2 errors, article 3 has a malformed score object, article 4 a truncated line."""
+    n = article_number(prompt)
+    if n == 2:
+        return json.dumps({'custom_id': custom_id,
+                           'result': {'type': 'errored', 'error': {'type': 'overloaded_error'}}})
+    if n == 3:
+        text = '{"score": 9, oops}'
+    else:
+        text = score_text(n)
+    line = json.dumps({'custom_id': custom_id,
+                       'result': {'type': 'succeeded', 'message': {'content': [{'type': 'text', 'text': text}]}}})
+    return line[:25] if n == 4 else line
+
+
+def test_batch_submit_poll_and_results(anthropic_stub):
+    news, state = anthropic_stub
+    state.polls_until_ended = 3
+    state.batch_result = batch_line
+    prompts = {f'key{n}': news.build_llm_prompt(article) for n, article in enumerate(make_articles(8))}
+
+    scores = news.run_llm_batch(prompts, poll_seconds=0.01, timeout_minutes=1)
+
+    assert list(state.batches) == ['msgbatch_1']
+    assert state.batches['msgbatch_1']['polls'] == 3
+    assert state.results_fetched == ['msgbatch_1']
+    assert state.cancelled == []
+    # The errored and the two malformed results are skipped; the rest all come back
+    assert sorted(scores) == [f'key{n}' for n in (0, 1, 5, 6, 7)]
+    for n in (0, 1, 5, 6, 7):
+        expected = json.loads(score_text(n))
+        assert scores[f'key{n}'] == (expected['score'], {'reason': expected['reason'],
+                                                        'category': expected['category'],
+                                                        'method': 'llm'})
+
+
+def test_batch_timeout_cancels(anthropic_stub):
+    news, state = anthropic_stub
+    state.polls_until_ended = None
+    prompts = {f'key{n}': news.build_llm_prompt(article) for n, article in enumerate(make_articles(3))}
+
+    scores = news.run_llm_batch(prompts, poll_seconds=0.01, timeout_minutes=0.001)
+
+    assert scores == {}
+    assert state.cancelled == ['msgbatch_1']
+    assert state.results_fetched == []
+
+
+def test_rescore_review_queue_merges_batch_scores(anthropic_stub, monkeypatch):
+    news, state = anthropic_stub
+    state.batch_result = batch_line
+    monkeypatch.setattr(news.run_llm_batch, '__defaults__', (0.01, 1))
+
+    pending = make_articles(6)
+    for article in pending:
+        article.update({'score': 4, 'score_method': 'keyword', 'category': 'winter-sports',
+                        'score_details': {'reason': 'keywords'}})
+    queue = {'pending': pending}
+    saved = []
+    monkeypatch.setattr(news, 'load_review_queue', lambda: queue)
+    monkeypatch.setattr(news, 'save_review_queue', lambda q: saved.append(json.loads(json.dumps(q))))
+    monkeypatch.setattr(news, 'load_llm_cache', lambda: {})
+    monkeypatch.setattr(news, 'save_llm_cache', lambda cache: None)
+
+    rescored = news.rescore_review_queue(batch=True)
+
+    assert rescored == 3
+    assert len(saved) == 1
+    merged = saved[0]['pending']
+    for n in (0, 1, 5):
+        expected = json.loads(score_text(n))
+        assert merged[n]['score'] == expected['score']
+        assert merged[n]['score_method'] == 'llm'
+        assert merged[n]['score_details']['reason'] == expected['reason']
+        assert merged[n]['category'] == 'resort-operations'
+    # Failed requests keep their previous score
+    for n in (2, 3, 4):
+        assert merged[n]['score'] == 4
+        assert merged[n]['score_method'] == 'keyword'
+        assert merged[n]['category'] == 'winter-sports'
@@ -0,0 +1,81 @@
+"""
+Concurrent LLM scoring (score_articles_with_llm) against the local stub
+of /v1/messages from conftest.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from conftest import score_text
+
+
+def make_articles(count):
+    return [{'title': f'Article {n}', 'source': 'Test', 'content': f'Body of article {n}'}
+            for n in range(count)]
+
+
+def expected(n):
+    scores = json.loads(score_text(n))
+    return scores['score'], scores['reason']
+
+
+def test_in_flight_cap_and_result_order(anthropic_stub):
+    news, state = anthropic_stub
+    # Later articles answer first, so completion order differs from input order
+    state.delay = lambda n: 0.02 * (12 - n)
+    articles = make_articles(12)
+
+    results = news.score_articles_with_llm(articles, {}, max_in_flight=3, requests_per_minute=6000)
+
+    assert state.max_in_flight == 3
+    assert sorted(state.message_requests) == list(range(12))
+    assert [(score, details['reason']) for score, details in results] == [expected(n) for n in range(12)]
+
+
+def test_rate_limited_request_is_retried(anthropic_stub):
+    news, state = anthropic_stub
+    state.fail_429_once = {1, 4}
+    articles = make_articles(6)
+
+    results = news.score_articles_with_llm(articles, {}, max_in_flight=2, requests_per_minute=6000)
+
+    assert state.seen_429 == {1, 4}
+    assert sorted(state.message_requests) == sorted(list(range(6)) + [1, 4])
+    assert [score for score, _ in results] == [expected(n)[0] for n in range(6)]
+    assert all(details['method'] == 'llm' for _, details in results)
+
+
+def test_rerun_is_served_from_cache(anthropic_stub):
+    news, state = anthropic_stub
+    articles = make_articles(8)
+    llm_cache = {}
+
+    first = news.score_articles_with_llm(articles, llm_cache, max_in_flight=4, requests_per_minute=6000)
+    assert len(state.message_requests) == 8
+    assert len(llm_cache) == 8
+
+    second = news.score_articles_with_llm(articles, llm_cache, max_in_flight=4, requests_per_minute=6000)
+    assert len(state.message_requests) == 8
+    assert [(s, d['reason'], d['category']) for s, d in second] == \
+        [(s, d['reason'], d['category']) for s, d in first]
+    assert all('cached' not in details for _, details in second)
+
+
+def test_cache_load_skips_expired_entries(tmp_path, monkeypatch):
+    import update_ski_news as news
+
+    monkeypatch.setattr(news, 'LLM_CACHE_PATH', str(tmp_path / 'llm-scores.json'))
+    today = datetime.now()
+    scores = {
+        'fresh': {'score': 7, 'reason': 'r', 'category': 'c', 'date': today.strftime('%Y-%m-%d')},
+        'edge': {'score': 6, 'reason': 'r', 'category': 'c',
+                 'date': (today - timedelta(days=news.LLM_CACHE_DAYS)).strftime('%Y-%m-%d')},
+        'stale': {'score': 5, 'reason': 'r', 'category': 'c',
+                  'date': (today - timedelta(days=news.LLM_CACHE_DAYS + 1)).strftime('%Y-%m-%d')},
+    }
+    (tmp_path / 'llm-scores.json').write_text(json.dumps({'scores': scores}), encoding='utf-8')
+
+    assert sorted(news.load_llm_cache()) == ['edge', 'fresh']
+
+    (tmp_path / 'llm-scores.json').write_text('{"scores": ', encoding='utf-8')
+    assert news.load_llm_cache() == {}
@@ -21,10 +21,19 @@ import sys
 import re
 import hashlib
 import difflib
+import gzip
+import io
+import zlib
+import ssl
+import threading
+import time
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from collections import defaultdict
 import urllib.request
 import urllib.error
+import urllib.parse
 import xml.etree.ElementTree as ET
 from html import unescape
 
@@ -48,6 +57,10 @@ def load_config():
         'deduplication': {'title_similarity': 0.85, 'lead_paragraph_similarity': 0.80, 'min_lead_length': 50},
         'focus_topics': {},
         'output': {'max_articles': 75, 'max_rejected': 100, 'max_per_run': 50},
+        'fetching': {'max_workers': 12, 'max_per_host': 4, 'timeout': 30},
+        'llm': {'model': 'claude-haiku-4-5-20251001', 'max_in_flight': 4, 'requests_per_minute': 50,
+                'max_retries': 2, 'cache_days': 30,
+                'batch_min_articles': 0, 'batch_poll_seconds': 30, 'batch_timeout_minutes': 60},
         'logging': {'enable_run_log': True, 'max_log_entries': 30}
     }
 
@@ -94,6 +107,23 @@ ENABLE_LLM_SCORING = (
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 
+# LLM scoring requests - model, concurrency and rate limit (from config);
+# ANTHROPIC_API_URL can point at a local stub server for testing
+ANTHROPIC_API_URL = os.environ.get('ANTHROPIC_API_URL', 'https://api.anthropic.com/v1/messages')
+LLM_MODEL = CONFIG.get('llm', {}).get('model', 'claude-haiku-4-5-20251001')
+LLM_MAX_TOKENS = 150
+LLM_MAX_IN_FLIGHT = CONFIG.get('llm', {}).get('max_in_flight', 4)
+LLM_REQUESTS_PER_MINUTE = CONFIG.get('llm', {}).get('requests_per_minute', 50)
+LLM_MAX_RETRIES = CONFIG.get('llm', {}).get('max_retries', 2)
+LLM_CACHE_DAYS = CONFIG.get('llm', {}).get('cache_days', 30)
+
+# Message Batches mode - opt-in for --rescore-queue: used when --batch is
+# given, or when at least batch_min_articles uncached articles need scoring
+# (0 disables)
+LLM_BATCH_MIN_ARTICLES = CONFIG.get('llm', {}).get('batch_min_articles', 0)
+LLM_BATCH_POLL_SECONDS = CONFIG.get('llm', {}).get('batch_poll_seconds', 30)
+LLM_BATCH_TIMEOUT_MINUTES = CONFIG.get('llm', {}).get('batch_timeout_minutes', 60)
+
 # Scoring thresholds - from config or defaults
 if ENABLE_LLM_SCORING:
     AUTO_APPROVE_THRESHOLD = CONFIG.get('scoring', {}).get('thresholds', {}).get('llm', {}).get('approve', 7)
@@ -113,6 +143,16 @@ MAX_PER_RUN = CONFIG.get('output', {}).get('max_per_run', 30)
 # Focus topics - from config
 FOCUS_TOPICS = CONFIG.get('focus_topics', {})
 
+# Feed fetching - overall concurrency, connections per host and per-request timeout
+FETCH_MAX_WORKERS = CONFIG.get('fetching', {}).get('max_workers', 12)
+FETCH_MAX_PER_HOST = CONFIG.get('fetching', {}).get('max_per_host', 4)
+FETCH_TIMEOUT = CONFIG.get('fetching', {}).get('timeout', 30)
+
+# Per-feed ETag/Last-Modified/body hash and parsed items from the last run
+NEWS_CACHE_DIR = os.environ.get('SKI_NEWS_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'ski-news'))
+FEED_STATE_PATH = os.path.join(NEWS_CACHE_DIR, 'feed-state.json')
+LLM_CACHE_PATH = os.path.join(NEWS_CACHE_DIR, 'llm-scores.json')
+
 # =============================================================================
 # ARTICLE EXPIRATION (prevents stale content from persisting)
 # =============================================================================
@@ -1030,14 +1070,119 @@ def parse_date(date_str):
     return date_str  # Return original if parsing fails
 
 
-def fetch_url(url, timeout=30):
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Keep-alive connections per (scheme, host), shared by all fetch threads
+_host_pools = {}
+_host_pools_lock = threading.Lock()
+_ssl_context = ssl.create_default_context()
+
+
+def _host_pool(scheme, host, max_per_host=FETCH_MAX_PER_HOST):
+    """Connection pool for one host: a semaphore capping concurrent requests and idle connections."""
+    key = (scheme, host)
+    with _host_pools_lock:
+        if key not in _host_pools:
+            _host_pools[key] = {
+                'slots': threading.BoundedSemaphore(max_per_host),
+                'idle': [],
+                'lock': threading.Lock(),
+            }
+        return _host_pools[key]
+
+
+def http_get(url, headers=None, timeout=FETCH_TIMEOUT, max_redirects=5):
+    """
+    GET a URL over a pooled keep-alive connection, following redirects.
+
+    Returns:
+        Same as http_request
+    """
+    return http_request('GET', url, headers=headers, timeout=timeout, max_redirects=max_redirects)
+
+
+def http_request(method, url, body=None, headers=None, timeout=FETCH_TIMEOUT, max_redirects=5,
+                 max_per_host=FETCH_MAX_PER_HOST):
+    """
+    Send a request over a pooled keep-alive connection.
+
+    At most max_per_host requests (fixed by the first request to a host) run
+    against one host at a time; finished connections go back to the host's
+    idle list for reuse. GET follows redirects; other methods only follow
+    307/308, which keep the method and body.
+
+    Returns:
+        Dict with 'status', 'headers' (lower-cased names), 'body' (bytes,
+        gzip-decoded) and 'url' (final URL after redirects)
+
+    Raises:
+        urllib.error.HTTPError for 4xx/5xx responses (readable error body),
+        OSError/HTTPException on connection failures
+    """
+    request_headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}
+    request_headers.update(headers or {})
+
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        pool = _host_pool(parts.scheme, parts.netloc, max_per_host)
+
+        with pool['slots']:
+            with pool['lock']:
+                conn = pool['idle'].pop() if pool['idle'] else None
+            reused = conn is not None
+
+            while True:
+                if conn is None:
+                    if parts.scheme == 'https':
+                        conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout, context=_ssl_context)
+                    else:
+                        conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    response = conn.getresponse()
+                    response_body = response.read()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    conn = None
+                    # The server closed an idle keep-alive connection - retry once on a fresh one
+                    if not reused:
+                        raise
+                    reused = False
+                except Exception:
+                    conn.close()
+                    raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                with pool['lock']:
+                    pool['idle'].append(conn)
+
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response_headers.get('content-encoding') == 'gzip':
+            response_body = gzip.decompress(response_body)
+
+        redirect_codes = (301, 302, 303, 307, 308) if method == 'GET' else (307, 308)
+        if response.status in redirect_codes and 'location' in response_headers:
+            url = urllib.parse.urljoin(url, response_headers['location'])
+            continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response_headers,
+                                         io.BytesIO(response_body))
+
+        return {'status': response.status, 'headers': response_headers, 'body': response_body, 'url': url}
+
+    raise urllib.error.URLError(f"Too many redirects: {url}")
+
+
+def fetch_url(url, timeout=FETCH_TIMEOUT):
     """Fetch content from URL"""
     try:
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read().decode('utf-8', errors='replace')
+        return http_get(url, timeout=timeout)['body'].decode('utf-8', errors='replace')
     except Exception as e:
         # Track failed sources
         SOURCE_HEALTH[url] = {'status': 'failed', 'error': str(e)[:100]}
@@ -1151,68 +1296,141 @@ def fetch_ropeways_net():
     return articles
 
 
-def parse_rss_feed(xml_content, source_name):
-    """Parse RSS feed and extract articles"""
+RSS_NAMESPACES = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'content': 'http://purl.org/rss/1.0/modules/content/'
+}
+RSS_ITEM_TAGS = ('item', '{%s}entry' % RSS_NAMESPACES['atom'])
+RSS_PARSE_CHUNK = 64 * 1024
+
+
+def _rss_item_to_article(item, source_name):
+    """Build an article dict from an RSS <item> or Atom <entry> element (None if it has no URL)."""
+    namespaces = RSS_NAMESPACES
+    article = {'source': source_name}
+
+    # RSS format
+    title = item.find('title')
+    link = item.find('link')
+    description = item.find('description')
+    pub_date = item.find('pubDate')
+    content = item.find('content:encoded', namespaces)
+
+    # Atom format fallbacks
+    if title is None:
+        title = item.find('atom:title', namespaces)
+    if link is None:
+        link_elem = item.find('atom:link', namespaces)
+        if link_elem is not None:
+            article['url'] = link_elem.get('href', '')
+    if description is None:
+        description = item.find('atom:summary', namespaces)
+    if pub_date is None:
+        pub_date = item.find('atom:published', namespaces)
+        if pub_date is None:
+            pub_date = item.find('atom:updated', namespaces)
+
+    if title is not None:
+        article['title'] = clean_html(title.text or '')
+
+    if 'url' not in article and link is not None:
+        article['url'] = link.text if link.text else ''
+
+    if description is not None:
+        article['description'] = clean_html(description.text or '')[:500]
+
+    if content is not None:
+        article['content'] = clean_html(content.text or '')[:1000]
+    elif 'description' in article:
+        article['content'] = article['description']
+
+    if pub_date is not None and pub_date.text:
+        article['pub_date'] = parse_date(pub_date.text)
+
+    # Generate unique ID
+    if article.get('url'):
+        article['id'] = hashlib.md5(article['url'].encode()).hexdigest()[:12]
+        return article
+    return None
+
+
+def iter_rss_items(xml_content, source_name, stop=None):
+    """
+    Stream articles from an RSS or Atom feed.
+
+    The feed is fed to an incremental parser in chunks; each <item>/<entry>
+    is turned into an article as soon as it closes and is then removed from
+    the tree, so memory stays flat on large feeds.
+
+    Args:
+        xml_content: Feed XML (str)
+        source_name: Source name stored on each article
+        stop: Optional predicate called with each article before it is
+            yielded; returning True ends parsing (that article is not yielded)
+
+    Yields:
+        Article dicts in feed order
+
+    Raises:
+        ET.ParseError on malformed XML (articles before the error are yielded)
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    open_elements = []
+
+    for offset in range(0, len(xml_content), RSS_PARSE_CHUNK):
+        parser.feed(xml_content[offset:offset + RSS_PARSE_CHUNK])
+        for event, elem in parser.read_events():
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+
+            open_elements.pop()
+            if elem.tag not in RSS_ITEM_TAGS:
+                continue
+
+            article = _rss_item_to_article(elem, source_name)
+            # Drop the finished item from its parent so the tree doesn't grow
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+
+            if article is None:
+                continue
+            if stop is not None and stop(article):
+                return
+            yield article
+
+    parser.close()
+
+
+def stop_after_known(known_ids, consecutive=10, max_age_days=MAX_ARTICLE_AGE_DAYS):
+    """
+    Stop predicate for iter_rss_items: ends a feed after a run of items that
+    are already known (id in known_ids) or older than max_age_days.
+
+    A run is required rather than a single item because some feeds (e.g.
+    Google News searches) are not strictly ordered by date.
+    """
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+    run = [0]
+
+    def stop(article):
+        pub_date = article.get('pub_date', '')
+        if article['id'] in known_ids or (re.match(r'^\d{4}-\d{2}-\d{2}$', pub_date) and pub_date < cutoff):
+            run[0] += 1
+        else:
+            run[0] = 0
+        return run[0] >= consecutive
+
+    return stop
+
+
+def parse_rss_feed(xml_content, source_name, stop=None):
+    """Parse RSS feed and extract articles (see iter_rss_items for stop)"""
     articles = []
     try:
-        root = ET.fromstring(xml_content)
-        namespaces = {
-            'atom': 'http://www.w3.org/2005/Atom',
-            'content': 'http://purl.org/rss/1.0/modules/content/'
-        }
-
-        # Try RSS format first
-        items = root.findall('.//item')
-
-        # Try Atom format if no RSS items found
-        if not items:
-            items = root.findall('.//atom:entry', namespaces)
-
-        for item in items:
-            article = {'source': source_name}
-
-            # RSS format
-            title = item.find('title')
-            link = item.find('link')
-            description = item.find('description')
-            pub_date = item.find('pubDate')
-            content = item.find('content:encoded', namespaces)
-
-            # Atom format fallbacks
-            if title is None:
-                title = item.find('atom:title', namespaces)
-            if link is None:
-                link_elem = item.find('atom:link', namespaces)
-                if link_elem is not None:
-                    article['url'] = link_elem.get('href', '')
-            if description is None:
-                description = item.find('atom:summary', namespaces)
-            if pub_date is None:
-                pub_date = item.find('atom:published', namespaces)
-                if pub_date is None:
-                    pub_date = item.find('atom:updated', namespaces)
-
-            if title is not None:
-                article['title'] = clean_html(title.text or '')
-
-            if 'url' not in article and link is not None:
-                article['url'] = link.text if link.text else ''
-
-            if description is not None:
-                article['description'] = clean_html(description.text or '')[:500]
-
-            if content is not None:
-                article['content'] = clean_html(content.text or '')[:1000]
-            elif 'description' in article:
-                article['content'] = article['description']
-
-            if pub_date is not None and pub_date.text:
-                article['pub_date'] = parse_date(pub_date.text)
-
-            # Generate unique ID
-            if article.get('url'):
-                article['id'] = hashlib.md5(article['url'].encode()).hexdigest()[:12]
-                articles.append(article)
+        for article in iter_rss_items(xml_content, source_name, stop):
+            articles.append(article)
 
     except ET.ParseError as e:
         print_safe(f"  ! XML parse error for {source_name}: {e}")
@@ -1222,11 +1440,205 @@ def parse_rss_feed(xml_content, source_name):
     return articles
 
 
+# =============================================================================
+# KEYWORD SCORING TERMS (used by basic_keyword_score)
+# =============================================================================
+
+SCORE_BUSINESS_KEYWORDS = ['acquisition', 'merger', 'investment', 'earnings', 'revenue',
+                           'profit', 'bankruptcy', 'layoff', 'ceo', 'executive', 'quarterly']
+
+SCORE_WEATHER_KEYWORDS = ['snowfall', 'snow forecast', 'snowpack', 'la nina', 'el nino',
+                          'climate change', 'record snow', 'winter storm']
+
+SCORE_CANADA_KEYWORDS = ['canada', 'canadian', 'whistler', 'banff', 'british columbia']
+SCORE_INTERNATIONAL_KEYWORDS = ['europe', 'european', 'alps', 'japan', 'australia']
+
+# Simple penalties for obvious fluff
+FLUFF_INDICATORS = [
+    'trip report', 'gear review', 'gift guide', 'bucket list',
+    'must-visit', 'hidden gem', 'ultimate guide', 'complete guide',
+    'best places to', 'where to ski', 'resort guide', 'destination guide',
+    'ski vacation', 'family vacation', 'weekend getaway',
+    'things to do', 'what to pack', 'packing list', 'travel tips',
+]
+
+# Consumer-focused content penalties
+CONSUMER_KEYWORD_PATTERNS = [
+    'first descent', 'pov footage', 'gopro video', 'helmet cam',
+    'pro skier', 'professional skier', 'ski athlete',
+    'watch this', 'check out', 'epic run', 'insane footage',
+    'spring skiing', 'powder day', 'bluebird day',
+    'apres ski', 'après-ski', 'ski fashion', 'ski style',
+]
+
+# Off-topic penalties
+OFFTOPIC_TERMS = [
+    'tick', 'mosquito', 'lyme disease', 'hiking trail', 'mountain bike',
+    'summer hike', 'camping', 'kayak', 'rafting', 'rock climbing',
+    'golf course', 'tennis', 'fishing', 'hunting',
+]
+
+# Minor incident penalty - routine accidents and closures aren't business news
+# unless they involve a lawsuit, major investigation, or systemic safety issue
+MINOR_INCIDENT_TERMS = [
+    'injured skier', 'injured snowboarder', 'ski accident', 'snowboard accident',
+    'tree well', 'out of bounds', 'off-piste', 'lost skier',
+    'trail closed', 'run closed', 'lift closed', 'chairlift evacuation',
+    'chair evacuation', 'stuck on lift', 'stranded on lift',
+    'caught in avalanche', 'buried in avalanche', 'avalanche victim',
+    'skier dies', 'snowboarder dies', 'skier killed', 'snowboarder killed',
+    'skier death', 'snowboarder death', 'fatal ski', 'fatal snowboard',
+    'collision on', 'crash on slope', 'helmet cam crash',
+]
+# Only penalize if no systemic/business angle
+SYSTEMIC_SAFETY_TERMS = [
+    'lawsuit', 'litigation', 'negligence', 'investigation', 'osha',
+    'safety record', 'safety review', 'pattern of', 'systemic',
+    'policy change', 'insurance', 'liability', 'class action',
+    'regulatory', 'fine', 'penalty', 'settlement',
+]
+
+# Dashboard indicator boost - articles about metrics we track get a relevance bump
+DASHBOARD_INDICATORS = {
+    # Economic indicators tracked on dashboard
+    'consumer confidence': 2, 'consumer sentiment': 2, 'consumer spending': 2,
+    'personal savings rate': 2, 'discretionary spending': 2,
+    'inflation rate': 2, 'cpi': 2, 'consumer price index': 2,
+    'unemployment rate': 2, 'jobs report': 2, 'nonfarm payrolls': 2,
+    'wage growth': 2, 'interest rate': 2, 'federal reserve': 2,
+    'rate cut': 2, 'rate hike': 2, 'gdp growth': 2, 'recession': 2,
+    # Energy/commodity indicators
+    'oil price': 2, 'crude oil': 2, 'gasoline price': 2, 'gas prices': 2,
+    'natural gas price': 2, 'energy prices': 2,
+    # Market indicators
+    'stock market': 1, 's&p 500': 1, 'sp 500': 1,
+    # Currency indicators
+    'exchange rate': 2, 'strong dollar': 2, 'weak dollar': 2, 'canadian dollar': 2,
+}
+
+# =============================================================================
+# TERM MATCHING (one Aho-Corasick pass over all term tables)
+# =============================================================================
+# All term tables are plain substring checks ("term in text"), so a single
+# automaton over every term finds the same hits. The title and the
+# title + description prefilter text are prefixes of the full text, so one
+# scan of the full text gives hits for all three via match end positions.
+
+TERM_TABLES = {
+    'primary': PRIMARY_SKI_TERMS,
+    'resort_names': RESORT_NAME_CONTEXT_REQUIRED,
+    'business': SECONDARY_BUSINESS_TERMS,
+    'macro': MACRO_RELEVANCE_TERMS,
+    'region': MOUNTAIN_REGION_TERMS,
+    'category_phrases': {p for phrases in CATEGORY_PHRASES.values() for p in phrases},
+    'category_keywords': {k.lower() for info in ARTICLE_CATEGORIES.values() for k in info['keywords']},
+    'score_terms': set(SCORE_BUSINESS_KEYWORDS + SCORE_WEATHER_KEYWORDS + SCORE_CANADA_KEYWORDS
+                       + SCORE_INTERNATIONAL_KEYWORDS + FLUFF_INDICATORS + CONSUMER_KEYWORD_PATTERNS
+                       + OFFTOPIC_TERMS + MINOR_INCIDENT_TERMS + SYSTEMIC_SAFETY_TERMS)
+                   | set(DASHBOARD_INDICATORS),
+    'focus_topics': {t.lower() for t in (FOCUS_TOPICS or {})},
+}
+
+
+def build_term_automaton(terms):
+    """
+    Build an Aho-Corasick automaton for a set of terms.
+
+    Returns:
+        Dict with 'goto' (list of char -> state dicts), 'fail' (list of
+        states) and 'out' (list of terms ending at each state, including
+        those reached through failure links)
+    """
+    goto = [{}]
+    out = [[]]
+    for term in terms:
+        if not term:
+            continue
+        state = 0
+        for ch in term:
+            if ch not in goto[state]:
+                goto.append({})
+                out.append([])
+                goto[state][ch] = len(goto) - 1
+            state = goto[state][ch]
+        out[state].append(term)
+
+    # Breadth-first failure links; outputs of the failure state are merged in
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for ch, child in goto[state].items():
+            queue.append(child)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[child] = goto[f].get(ch, 0) if goto[f].get(ch, 0) != child else 0
+            out[child] = out[child] + out[fail[child]]
+
+    return {'goto': goto, 'fail': fail, 'out': out}
+
+
+def scan_terms(automaton, text):
+    """
+    Find every automaton term occurring in text.
+
+    Returns:
+        Dict mapping each found term to the end index of its first occurrence
+    """
+    goto, fail, out = automaton['goto'], automaton['fail'], automaton['out']
+    first_end = {}
+    state = 0
+    for i, ch in enumerate(text):
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        for term in out[state]:
+            if term not in first_end:
+                first_end[term] = i + 1
+    return first_end
+
+
+TERM_AUTOMATON = build_term_automaton(set().union(*TERM_TABLES.values()))
+
+# Hit sets per article text, shared by prefilter, scoring and categorization
+_term_hits_cache = {}
+
+
+def article_term_hits(article):
+    """
+    Terms from all term tables found in an article, per text region.
+
+    Returns:
+        Dict with 'title' (lower-cased title), 'prefilter' (title +
+        description, as strict_prefilter reads it) and 'text' (title +
+        description + content) mapping to sets of matched terms; per-table
+        hits are intersections with TERM_TABLES (e.g. hits['text'] & TERM_TABLES['business'])
+    """
+    title = f"{article.get('title', '')}"
+    description = f"{article.get('description', '')}"
+    content = f"{article.get('content', '')}"
+    key = (title, description, content)
+    if key in _term_hits_cache:
+        return _term_hits_cache[key]
+
+    title_end = len(title.lower())
+    prefilter_end = len(f"{title} {description}".lower())
+    first_end = scan_terms(TERM_AUTOMATON, f"{title} {description} {content}".lower())
+
+    hits = {
+        'title': {term for term, end in first_end.items() if end <= title_end},
+        'prefilter': {term for term, end in first_end.items() if end <= prefilter_end},
+        'text': set(first_end),
+    }
+    _term_hits_cache[key] = hits
+    return hits
+
+
 # =============================================================================
 # STRICT PRE-FILTER (Improvement: Two-tier system)
 # =============================================================================
 
-def strict_prefilter(article):
+def strict_prefilter(article, hits=None):
     """
     Three-tier pre-filter with macro relevance pathway and major source whitelist.
     Returns (passed, business_score, is_macro) tuple.
@@ -1235,42 +1647,45 @@ def strict_prefilter(article):
     Resort pathway: Resort name + business context (not just consumer content)
     Macro pathway: Macro relevance term + mountain region geography
     Whitelist pathway: Trusted sources get relaxed filtering
+
+    hits (from article_term_hits) is looked up if not passed.
     """
-    text = f"{article.get('title', '')} {article.get('description', '')}".lower()
+    if hits is None:
+        hits = article_term_hits(article)
+    found = hits['prefilter']
     source = article.get('source', '')
     is_whitelisted = source in WHITELIST_SOURCES
 
+    # Business context terms in title + description
+    business_count = len(found & SECONDARY_BUSINESS_TERMS)
+
     # Gate 1: Check for explicit ski industry reference (primary pathway)
-    has_ski_term = any(term in text for term in PRIMARY_SKI_TERMS)
+    has_ski_term = not found.isdisjoint(PRIMARY_SKI_TERMS)
 
     if has_ski_term:
         # Primary pathway passed - count business context terms
-        business_count = sum(1 for term in SECONDARY_BUSINESS_TERMS if term in text)
         return True, business_count, False
 
     # Gate 1.5: Resort name + business context pathway
     # Allows resort-specific articles only if they have business relevance
-    has_resort_name = any(resort in text for resort in RESORT_NAME_CONTEXT_REQUIRED)
-    has_business_context = any(term in text for term in SECONDARY_BUSINESS_TERMS)
+    has_resort_name = not found.isdisjoint(RESORT_NAME_CONTEXT_REQUIRED)
+    has_business_context = business_count > 0
 
     if has_resort_name and has_business_context:
-        business_count = sum(1 for term in SECONDARY_BUSINESS_TERMS if term in text)
         return True, business_count, False
 
     # Gate 2: Check macro relevance pathway (secondary)
     # Requires BOTH a macro term AND a mountain region term
-    has_macro_term = any(term in text for term in MACRO_RELEVANCE_TERMS)
-    has_region_term = any(term in text for term in MOUNTAIN_REGION_TERMS)
+    has_macro_term = not found.isdisjoint(MACRO_RELEVANCE_TERMS)
+    has_region_term = not found.isdisjoint(MOUNTAIN_REGION_TERMS)
 
     if has_macro_term and has_region_term:
         # Macro pathway passed - these get lower priority during sorting
-        business_count = sum(1 for term in SECONDARY_BUSINESS_TERMS if term in text)
         return True, business_count, True  # True = is_macro (lower priority)
 
     # Gate 3: Whitelisted sources get relaxed filtering
     # They only need a macro term OR a region term (not both)
     if is_whitelisted and (has_macro_term or has_region_term):
-        business_count = sum(1 for term in SECONDARY_BUSINESS_TERMS if term in text)
         return True, business_count, True  # Treated as macro (lower priority but included)
 
     return False, 0, False
@@ -1302,6 +1717,142 @@ def _strip_source_suffix(title):
     return re.sub(r'\s*-\s+[\w\s&\']{2,40}$', '', title)
 
 
+# Near-duplicate candidates come from a MinHash/LSH index over character
+# 3-gram shingles; the difflib ratios (and thresholds) are only evaluated
+# for articles that share an LSH bucket. 32 bands of 2 rows find a pair
+# with shingle Jaccard 0.5 with probability 0.9999; titles at difflib
+# ratio 0.85 and leads at 0.80 measure above that in practice.
+MINHASH_PERMUTATIONS = 64
+LSH_BAND_ROWS = 2
+SHINGLE_SIZE = 3
+_MINHASH_PRIME = (1 << 31) - 1
+# Fixed coefficients so signatures are stable across runs and processes
+_MINHASH_COEFFS = [
+    (int.from_bytes(hashlib.sha1(f'minhash-a-{i}'.encode()).digest()[:8], 'big') % _MINHASH_PRIME | 1,
+     int.from_bytes(hashlib.sha1(f'minhash-b-{i}'.encode()).digest()[:8], 'big') % _MINHASH_PRIME)
+    for i in range(MINHASH_PERMUTATIONS)
+]
+
+
+def minhash_signature(text):
+    """MinHash signature (tuple of MINHASH_PERMUTATIONS ints) of a text's character shingles."""
+    shingles = {zlib.crc32(text[i:i + SHINGLE_SIZE].encode('utf-8')) % _MINHASH_PRIME
+                for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+    return tuple(min([(a * x + b) % _MINHASH_PRIME for x in shingles]) for a, b in _MINHASH_COEFFS)
+
+
+def lsh_add(index, field, key, signature):
+    """Add a signature under key to the LSH buckets of one field ('title', 'stripped', 'lead')."""
+    for start in range(0, len(signature), LSH_BAND_ROWS):
+        index[(field, start, signature[start:start + LSH_BAND_ROWS])].append(key)
+
+
+def lsh_candidates(index, field, signature):
+    """Keys sharing at least one LSH band with signature in the given field."""
+    candidates = set()
+    for start in range(0, len(signature), LSH_BAND_ROWS):
+        candidates.update(index.get((field, start, signature[start:start + LSH_BAND_ROWS]), ()))
+    return candidates
+
+
+def dedup_features(article):
+    """
+    Lower-cased title, title without source suffix, lead paragraph and their
+    MinHash signatures, as compared by the dedup functions.
+    """
+    title = article.get('title', '').lower()
+    stripped = _strip_source_suffix(title)
+    lead = get_lead_paragraph(article)
+    title_signature = minhash_signature(title)
+    return {
+        'title': title,
+        'stripped': stripped,
+        'lead': lead,
+        'signatures': {
+            'title': title_signature,
+            'stripped': title_signature if stripped == title else minhash_signature(stripped),
+            'lead': minhash_signature(lead) if lead else None,
+        }
+    }
+
+
+def index_dedup_features(index, key, features):
+    """Add an article's dedup features to an LSH index (a defaultdict(list))."""
+    for field, signature in features['signatures'].items():
+        if signature is not None:
+            lsh_add(index, field, key, signature)
+
+
+def _ratio_at_least(a, matcher, threshold):
+    """
+    difflib ratio(a, b) >= threshold for a matcher whose seq2 is b, trying
+    its cheap upper bounds first. difflib caches its analysis of seq2, so
+    one matcher per indexed text is reused across comparisons.
+    """
+    matcher.set_seq1(a)
+    return (matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold)
+
+
+def _matchers_for(features):
+    """SequenceMatchers with seq2 set to each of an article's compared texts."""
+    matchers = {}
+    for field in ('title', 'stripped', 'lead'):
+        matchers[field] = difflib.SequenceMatcher(None)
+        matchers[field].set_seq2(features[field])
+    return matchers
+
+
+def is_near_duplicate(features, other, similarity_threshold=0.85, lead_threshold=0.80, matchers=None):
+    """
+    Same test as the pairwise difflib dedup: title (raw or source-stripped)
+    similarity >= similarity_threshold, or lead paragraph similarity >=
+    lead_threshold when features' lead is over 50 characters.
+
+    matchers (from _matchers_for(other)) can be passed to reuse difflib's
+    analysis of other's texts.
+    """
+    if matchers is None:
+        matchers = _matchers_for(other)
+    if _ratio_at_least(features['title'], matchers['title'], similarity_threshold):
+        return True
+    if _ratio_at_least(features['stripped'], matchers['stripped'], similarity_threshold):
+        return True
+    return (len(features['lead']) > 50 and bool(other['lead'])
+            and _ratio_at_least(features['lead'], matchers['lead'], lead_threshold))
+
+
+def find_near_duplicate(index, indexed_features, features, similarity_threshold=0.85, matchers=None):
+    """
+    First indexed article (lowest key) that is a near duplicate of features.
+
+    Args:
+        index: LSH index built with index_dedup_features, keyed by position
+        indexed_features: List of features for the indexed articles
+        features: dedup_features of the article to look up
+        matchers: Optional dict (key -> _matchers_for result), filled lazily
+            so repeated lookups against the same index reuse them
+
+    Returns:
+        Key of the matching article, or None
+    """
+    if matchers is None:
+        matchers = {}
+
+    signatures = features['signatures']
+    candidates = lsh_candidates(index, 'title', signatures['title'])
+    candidates |= lsh_candidates(index, 'stripped', signatures['stripped'])
+    if len(features['lead']) > 50:
+        candidates |= lsh_candidates(index, 'lead', signatures['lead'])
+
+    for key in sorted(candidates):
+        if key not in matchers:
+            matchers[key] = _matchers_for(indexed_features[key])
+        if is_near_duplicate(features, indexed_features[key], similarity_threshold, matchers=matchers[key]):
+            return key
+    return None
+
+
 def deduplicate_articles(articles, similarity_threshold=0.85):
     """
     Group articles by title similarity, keep highest-scored from each group.
@@ -1317,6 +1868,9 @@ def deduplicate_articles(articles, similarity_threshold=0.85):
         groups[key].append(article)
 
     unique_articles = []
+    unique_features = []
+    index = defaultdict(list)
+    matchers = {}
     processed_keys = set()
 
     # Sort groups by best score in group
@@ -1341,45 +1895,106 @@ def deduplicate_articles(articles, similarity_threshold=0.85):
             ]
 
         # Check for fuzzy matches against already-selected articles
-        is_duplicate = False
-        best_title = best.get('title', '').lower()
-        best_title_stripped = _strip_source_suffix(best_title)
-        best_lead = get_lead_paragraph(best)
-
-        for existing in unique_articles:
-            existing_title = existing.get('title', '').lower()
-            existing_title_stripped = _strip_source_suffix(existing_title)
-            existing_lead = get_lead_paragraph(existing)
-
-            # Check title similarity (both raw and with source suffix stripped)
-            title_similarity = difflib.SequenceMatcher(None, best_title, existing_title).ratio()
-            stripped_similarity = difflib.SequenceMatcher(None, best_title_stripped, existing_title_stripped).ratio()
-            effective_title_sim = max(title_similarity, stripped_similarity)
-
-            # Check lead paragraph similarity (catches same story with different headlines)
-            lead_similarity = difflib.SequenceMatcher(None, best_lead, existing_lead).ratio() if best_lead and existing_lead else 0
-
-            # Consider duplicate if either title or lead paragraph is very similar
-            if effective_title_sim >= similarity_threshold or (lead_similarity >= 0.80 and len(best_lead) > 50):
-                is_duplicate = True
-                # Add to existing article's other sources
-                if 'other_sources' not in existing:
-                    existing['other_sources'] = []
-                existing['other_sources'].append({
-                    'source': best['source'],
-                    'url': best['url']
-                })
-                break
-
-        if not is_duplicate:
+        features = dedup_features(best)
+        match = find_near_duplicate(index, unique_features, features, similarity_threshold, matchers)
+
+        if match is not None:
+            # Add to existing article's other sources
+            existing = unique_articles[match]
+            if 'other_sources' not in existing:
+                existing['other_sources'] = []
+            existing['other_sources'].append({
+                'source': best['source'],
+                'url': best['url']
+            })
+        else:
+            index_dedup_features(index, len(unique_articles), features)
             unique_articles.append(best)
+            unique_features.append(features)
 
         processed_keys.add(key)
 
     return unique_articles
 
 
-def deduplicate_against_existing(new_articles, existing_articles, similarity_threshold=0.85):
+# Sidecar index of dedup features for published articles in the expiry
+# window, so historical dedup doesn't recompute them every run
+DEDUP_INDEX_PATH = os.path.join(NEWS_CACHE_DIR, 'dedup-index.json')
+DEDUP_INDEX_VERSION = f'minhash-{MINHASH_PERMUTATIONS}x{LSH_BAND_ROWS}-k{SHINGLE_SIZE}-p{_MINHASH_PRIME}'
+
+
+def _article_date(article):
+    """Date used for the expiry window (pub_date, else approved_date)."""
+    return article.get('pub_date', article.get('approved_date', ''))
+
+
+def load_dedup_index():
+    """
+    Load the dedup index sidecar.
+
+    Returns:
+        Dict with 'version' and 'articles' (id -> dedup_features plus 'date');
+        empty if the file is missing or was built with other MinHash settings
+    """
+    if os.path.exists(DEDUP_INDEX_PATH):
+        try:
+            with open(DEDUP_INDEX_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == DEDUP_INDEX_VERSION:
+                for entry in data['articles'].values():
+                    entry['signatures'] = {
+                        field: tuple(signature) if signature is not None else None
+                        for field, signature in entry['signatures'].items()
+                    }
+                return data
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+    return {'version': DEDUP_INDEX_VERSION, 'articles': {}}
+
+
+def save_dedup_index(dedup_index):
+    """Save the dedup index sidecar."""
+    os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+    tmp_path = DEDUP_INDEX_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dedup_index, f)
+    os.replace(tmp_path, DEDUP_INDEX_PATH)
+
+
+def sync_dedup_index(dedup_index, existing_articles, max_age_days=MAX_ARTICLE_AGE_DAYS):
+    """
+    Update the index in place to cover exactly the existing articles within
+    the expiry window: features are computed only for articles not yet
+    indexed (or whose title or lead paragraph changed), and expired or
+    removed ones are dropped.
+
+    Returns:
+        (added, removed) counts
+    """
+    cutoff_date = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+    entries = dedup_index['articles']
+    recent = {
+        article_id: a for article_id, a in existing_articles.items()
+        if _article_date(a) >= cutoff_date
+    }
+
+    removed = [article_id for article_id in entries if article_id not in recent]
+    for article_id in removed:
+        del entries[article_id]
+
+    added = 0
+    for article_id, article in recent.items():
+        entry = entries.get(article_id)
+        if entry is None or entry['title'] != article.get('title', '').lower() \
+                or entry['lead'] != get_lead_paragraph(article):
+            entries[article_id] = {**dedup_features(article), 'date': _article_date(article)}
+            added += 1
+
+    return added, len(removed)
+
+
+def deduplicate_against_existing(new_articles, existing_articles, similarity_threshold=0.85,
+                                 max_age_days=MAX_ARTICLE_AGE_DAYS, dedup_index=None):
     """
     Filter out new articles that are duplicates of recently published articles.
     This prevents old topics from reappearing when a new source covers the same story.
@@ -1388,6 +2003,9 @@ def deduplicate_against_existing(new_articles, existing_articles, similarity_thr
         new_articles: List of newly fetched articles
         existing_articles: Dict of existing articles (id -> article)
         similarity_threshold: Minimum similarity to consider duplicate
+        max_age_days: Only existing articles this recent are compared
+        dedup_index: Optional index from load_dedup_index; it is synced with
+            existing_articles and its stored features are used
 
     Returns:
         List of articles that are NOT duplicates of existing content
@@ -1396,47 +2014,27 @@ def deduplicate_against_existing(new_articles, existing_articles, similarity_thr
         return new_articles
 
     # Only compare against recent articles (within expiration window)
-    cutoff_date = (datetime.now() - timedelta(days=MAX_ARTICLE_AGE_DAYS)).strftime('%Y-%m-%d')
-    recent_existing = [
-        a for a in existing_articles.values()
-        if a.get('pub_date', a.get('approved_date', '')) >= cutoff_date
-    ]
+    if dedup_index is None:
+        dedup_index = {'version': DEDUP_INDEX_VERSION, 'articles': {}}
+    sync_dedup_index(dedup_index, existing_articles, max_age_days)
+    existing_features = list(dedup_index['articles'].values())
 
-    if not recent_existing:
+    if not existing_features:
         return new_articles
 
+    index = defaultdict(list)
+    for key, features in enumerate(existing_features):
+        index_dedup_features(index, key, features)
+
+    matchers = {}
     filtered = []
     duplicates_found = 0
 
     for article in new_articles:
-        article_title = article.get('title', '').lower()
-        article_lead = get_lead_paragraph(article)
-        is_duplicate = False
-
-        article_title_stripped = _strip_source_suffix(article_title)
-
-        for existing in recent_existing:
-            existing_title = existing.get('title', '').lower()
-            existing_title_stripped = _strip_source_suffix(existing_title)
-            existing_lead = get_lead_paragraph(existing)
-
-            # Check title similarity (both raw and with source suffix stripped)
-            title_similarity = difflib.SequenceMatcher(None, article_title, existing_title).ratio()
-            stripped_similarity = difflib.SequenceMatcher(None, article_title_stripped, existing_title_stripped).ratio()
-            effective_title_sim = max(title_similarity, stripped_similarity)
-
-            # Check lead paragraph similarity
-            lead_similarity = 0
-            if article_lead and existing_lead and len(article_lead) > 50:
-                lead_similarity = difflib.SequenceMatcher(None, article_lead, existing_lead).ratio()
-
-            # Consider duplicate if title or lead is very similar
-            if effective_title_sim >= similarity_threshold or lead_similarity >= 0.80:
-                is_duplicate = True
-                duplicates_found += 1
-                break
-
-        if not is_duplicate:
+        features = dedup_features(article)
+        if find_near_duplicate(index, existing_features, features, similarity_threshold, matchers) is not None:
+            duplicates_found += 1
+        else:
             filtered.append(article)
 
     if duplicates_found > 0:
@@ -1474,50 +2072,152 @@ def filter_expired_articles(articles, max_age_days=MAX_ARTICLE_AGE_DAYS):
     return filtered
 
 
+# =============================================================================
+# PATTERN MATCHING (compiled, combined regex alternations)
+# =============================================================================
+# Each pattern list is compiled once into a single alternation with one named
+# group per pattern, so a field is scanned once for the whole list instead of
+# once per pattern. Results are memoized per text.
+
+def compile_pattern_set(patterns, flags=re.IGNORECASE):
+    """
+    Compile a list of regex patterns for combined matching.
+
+    Args:
+        patterns: List of pattern strings
+        flags: re flags applied to every pattern
+
+    Returns:
+        Dict with 'combined' (alternation with group p<i> for pattern i),
+        'patterns' (each pattern compiled on its own) and 'cache'
+        (text -> matched indexes)
+    """
+    # A leading \b shared by every pattern is hoisted out of the alternation,
+    # so the branches are only tried at word boundaries
+    prefix = ''
+    if patterns and all(pattern.startswith(r'\b') for pattern in patterns):
+        prefix = r'\b'
+        patterns_body = [pattern[2:] for pattern in patterns]
+    else:
+        patterns_body = patterns
+    alternation = '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(patterns_body))
+    return {
+        'combined': re.compile(f'{prefix}(?:{alternation})', flags),
+        'patterns': [re.compile(pattern, flags) for pattern in patterns],
+        'cache': {},
+    }
+
+
+def match_pattern_set(pattern_set, text):
+    """
+    Find which patterns of a compiled pattern set match anywhere in text.
+
+    The alternation reports only the first listed pattern matching at a
+    position, so at each match position the later patterns not yet found are
+    tried there as well; the result is the same as re.search per pattern.
+
+    Returns:
+        Frozenset of indexes into the original pattern list
+    """
+    cache = pattern_set['cache']
+    if text in cache:
+        return cache[text]
+
+    combined, patterns = pattern_set['combined'], pattern_set['patterns']
+    found = set()
+    pos = 0
+    while len(found) < len(patterns):
+        m = combined.search(text, pos)
+        if m is None:
+            break
+        first = int(m.lastgroup[1:])
+        found.add(first)
+        for i in range(first + 1, len(patterns)):
+            if i not in found and patterns[i].match(text, m.start()):
+                found.add(i)
+        pos = m.start() + 1
+
+    found = frozenset(found)
+    cache[text] = found
+    return found
+
+
+def pattern_set_matches(pattern_set, text):
+    """True if any pattern of a compiled pattern set matches text (memoized)."""
+    cache = pattern_set['cache']
+    if text not in cache:
+        cache[text] = pattern_set['combined'].search(text) is not None
+    return cache[text]
+
+
+PROMOTIONAL_RE = compile_pattern_set([pattern for pattern, _ in PROMOTIONAL_PATTERNS])
+PROMOTIONAL_EXCEPTIONS_RE = compile_pattern_set(PROMOTIONAL_EXCEPTIONS)
+CONSUMER_CONTENT_RE = compile_pattern_set([pattern for pattern, _ in CONSUMER_CONTENT_PATTERNS])
+CONSUMER_CONTENT_EXCEPTIONS_RE = compile_pattern_set(CONSUMER_CONTENT_EXCEPTIONS)
+ANALYTICAL_CONTENT_RE = compile_pattern_set([pattern for pattern, _ in ANALYTICAL_CONTENT_PATTERNS])
+
+
 # =============================================================================
 # CONTEXTUAL PENALTY SCORING (Improvement: Regex-based precision)
 # =============================================================================
 
-def apply_contextual_penalties(text, title):
-    """Apply penalties for promotional and consumer content."""
-    penalty = 0
+def article_pattern_hits(text, title):
+    """
+    Match every penalty, exception and analytical pattern set against an
+    article's fields.
+
+    Args:
+        text: Title + description + content
+        title: Article title
+
+    Returns:
+        Dict of matched pattern indexes (frozensets) per pattern set and
+        field, and exception flags, as read by apply_contextual_penalties
+        and analytical_boost
+    """
     text_lower = text.lower()
     title_lower = title.lower()
     combined_text = f"{title_lower} {text_lower}"
+    return {
+        'promotional_title': match_pattern_set(PROMOTIONAL_RE, title_lower),
+        'promotional_text': match_pattern_set(PROMOTIONAL_RE, text_lower),
+        'promotional_exception': pattern_set_matches(PROMOTIONAL_EXCEPTIONS_RE, text_lower),
+        'consumer_combined': match_pattern_set(CONSUMER_CONTENT_RE, combined_text),
+        'consumer_title': match_pattern_set(CONSUMER_CONTENT_RE, title_lower),
+        'consumer_exception': pattern_set_matches(CONSUMER_CONTENT_EXCEPTIONS_RE, combined_text),
+        'analytical_title': match_pattern_set(ANALYTICAL_CONTENT_RE, title_lower),
+        'analytical_text': match_pattern_set(ANALYTICAL_CONTENT_RE, text_lower),
+    }
 
-    # Apply promotional content penalties
-    for pattern, points in PROMOTIONAL_PATTERNS:
-        # Check in title first (stronger penalty could be applied)
-        if re.search(pattern, title_lower, re.IGNORECASE):
-            # Check exceptions
-            is_exception = any(
-                re.search(exc, text_lower, re.IGNORECASE)
-                for exc in PROMOTIONAL_EXCEPTIONS
-            )
-            if not is_exception:
-                penalty += points
-                continue
 
-        # Check in full text
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            is_exception = any(
-                re.search(exc, text_lower, re.IGNORECASE)
-                for exc in PROMOTIONAL_EXCEPTIONS
-            )
-            if not is_exception:
+def apply_contextual_penalties(text, title):
+    """Apply penalties for promotional and consumer content."""
+    return contextual_penalty(article_pattern_hits(text, title))
+
+
+def contextual_penalty(pattern_hits):
+    """Promotional and consumer content penalty from article_pattern_hits."""
+    penalty = 0
+
+    # Apply promotional content penalties (exceptions anywhere in the text
+    # cancel them all)
+    title_hits = pattern_hits['promotional_title']
+    text_hits = pattern_hits['promotional_text']
+    if (title_hits or text_hits) and not pattern_hits['promotional_exception']:
+        for i, (_, points) in enumerate(PROMOTIONAL_PATTERNS):
+            if i in title_hits:
+                penalty += points
+            elif i in text_hits:
                 penalty += points // 2  # Lower penalty for body matches
 
     # Apply consumer content penalties (more severe)
-    for pattern, points in CONSUMER_CONTENT_PATTERNS:
-        if re.search(pattern, combined_text, re.IGNORECASE):
-            # Check if business context exception applies
-            has_business_context = any(
-                re.search(exc, combined_text, re.IGNORECASE)
-                for exc in CONSUMER_CONTENT_EXCEPTIONS
-            )
-            if not has_business_context:
+    combined_hits = pattern_hits['consumer_combined']
+    if combined_hits and not pattern_hits['consumer_exception']:
+        title_hits = pattern_hits['consumer_title']
+        for i, (_, points) in enumerate(CONSUMER_CONTENT_PATTERNS):
+            if i in combined_hits:
                 # Title matches get full penalty, body gets reduced
-                if re.search(pattern, title_lower, re.IGNORECASE):
+                if i in title_hits:
                     penalty += points
                 else:
                     penalty += points // 2
@@ -1529,13 +2229,16 @@ def apply_contextual_penalties(text, title):
 # CATEGORY ASSIGNMENT V2 (Improvement: Priority system with phrase matching)
 # =============================================================================
 
-def assign_categories_v2(article, llm_suggested_category=None):
+def assign_categories_v2(article, llm_suggested_category=None, hits=None):
     """
     Improved category assignment with phrase matching and priority.
     If LLM provides category, validate it; otherwise use rules.
+    hits (from article_term_hits) is looked up if not passed.
     """
-    text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}".lower()
-    title = article.get('title', '').lower()
+    if hits is None:
+        hits = article_term_hits(article)
+    text = hits['text']
+    title = hits['title']
 
     scores = {cat: 0 for cat in CATEGORY_PRIORITY}
 
@@ -1581,13 +2284,20 @@ def assign_categories_v2(article, llm_suggested_category=None):
 # SCORING FUNCTIONS
 # =============================================================================
 
-def basic_keyword_score(article):
-    """Score article using improved keyword analysis with contextual penalties."""
+def basic_keyword_score(article, hits=None):
+    """
+    Score article using improved keyword analysis with contextual penalties.
+    hits (from article_term_hits) is looked up if not passed.
+    """
     text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}".lower()
     title = article.get('title', '').lower()
+    if hits is None:
+        hits = article_term_hits(article)
+    text_hits = hits['text']
+    title_hits = hits['title']
 
     # Use strict pre-filter check
-    passed_prefilter, business_boost, is_macro = strict_prefilter(article)
+    passed_prefilter, business_boost, is_macro = strict_prefilter(article, hits)
 
     if not passed_prefilter:
         return 2, {"reason": "No ski industry relevance detected", "method": "keyword"}
@@ -1601,32 +2311,26 @@ def basic_keyword_score(article):
     # HIGH PRIORITY: Phrase-based boosts (stronger signals)
     for cat, phrases in CATEGORY_PHRASES.items():
         for phrase in phrases:
-            if phrase in title:
+            if phrase in title_hits:
                 score += 3
-            elif phrase in text:
+            elif phrase in text_hits:
                 score += 2
 
     # MEDIUM PRIORITY: Single keyword boosts
-    business_keywords = ['acquisition', 'merger', 'investment', 'earnings', 'revenue',
-                        'profit', 'bankruptcy', 'layoff', 'ceo', 'executive', 'quarterly']
-    for kw in business_keywords:
-        if kw in title:
+    for kw in SCORE_BUSINESS_KEYWORDS:
+        if kw in title_hits:
             score += 2
-        elif kw in text:
+        elif kw in text_hits:
             score += 1
 
     # Weather/climate boost
-    weather_keywords = ['snowfall', 'snow forecast', 'snowpack', 'la nina', 'el nino',
-                       'climate change', 'record snow', 'winter storm']
-    for kw in weather_keywords:
-        if kw in text:
-            score += 2
-            break
+    if not text_hits.isdisjoint(SCORE_WEATHER_KEYWORDS):
+        score += 2
 
     # Canadian/International boost
-    if any(kw in text for kw in ['canada', 'canadian', 'whistler', 'banff', 'british columbia']):
+    if not text_hits.isdisjoint(SCORE_CANADA_KEYWORDS):
         score += 2
-    if any(kw in text for kw in ['europe', 'european', 'alps', 'japan', 'australia']):
+    if not text_hits.isdisjoint(SCORE_INTERNATIONAL_KEYWORDS):
         score += 1
 
     # Apply contextual penalties (regex-based)
@@ -1634,88 +2338,29 @@ def basic_keyword_score(article):
     score += penalty  # penalties are negative
 
     # Additional simple penalties for obvious fluff
-    fluff_indicators = [
-        'trip report', 'gear review', 'gift guide', 'bucket list',
-        'must-visit', 'hidden gem', 'ultimate guide', 'complete guide',
-        'best places to', 'where to ski', 'resort guide', 'destination guide',
-        'ski vacation', 'family vacation', 'weekend getaway',
-        'things to do', 'what to pack', 'packing list', 'travel tips',
-    ]
-    for indicator in fluff_indicators:
-        if indicator in text:
-            score -= 3
-            break
+    if not text_hits.isdisjoint(FLUFF_INDICATORS):
+        score -= 3
 
     # Consumer-focused content penalties
-    consumer_patterns = [
-        'first descent', 'pov footage', 'gopro video', 'helmet cam',
-        'pro skier', 'professional skier', 'ski athlete',
-        'watch this', 'check out', 'epic run', 'insane footage',
-        'spring skiing', 'powder day', 'bluebird day',
-        'apres ski', 'après-ski', 'ski fashion', 'ski style',
-    ]
-    for pattern in consumer_patterns:
-        if pattern in text:
-            score -= 4
-            break
+    if not text_hits.isdisjoint(CONSUMER_KEYWORD_PATTERNS):
+        score -= 4
 
     # Off-topic penalties
-    offtopic = [
-        'tick', 'mosquito', 'lyme disease', 'hiking trail', 'mountain bike',
-        'summer hike', 'camping', 'kayak', 'rafting', 'rock climbing',
-        'golf course', 'tennis', 'fishing', 'hunting',
-    ]
-    for kw in offtopic:
-        if kw in text:
-            score -= 4
-            break
+    if not text_hits.isdisjoint(OFFTOPIC_TERMS):
+        score -= 4
 
-    # Minor incident penalty - routine accidents and closures aren't business news
-    # unless they involve a lawsuit, major investigation, or systemic safety issue
-    minor_incident_terms = [
-        'injured skier', 'injured snowboarder', 'ski accident', 'snowboard accident',
-        'tree well', 'out of bounds', 'off-piste', 'lost skier',
-        'trail closed', 'run closed', 'lift closed', 'chairlift evacuation',
-        'chair evacuation', 'stuck on lift', 'stranded on lift',
-        'caught in avalanche', 'buried in avalanche', 'avalanche victim',
-        'skier dies', 'snowboarder dies', 'skier killed', 'snowboarder killed',
-        'skier death', 'snowboarder death', 'fatal ski', 'fatal snowboard',
-        'collision on', 'crash on slope', 'helmet cam crash',
-    ]
-    # Only penalize if no systemic/business angle
-    systemic_safety_terms = [
-        'lawsuit', 'litigation', 'negligence', 'investigation', 'osha',
-        'safety record', 'safety review', 'pattern of', 'systemic',
-        'policy change', 'insurance', 'liability', 'class action',
-        'regulatory', 'fine', 'penalty', 'settlement',
-    ]
-    has_minor_incident = any(term in text for term in minor_incident_terms)
-    has_systemic_angle = any(term in text for term in systemic_safety_terms)
+    # Minor incident penalty - only if no systemic/business angle
+    has_minor_incident = not text_hits.isdisjoint(MINOR_INCIDENT_TERMS)
+    has_systemic_angle = not text_hits.isdisjoint(SYSTEMIC_SAFETY_TERMS)
     if has_minor_incident and not has_systemic_angle:
         score -= 3
 
     # Dashboard indicator boost - articles about metrics we track get a relevance bump
-    dashboard_indicators = {
-        # Economic indicators tracked on dashboard
-        'consumer confidence': 2, 'consumer sentiment': 2, 'consumer spending': 2,
-        'personal savings rate': 2, 'discretionary spending': 2,
-        'inflation rate': 2, 'cpi': 2, 'consumer price index': 2,
-        'unemployment rate': 2, 'jobs report': 2, 'nonfarm payrolls': 2,
-        'wage growth': 2, 'interest rate': 2, 'federal reserve': 2,
-        'rate cut': 2, 'rate hike': 2, 'gdp growth': 2, 'recession': 2,
-        # Energy/commodity indicators
-        'oil price': 2, 'crude oil': 2, 'gasoline price': 2, 'gas prices': 2,
-        'natural gas price': 2, 'energy prices': 2,
-        # Market indicators
-        'stock market': 1, 's&p 500': 1, 'sp 500': 1,
-        # Currency indicators
-        'exchange rate': 2, 'strong dollar': 2, 'weak dollar': 2, 'canadian dollar': 2,
-    }
     dashboard_boost = 0
-    for indicator, boost_val in dashboard_indicators.items():
-        if indicator in title:
+    for indicator, boost_val in DASHBOARD_INDICATORS.items():
+        if indicator in title_hits:
             dashboard_boost = max(dashboard_boost, boost_val + 1)  # Title match gets extra
-        elif indicator in text:
+        elif indicator in text_hits:
             dashboard_boost = max(dashboard_boost, boost_val)
     if dashboard_boost > 0:
         score += dashboard_boost
@@ -1735,9 +2380,9 @@ def basic_keyword_score(article):
     if FOCUS_TOPICS:
         for topic, boost_value in FOCUS_TOPICS.items():
             topic_lower = topic.lower()
-            if topic_lower in title:
+            if topic_lower in title_hits:
                 focus_boost = max(focus_boost, boost_value + 1)  # Title match gets +1
-            elif topic_lower in text:
+            elif topic_lower in text_hits:
                 focus_boost = max(focus_boost, boost_value)
         if focus_boost > 0:
             score += focus_boost
@@ -1751,13 +2396,10 @@ def basic_keyword_score(article):
     return max(1, min(10, score)), {"reason": reason, "method": "keyword"}
 
 
-def score_with_llm(article):
-    """Score article using Claude API with optimized prompt."""
-    if not ANTHROPIC_API_KEY:
-        return None, {"reason": "No API key", "method": "llm_failed"}
-
+def build_llm_prompt(article):
+    """Build the scoring prompt for an article."""
     # Optimized prompt from improvement spec
-    prompt = f"""Rate this ski industry article for a resort executive audience.
+    return f"""Rate this ski industry article for a resort executive audience.
 
 ARTICLE:
 Title: {article.get('title', 'No title')}
@@ -1783,51 +2425,362 @@ Output JSON only:
 Categories: resort-operations, business-investment, weather-snow, transportation,
 winter-sports, safety-incidents, canada, international, ski-history, hospitality"""
 
-    try:
-        data = json.dumps({
-            "model": "claude-haiku-4-5-20251001",
-            "max_tokens": 150,
-            "messages": [{"role": "user", "content": prompt}]
-        }).encode('utf-8')
-
-        req = urllib.request.Request(
-            'https://api.anthropic.com/v1/messages',
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'x-api-key': ANTHROPIC_API_KEY,
-                'anthropic-version': '2023-06-01'
-            }
-        )
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode())
+def llm_cache_key(prompt, model=LLM_MODEL):
+    """Cache key for an LLM score: hash of model, max_tokens and prompt (which embeds the article text)."""
+    return hashlib.sha1(json.dumps([model, LLM_MAX_TOKENS, prompt]).encode('utf-8')).hexdigest()
+
+
+def parse_llm_response(content):
+    """
+    Parse the JSON score object from a response text.
+
+    Returns:
+        (score, details) tuple, or None if no JSON object was found
+    """
+    json_match = re.search(r'\{[^}]+\}', content)
+    if json_match:
+        scores = json.loads(json_match.group())
+        return scores.get('score', 5), {
+            "reason": scores.get('reason', 'LLM scored'),
+            "category": scores.get('category'),
+            "method": "llm"
+        }
+    return None
+
+
+def make_token_bucket(requests_per_minute, burst):
+    """Token bucket state for take_token: refills requests_per_minute tokens a minute, holds up to burst."""
+    return {
+        'rate': requests_per_minute / 60.0,
+        'capacity': burst,
+        'tokens': float(burst),
+        'updated': time.monotonic(),
+        'lock': threading.Lock(),
+    }
+
+
+def take_token(bucket):
+    """Take one token from a token bucket, sleeping until one is available."""
+    while True:
+        with bucket['lock']:
+            now = time.monotonic()
+            bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['updated'] = now
+            if bucket['tokens'] >= 1:
+                bucket['tokens'] -= 1
+                return
+            wait = (1 - bucket['tokens']) / bucket['rate']
+        time.sleep(wait)
+
+
+def llm_message_params(prompt):
+    """Messages API request parameters for a scoring prompt."""
+    return {
+        "model": LLM_MODEL,
+        "max_tokens": LLM_MAX_TOKENS,
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+
+def llm_api_request(method, url, payload=None):
+    """
+    Send an authenticated request to the Anthropic API.
+
+    Returns:
+        Response dict from http_request (raises on HTTP errors)
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'x-api-key': ANTHROPIC_API_KEY,
+        'anthropic-version': '2023-06-01'
+    }
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    return http_request(method, url, body=data, headers=headers, timeout=30, max_per_host=LLM_MAX_IN_FLIGHT)
+
+
+def request_llm_score(prompt, bucket=None):
+    """
+    Send one scoring request to the messages endpoint.
+
+    Rate-limited (429) and overloaded (5xx) responses are retried up to
+    LLM_MAX_RETRIES times, honouring retry-after.
+
+    Returns:
+        (score, details) tuple; score is None if the request failed
+    """
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        if bucket is not None:
+            take_token(bucket)
+        try:
+            response = llm_api_request('POST', ANTHROPIC_API_URL, llm_message_params(prompt))
+            result = json.loads(response['body'].decode())
             content = result['content'][0]['text']
 
-            # Parse JSON from response
-            json_match = re.search(r'\{[^}]+\}', content)
-            if json_match:
-                scores = json.loads(json_match.group())
-                return scores.get('score', 5), {
-                    "reason": scores.get('reason', 'LLM scored'),
-                    "category": scores.get('category'),
-                    "method": "llm"
-                }
+            parsed = parse_llm_response(content)
+            if parsed:
+                return parsed
+            break
+
+        except urllib.error.HTTPError as e:
+            if (e.code == 429 or e.code >= 500) and attempt < LLM_MAX_RETRIES:
+                try:
+                    delay = float(e.headers.get('retry-after', 2 ** attempt))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                time.sleep(min(delay, 60))
+                continue
+            error_body = e.read().decode('utf-8', errors='replace')
+            print_safe(f"    ! Claude API error: {e}")
+            print_safe(f"    ! Error details: {error_body[:200]}")
+            break
+        except Exception as e:
+            print_safe(f"    ! Claude API error: {e}")
+            break
+
+    return None, {"reason": "API error", "method": "llm_failed"}
+
+
+def score_with_llm(article, llm_cache=None, bucket=None):
+    """
+    Score article using Claude API with optimized prompt.
+
+    Args:
+        article: Article dict
+        llm_cache: Dict of cache key -> stored score (from load_llm_cache);
+            hits skip the request and successful scores are added
+        bucket: Token bucket (make_token_bucket) to rate-limit requests
+
+    Returns:
+        (score, details) tuple; score is None on failure
+    """
+    if not ANTHROPIC_API_KEY:
+        return None, {"reason": "No API key", "method": "llm_failed"}
+
+    prompt = build_llm_prompt(article)
+    key = llm_cache_key(prompt)
+    if llm_cache is not None and key in llm_cache:
+        return cached_llm_score(llm_cache[key])
+
+    score, details = request_llm_score(prompt, bucket)
+    if score is not None and llm_cache is not None:
+        llm_cache[key] = llm_cache_entry(score, details)
+    return score, details
+
+
+def cached_llm_score(entry):
+    """(score, details) tuple for an llm_cache entry."""
+    return entry['score'], {"reason": entry['reason'], "category": entry['category'], "method": "llm"}
+
+
+def llm_cache_entry(score, details):
+    """llm_cache entry for a successful (score, details) result."""
+    return {
+        'score': score,
+        'reason': details['reason'],
+        'category': details['category'],
+        'date': datetime.now().strftime('%Y-%m-%d'),
+    }
+
+
+def score_articles_with_llm(articles, llm_cache=None, batch=False, max_in_flight=LLM_MAX_IN_FLIGHT,
+                            requests_per_minute=LLM_REQUESTS_PER_MINUTE):
+    """
+    Score articles with the LLM, concurrently or as one Message Batch.
+
+    Cached scores return without a request. The rest go out as concurrent
+    messages requests (at most max_in_flight outstanding, with a token
+    bucket bursting to max_in_flight keeping the rate under
+    requests_per_minute), or as a single batch job if batch is True - or,
+    when batch is None, if LLM_BATCH_MIN_ARTICLES is set and at least that
+    many are uncached.
+
+    Returns:
+        List of (score, details) tuples in the order of articles
+    """
+    if llm_cache is None:
+        llm_cache = {}
+    start = time.perf_counter()
+    results = [None] * len(articles)
+    keys = []
+    prompts = {}
+    for i, article in enumerate(articles):
+        prompt = build_llm_prompt(article)
+        key = llm_cache_key(prompt)
+        keys.append(key)
+        if key in llm_cache:
+            results[i] = cached_llm_score(llm_cache[key])
+        else:
+            prompts[key] = prompt
+    cached = sum(1 for result in results if result is not None)
+
+    if batch is None:
+        batch = bool(LLM_BATCH_MIN_ARTICLES) and len(prompts) >= LLM_BATCH_MIN_ARTICLES
+
+    if batch and prompts:
+        batch_results = run_llm_batch(prompts)
+        for key, (score, details) in batch_results.items():
+            llm_cache[key] = llm_cache_entry(score, details)
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                results[i] = batch_results.get(key, (None, {"reason": "Batch request failed", "method": "llm_failed"}))
+    elif prompts:
+        bucket = make_token_bucket(requests_per_minute, max_in_flight)
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+            futures = {
+                executor.submit(score_with_llm, article, llm_cache, bucket): i
+                for i, article in enumerate(articles) if results[i] is None
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    failed = sum(1 for score, _ in results if score is None)
+    print_safe(f"LLM scoring{' (batch)' if batch and prompts else ''}: {len(articles)} articles, "
+               f"{cached} cached, {len(articles) - cached - failed} scored, {failed} failed "
+               f"({time.perf_counter() - start:.1f}s)")
+    return results
+
+
+def run_llm_batch(prompts, poll_seconds=LLM_BATCH_POLL_SECONDS, timeout_minutes=LLM_BATCH_TIMEOUT_MINUTES):
+    """
+    Score prompts as one Message Batches job, polling until it ends.
+
+    A batch still running after timeout_minutes is cancelled; its prompts
+    are left unscored (callers fall back to keyword scoring).
+
+    Args:
+        prompts: Dict of llm_cache_key -> prompt (keys are the batch custom_ids)
+
+    Returns:
+        Dict of key -> (score, details) for the requests that succeeded
+    """
+    batches_url = ANTHROPIC_API_URL.rstrip('/') + '/batches'
+    scores = {}
+    try:
+        response = llm_api_request('POST', batches_url, {
+            'requests': [
+                {'custom_id': key, 'params': llm_message_params(prompt)}
+                for key, prompt in prompts.items()
+            ]
+        })
+        batch = json.loads(response['body'].decode())
+        print_safe(f"  LLM batch {batch['id']}: {len(prompts)} requests submitted")
+
+        deadline = time.monotonic() + timeout_minutes * 60
+        while batch.get('processing_status') != 'ended':
+            if time.monotonic() >= deadline:
+                print_safe(f"  ! LLM batch {batch['id']} still running after {timeout_minutes} min, cancelling")
+                llm_api_request('POST', f"{batches_url}/{batch['id']}/cancel")
+                return scores
+            time.sleep(poll_seconds)
+            batch = json.loads(llm_api_request('GET', f"{batches_url}/{batch['id']}")['body'].decode())
+
+        # Results are JSONL, one line per request, in no particular order.
+        # A malformed line only loses that request's score.
+        results_body = llm_api_request('GET', batch['results_url'])['body'].decode('utf-8')
+        for line in results_body.splitlines():
+            if not line.strip():
+                continue
+            custom_id = None
+            try:
+                entry = json.loads(line)
+                custom_id = entry.get('custom_id')
+                result = entry.get('result', {})
+                if result.get('type') != 'succeeded':
+                    continue
+                parsed = parse_llm_response(result['message']['content'][0]['text'])
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                print_safe(f"    ! Skipping unparseable batch result {custom_id or line[:60]}: {e}")
+                continue
+            if parsed and custom_id:
+                scores[custom_id] = parsed
+
+        counts = batch.get('request_counts', {})
+        print_safe(f"  LLM batch {batch['id']}: {counts.get('succeeded', len(scores))} succeeded, "
+                   f"{counts.get('errored', 0)} errored, {counts.get('expired', 0)} expired")
 
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8', errors='replace')
-        print_safe(f"    ! Claude API error: {e}")
+        print_safe(f"    ! Claude batch API error: {e}")
         print_safe(f"    ! Error details: {error_body[:200]}")
     except Exception as e:
-        print_safe(f"    ! Claude API error: {e}")
+        print_safe(f"    ! Claude batch API error: {e}")
+
+    return scores
 
-    return None, {"reason": "API error", "method": "llm_failed"}
+
+def rescore_review_queue(batch=None):
+    """
+    Re-score every pending article in the review queue with the LLM and
+    merge the scores, categories and reasons back into the queue.
+
+    Articles whose request fails keep their previous score. batch=True
+    submits one Message Batch; None uses a batch only for queues of at
+    least LLM_BATCH_MIN_ARTICLES uncached articles (see
+    score_articles_with_llm).
+
+    Returns:
+        Number of articles re-scored
+    """
+    queue = load_review_queue()
+    pending = queue.get('pending', [])
+    llm_cache = load_llm_cache()
+    results = score_articles_with_llm(pending, llm_cache, batch=batch)
+    save_llm_cache(llm_cache)
+
+    rescored = 0
+    for article, (score, details) in zip(pending, results):
+        if score is None:
+            continue
+        article['score'] = score
+        article['score_details'] = details
+        article['score_method'] = details.get('method', 'llm')
+        primary, secondary = assign_categories_v2(article, details.get('category'))
+        article['category'] = primary
+        article['secondary_categories'] = secondary
+        rescored += 1
+
+    save_review_queue(queue)
+    print_safe(f"Re-scored {rescored} of {len(pending)} pending articles")
+    return rescored
 
 
-def score_article(article):
-    """Score article using configured method (LLM or keyword)."""
+def load_llm_cache(max_age_days=LLM_CACHE_DAYS):
+    """
+    Load cached LLM scores, skipping entries older than max_age_days.
+
+    Returns:
+        Dict of cache key (llm_cache_key) -> {'score', 'reason', 'category', 'date'}
+    """
+    if os.path.exists(LLM_CACHE_PATH):
+        try:
+            with open(LLM_CACHE_PATH, 'r', encoding='utf-8') as f:
+                scores = json.load(f).get('scores', {})
+            cutoff_date = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+            return {key: entry for key, entry in scores.items() if entry.get('date', '') >= cutoff_date}
+        except (OSError, ValueError, AttributeError):
+            pass
+    return {}
+
+
+def save_llm_cache(llm_cache, max_age_days=LLM_CACHE_DAYS):
+    """Save cached LLM scores, dropping entries older than max_age_days."""
+    cutoff_date = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+    scores = {key: entry for key, entry in llm_cache.items() if entry.get('date', '') >= cutoff_date}
+
+    os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+    tmp_path = LLM_CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'scores': scores}, f)
+    os.replace(tmp_path, LLM_CACHE_PATH)
+
+
+def score_article(article, llm_result=None):
+    """Score article using configured method (LLM or keyword).
+    llm_result is a (score, details) result already fetched by score_articles_with_llm.
+    """
     if ENABLE_LLM_SCORING and ANTHROPIC_API_KEY:
-        score, details = score_with_llm(article)
+        score, details = llm_result if llm_result is not None else score_with_llm(article)
         if score is not None:
             return score, details
         # Fall back to keyword scoring if LLM fails
@@ -1836,19 +2789,120 @@ def score_article(article):
     return basic_keyword_score(article)
 
 
+# =============================================================================
+# ARTICLE FEATURE RECORDS
+# =============================================================================
+# What rescoring and display scoring read from an article's text (pattern
+# hits, content length), kept per article id in a sidecar so the retained
+# feed is not rescanned every run. A record is reused while the article's
+# text hash matches; the whole file is dropped when the patterns change.
+
+ARTICLE_FEATURES_PATH = os.path.join(NEWS_CACHE_DIR, 'article-features.json')
+ARTICLE_FEATURES_VERSION = hashlib.sha1(json.dumps([
+    PROMOTIONAL_PATTERNS, PROMOTIONAL_EXCEPTIONS,
+    CONSUMER_CONTENT_PATTERNS, CONSUMER_CONTENT_EXCEPTIONS,
+    ANALYTICAL_CONTENT_PATTERNS,
+]).encode('utf-8')).hexdigest()[:16]
+
+
+def article_text_hash(article):
+    """Hash of the title, description and content an article is scored on."""
+    text = '\x1f'.join(f"{article.get(field, '')}" for field in ('title', 'description', 'content'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def article_features(article, feature_records=None):
+    """
+    Get an article's feature record, reusing a stored one if its text is unchanged.
+
+    Args:
+        article: Article dict
+        feature_records: Dict of article id -> record (from load_article_features);
+            new or recomputed records are stored in it
+
+    Returns:
+        Dict with 'text_hash', 'content_length' and 'patterns'
+        (article_pattern_hits)
+    """
+    text_hash = article_text_hash(article)
+    if feature_records is not None:
+        record = feature_records.get(article.get('id'))
+        if record is not None and record['text_hash'] == text_hash:
+            return record
+
+    title = article.get('title', '')
+    text = f"{title} {article.get('description', '')} {article.get('content', '')}".lower()
+    record = {
+        'text_hash': text_hash,
+        'content_length': len(article.get('content', '')),
+        'patterns': article_pattern_hits(text, title.lower()),
+    }
+    if feature_records is not None and article.get('id'):
+        feature_records[article['id']] = record
+    return record
+
+
+def load_article_features():
+    """
+    Load the article feature sidecar.
+
+    Returns:
+        Dict of article id -> feature record; empty if the file is missing or
+        was built with other patterns
+    """
+    if os.path.exists(ARTICLE_FEATURES_PATH):
+        try:
+            with open(ARTICLE_FEATURES_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == ARTICLE_FEATURES_VERSION:
+                for record in data['articles'].values():
+                    record['patterns'] = {
+                        name: frozenset(hits) if isinstance(hits, list) else hits
+                        for name, hits in record['patterns'].items()
+                    }
+                return data['articles']
+        except (OSError, ValueError, KeyError):
+            pass
+    return {}
+
+
+def save_article_features(feature_records, articles):
+    """Save the feature records of the given articles (the published feed)."""
+    records = {}
+    for article in articles:
+        record = feature_records.get(article.get('id'))
+        if record is None:
+            continue
+        records[article['id']] = {
+            'text_hash': record['text_hash'],
+            'content_length': record['content_length'],
+            'patterns': {
+                name: sorted(hits) if isinstance(hits, frozenset) else hits
+                for name, hits in record['patterns'].items()
+            },
+        }
+
+    os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+    tmp_path = ARTICLE_FEATURES_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': ARTICLE_FEATURES_VERSION, 'articles': records}, f)
+    os.replace(tmp_path, ARTICLE_FEATURES_PATH)
+
+
 # =============================================================================
 # DATA PERSISTENCE
 # =============================================================================
 
-def rescore_article(article):
+def rescore_article(article, features=None):
     """Re-score an existing article with current penalty patterns.
+    features (from article_features) is computed if not passed.
     Returns new score.
     """
-    text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}".lower()
-    title = article.get('title', '').lower()
+    if features is None:
+        features = article_features(article)
 
     # Apply new consumer content penalties
-    penalty = apply_contextual_penalties(text, title)
+    penalty = contextual_penalty(features['patterns'])
 
     # If penalty is severe enough, demote the article
     old_score = article.get('score', 5)
@@ -1857,7 +2911,7 @@ def rescore_article(article):
     return new_score
 
 
-def compute_display_score(article):
+def compute_display_score(article, features=None):
     """Compute a display score for sorting articles in the feed.
 
     This determines the order articles appear, separate from their approval score.
@@ -1866,11 +2920,13 @@ def compute_display_score(article):
     - Premium source boost (NYT, WSJ, etc.)
     - Analytical content boost (in-depth analysis)
     - Category adjustments (safety incidents demoted from top)
+
+    features (from article_features) is computed if not passed.
     """
+    if features is None:
+        features = article_features(article)
     base_score = article.get('score', 5)
     source = article.get('source', '')
-    text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}".lower()
-    title = article.get('title', '').lower()
     category = article.get('category', '')
 
     display_score = base_score * 2  # Scale up base score for more differentiation
@@ -1880,11 +2936,7 @@ def compute_display_score(article):
         display_score += 8
 
     # Analytical content boost
-    for pattern, boost in ANALYTICAL_CONTENT_PATTERNS:
-        if re.search(pattern, title, re.IGNORECASE):
-            display_score += boost * 1.5  # Title matches weighted more
-        elif re.search(pattern, text, re.IGNORECASE):
-            display_score += boost
+    display_score += analytical_boost(features['patterns'])
 
     # Category-based display adjustments
     if category in DISPLAY_DEMOTED_CATEGORIES:
@@ -1899,7 +2951,7 @@ def compute_display_score(article):
         display_score += CONSUMER_SOURCE_DISPLAY_PENALTY
 
     # Content length bonus (longer = more analytical, usually)
-    content_length = len(article.get('content', ''))
+    content_length = features['content_length']
     if content_length > 800:
         display_score += 2
     if content_length > 1500:
@@ -1909,8 +2961,31 @@ def compute_display_score(article):
     return display_score
 
 
-def load_existing_articles():
-    """Load existing articles, re-score them with current patterns, and purge low-quality ones."""
+def analytical_boost(pattern_hits):
+    """
+    Display score boost from ANALYTICAL_CONTENT_PATTERNS.
+
+    Args:
+        pattern_hits: From article_pattern_hits
+
+    Returns:
+        Boost (title matches weighted 1.5x)
+    """
+    boost_total = 0
+    title_hits = pattern_hits['analytical_title']
+    text_hits = pattern_hits['analytical_text']
+    for i, (_, boost) in enumerate(ANALYTICAL_CONTENT_PATTERNS):
+        if i in title_hits:
+            boost_total += boost * 1.5  # Title matches weighted more
+        elif i in text_hits:
+            boost_total += boost
+    return boost_total
+
+
+def load_existing_articles(feature_records=None):
+    """Load existing articles, re-score them with current patterns, and purge low-quality ones.
+    feature_records (from load_article_features) lets unchanged articles skip rescanning.
+    """
     path = 'static/data/ski-news.json'
     if os.path.exists(path):
         try:
@@ -1926,7 +3001,7 @@ def load_existing_articles():
                         a['pub_date'] = parse_date(a['pub_date'])
 
                     # Re-score with current penalty patterns
-                    new_score = rescore_article(a)
+                    new_score = rescore_article(a, article_features(a, feature_records))
                     if new_score <= AUTO_REJECT_THRESHOLD:
                         # Article no longer meets quality threshold - purge it
                         purged_count += 1
@@ -2025,6 +3100,129 @@ def save_run_log(run_stats):
     print_safe(f"Run log saved: {path}")
 
 
+# =============================================================================
+# FEED FETCHING (concurrent, parsed as each body arrives)
+# =============================================================================
+
+def load_feed_state():
+    """Load the per-feed conditional GET state, keyed by feed URL."""
+    if os.path.exists(FEED_STATE_PATH):
+        try:
+            with open(FEED_STATE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def save_feed_state(feed_state, sources):
+    """Save the feed state, dropping feeds no longer in sources."""
+    urls = {source['url'] for source in sources}
+    feed_state = {url: entry for url, entry in feed_state.items() if url in urls}
+
+    os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+    tmp_path = FEED_STATE_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(feed_state, f)
+    os.replace(tmp_path, FEED_STATE_PATH)
+
+
+def fetch_and_parse_feed(source, state=None, stop=None):
+    """
+    Fetch one RSS source and parse it in the calling worker thread.
+
+    If state (the feed's entry from the last run) is given, the request is
+    conditional. A 304, or a body with the same hash, replays the articles
+    parsed last time instead of calling parse_rss_feed. stop is passed on
+    to parse_rss_feed to end parsing early.
+
+    Returns:
+        Dict with 'articles' (None on failure), 'latency_ms', 'bytes',
+        'error' (None on success), 'cached' ('not_modified', 'unchanged'
+        or None) and 'state' (the feed's new state entry, None on failure)
+    """
+    headers = {}
+    if state:
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+    start = time.perf_counter()
+    try:
+        response = http_get(source['url'], headers=headers)
+    except Exception as e:
+        return {'articles': None, 'latency_ms': round((time.perf_counter() - start) * 1000),
+                'bytes': 0, 'error': str(e)[:100], 'cached': None, 'state': None}
+
+    latency_ms = round((time.perf_counter() - start) * 1000)
+    result = {'latency_ms': latency_ms, 'bytes': len(response['body']), 'error': None}
+
+    if state and response['status'] == 304:
+        return {**result, 'articles': state['articles'], 'cached': 'not_modified', 'state': state}
+
+    body_hash = hashlib.sha1(response['body']).hexdigest()
+    if state and state.get('hash') == body_hash:
+        return {**result, 'articles': state['articles'], 'cached': 'unchanged', 'state': state}
+
+    articles = parse_rss_feed(response['body'].decode('utf-8', errors='replace'), source['name'], stop)
+    new_state = {
+        'etag': response['headers'].get('etag'),
+        'last_modified': response['headers'].get('last-modified'),
+        'hash': body_hash,
+        'item_ids': [a['id'] for a in articles],
+        'articles': articles,
+    }
+    return {**result, 'articles': articles, 'cached': None, 'state': new_state}
+
+
+def fetch_feeds(sources, feed_state=None, make_stop=None, max_workers=FETCH_MAX_WORKERS):
+    """
+    Fetch and parse RSS sources concurrently.
+
+    Requests are capped at max_workers overall and FETCH_MAX_PER_HOST per
+    host (see http_get), so one slow feed no longer holds up the rest.
+    SOURCE_HEALTH gets each feed's status, article count, latency and bytes.
+    If a feed_state dict (see load_feed_state) is passed, requests are
+    conditional and the dict is updated in place with each feed's new state.
+    make_stop, if given, is called once per feed to build its stop predicate
+    (see iter_rss_items).
+
+    Yields:
+        (source, result) in completion order, result as returned by
+        fetch_and_parse_feed
+    """
+    if feed_state is None:
+        feed_state = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_and_parse_feed, source, feed_state.get(source['url']),
+                            make_stop() if make_stop else None): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            result = future.result()
+            if result['articles'] is not None:
+                SOURCE_HEALTH[source['name']] = {
+                    'status': 'ok',
+                    'articles': len(result['articles']),
+                    'latency_ms': result['latency_ms'],
+                    'bytes': result['bytes']
+                }
+                if result['cached']:
+                    SOURCE_HEALTH[source['name']]['cached'] = result['cached']
+                feed_state[source['url']] = result['state']
+            else:
+                SOURCE_HEALTH[source['name']] = {
+                    'status': 'failed',
+                    'error': result['error'],
+                    'latency_ms': result['latency_ms']
+                }
+            yield source, result
+
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
@@ -2039,7 +3237,9 @@ def update_ski_news():
     print_safe("=" * 60)
 
     # Load existing data
-    existing_articles = load_existing_articles()
+    feature_records = load_article_features()
+    existing_articles = load_existing_articles(feature_records)
+    dedup_index = load_dedup_index()
     review_queue = load_review_queue()
     existing_ids = set(existing_articles.keys())
     existing_ids.update(a['id'] for a in review_queue.get('pending', []))
@@ -2053,22 +3253,38 @@ def update_ski_news():
     sources_failed = 0
 
     # Fetch from all sources
-    print_safe("\n--- Fetching RSS Feeds ---")
-    for source in RSS_SOURCES:
-        print_safe(f"\n{source['name']}...")
-        content = fetch_url(source['url'])
-        if content:
-            articles = parse_rss_feed(content, source['name'])
+    print_safe(f"\n--- Fetching RSS Feeds ({len(RSS_SOURCES)} sources, {FETCH_MAX_WORKERS} workers) ---")
+    fetch_start = time.perf_counter()
+    feed_state = load_feed_state()
+    feed_articles = {}
+    sources_cached = 0
+    # Stop reading a feed after a run of already-seen or expired items
+    def make_stop():
+        return stop_after_known(existing_ids)
+
+    for source, result in fetch_feeds(RSS_SOURCES, feed_state, make_stop):
+        articles = result['articles']
+        if articles is not None:
             new_articles = [a for a in articles if a.get('id') not in existing_ids]
-            print_safe(f"  Found {len(articles)} articles, {len(new_articles)} new")
-            all_articles.extend(new_articles)
-            SOURCE_HEALTH[source['name']] = {'status': 'ok', 'articles': len(articles)}
+            cached_note = f", {result['cached'].replace('_', ' ')}" if result['cached'] else ''
+            print_safe(f"{source['name']}: {len(articles)} articles, {len(new_articles)} new "
+                       f"({result['latency_ms']}ms, {result['bytes'] // 1024}KB{cached_note})")
+            if result['cached']:
+                sources_cached += 1
+            feed_articles[source['name']] = new_articles
             sources_ok += 1
         else:
-            print_safe(f"  ! Failed to fetch")
-            SOURCE_HEALTH[source['name']] = {'status': 'failed'}
+            print_safe(f"{source['name']}: ! Failed to fetch ({result['error']})")
             sources_failed += 1
 
+    # Keep source order so later stable sorts don't depend on fetch timing
+    for source in RSS_SOURCES:
+        all_articles.extend(feed_articles.get(source['name'], []))
+    print_safe(f"Fetched feeds in {time.perf_counter() - fetch_start:.1f}s ({sources_cached} served from cache)")
+
+    # Saved before scoring adds fields to the article dicts
+    save_feed_state(feed_state, RSS_SOURCES)
+
     # Fetch from HTML sources (non-RSS)
     print_safe("\n--- Fetching HTML Sources ---")
     print_safe("\nRopeways.net (HTML scraper)...")
@@ -2108,7 +3324,9 @@ def update_ski_news():
     # Stage 1.5: Historical deduplication against existing feed
     # This prevents old topics from reappearing when new sources cover the same story
     print_safe(f"\n--- Stage 1.5: Historical Deduplication ---")
-    prefiltered = deduplicate_against_existing(prefiltered, existing_articles)
+    added, removed = sync_dedup_index(dedup_index, existing_articles)
+    print_safe(f"Dedup index: {len(dedup_index['articles'])} recent articles (+{added} indexed, -{removed} expired)")
+    prefiltered = deduplicate_against_existing(prefiltered, existing_articles, dedup_index=dedup_index)
     print_safe(f"After historical dedup: {len(prefiltered)} articles")
 
     # Prioritize by business score and source
@@ -2154,11 +3372,20 @@ def update_ski_news():
     # Stage 2: Score and categorize
     print_safe(f"\n--- Stage 2: Scoring Top {min(len(diversity_filtered), MAX_PER_RUN)} Articles ---")
 
+    to_score = diversity_filtered[:MAX_PER_RUN]  # Process up to MAX_PER_RUN per run
+
+    # LLM requests go out concurrently up front; the loop below uses the results
+    llm_results = [None] * len(to_score)
+    if ENABLE_LLM_SCORING and ANTHROPIC_API_KEY and to_score:
+        llm_cache = load_llm_cache()
+        llm_results = score_articles_with_llm(to_score, llm_cache)
+        save_llm_cache(llm_cache)
+
     scored_articles = []
-    for i, article in enumerate(diversity_filtered[:MAX_PER_RUN]):  # Process up to MAX_PER_RUN per run
-        print_safe(f"\n[{i+1}/{min(len(diversity_filtered), MAX_PER_RUN)}] {article.get('title', 'No title')[:55]}...")
+    for i, article in enumerate(to_score):
+        print_safe(f"\n[{i+1}/{len(to_score)}] {article.get('title', 'No title')[:55]}...")
 
-        score, details = score_article(article)
+        score, details = score_article(article, llm_results[i])
 
         article['score'] = score if score else 5
         article['score_details'] = details
@@ -2205,7 +3432,7 @@ def update_ski_news():
     # Compute display scores for all articles
     print_safe(f"\n--- Computing Display Scores ---")
     for article in existing_articles.values():
-        compute_display_score(article)
+        compute_display_score(article, article_features(article, feature_records))
 
     # Sort by display_score (primary), then by pub_date (secondary)
     # This ensures high-quality analytical content appears at the top
@@ -2255,6 +3482,11 @@ def update_ski_news():
     # Save review queue
     save_review_queue({'pending': pending, 'rejected': rejected})
 
+    # Index the published feed (new approvals in, dropped/expired out) for the next run
+    sync_dedup_index(dedup_index, {a['id']: a for a in sorted_articles})
+    save_dedup_index(dedup_index)
+    save_article_features(feature_records, sorted_articles)
+
     # Save source health
     save_source_health()
 
@@ -2263,7 +3495,8 @@ def update_ski_news():
         'sources': {
             'total': len(RSS_SOURCES) + 1,  # +1 for ropeways.net
             'ok': sources_ok,
-            'failed': sources_failed
+            'failed': sources_failed,
+            'cached': sources_cached
         },
         'articles': {
             'fetched': len(all_articles),
@@ -2300,7 +3533,7 @@ def update_ski_news():
     print_safe(f"Total approved articles: {len(sorted_articles)}")
     print_safe(f"Pending review: {len(pending)}")
     print_safe(f"Rejected: {len(rejected)}")
-    print_safe(f"Sources OK: {sources_ok}, Failed: {sources_failed}")
+    print_safe(f"Sources OK: {sources_ok}, Failed: {sources_failed}, Cached: {sources_cached}")
     print_safe(f"\nOutput: {output_path}")
     print_safe("=" * 60)
 
@@ -2312,6 +3545,16 @@ def update_ski_news():
 # =============================================================================
 
 if __name__ == '__main__':
+    # --rescore-queue: re-score the pending review queue with the LLM
+    # (--batch / --no-batch force the mode, otherwise batch_min_articles decides)
+    if '--rescore-queue' in sys.argv:
+        if not ANTHROPIC_API_KEY:
+            print_safe("ERROR: ANTHROPIC_API_KEY not set")
+            sys.exit(1)
+        batch = True if '--batch' in sys.argv else False if '--no-batch' in sys.argv else None
+        rescore_review_queue(batch)
+        sys.exit(0)
+
     if ENABLE_LLM_SCORING:
         print_safe("LLM Scoring ENABLED (Claude Haiku)")
         if not ANTHROPIC_API_KEY:
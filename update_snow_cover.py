@@ -10,11 +10,13 @@ Fetches snow cover data from multiple real sources:
 - Copernicus CLMS Snow Cover Extent - Satellite-derived snow cover (via Sentinel Hub)
 - Environment Canada - Canadian city weather data
 - NWS Weather API - U.S. metro area conditions
+- Open-Meteo - metro temperatures and anomalies (batched multi-location requests)
 
 Outputs JSON for the snow cover dashboard.
 """
 
 import json
+import hashlib
 import time
 import os
 import sys
@@ -23,17 +25,26 @@ import urllib.request
 import urllib.error
 import urllib.parse
 import ssl
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timedelta
 from html import unescape
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
 # Import IMS data fetcher for real Canada snow cover
 from fetch_ims_snow_data import (
     fetch_ims_file,
     calculate_snow_cover_percentage,
-    get_metro_snow_cover,
+    compute_region_covers,
+    build_metro_index,
+    compute_metro_covers,
+    resolution_for_grid,
+    host_slot,
+    HOST_LIMITS,
     REGION_BOUNDS
 )
+from fetch_nohrsc_archive import fetch_nohrsc_day, CACHE_STATS as NOHRSC_CACHE_STATS
 
 # ============================================
 # Configuration
@@ -57,6 +68,52 @@ COPERNICUS_SCE_COLLECTION = 'byoc-f80367ae-2de4-4acf-9e08-f49ecee95b99'  # SCE N
 USA_BBOX = [-125.0, 24.5, -66.5, 49.5]  # [west, south, east, north] - CONUS
 CANADA_BBOX = [-141.0, 41.7, -52.6, 83.1]  # Canada full extent
 
+# Concurrent lookups in collect_snow_data (national sources, metros, prior year)
+COLLECT_WORKERS = 16
+
+# Per-host politeness limits for fetch_url/fetch_binary: (max concurrent requests,
+# min seconds between request starts). Open-Meteo is free but has soft limits.
+SOURCE_HOST_LIMITS = {
+    'api.weather.gov': (4, 0.1),
+    'dd.weather.gc.ca': (4, 0.05),
+    'api.open-meteo.com': (2, 0.15),
+    'archive-api.open-meteo.com': (2, 0.15),
+    'www.nohrsc.noaa.gov': (4, 0.1),
+}
+HOST_LIMITS.update(SOURCE_HOST_LIMITS)
+
+# Open-Meteo takes comma-separated coordinate lists; locations per request
+OPENMETEO_FORECAST_URL = 'https://api.open-meteo.com/v1/forecast'
+OPENMETEO_ARCHIVE_URL = 'https://archive-api.open-meteo.com/v1/archive'
+OPENMETEO_MAX_LOCATIONS = 50
+
+# Local cache for derived data (Open-Meteo normals)
+SNOW_CACHE_DIR = os.environ.get(
+    'SNOW_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'snow-cover')
+)
+OPENMETEO_NORMALS_PATH = os.path.join(SNOW_CACHE_DIR, 'openmeteo-normals.json')
+OPENMETEO_NORMALS_VERSION = 1
+OPENMETEO_NORMALS_KEEP_DAYS = 7
+
+# Daily metro temperature history. New days are appended to a local columnar
+# store (one .npz per year plus a metros.json index) and the committed site
+# JSON is exported from it. The store is a cache: it is rebuilt from the JSON
+# when missing or when the JSON no longer matches what it last exported.
+TEMPERATURE_HISTORY_JSON = 'static/data/temperature-history.json'
+TEMPERATURE_STORE_DIR = os.environ.get(
+    'TEMPERATURE_STORE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'temperature-history')
+)
+TEMPERATURE_STORE_VERSION = 1
+TEMPERATURE_STORE_COLUMNS = {
+    'metro': np.int16,
+    'date': 'datetime64[D]',
+    'temp_c': np.float32,
+    'normal_c': np.float32,
+    'anomaly_c': np.float32,
+}
+
 # Province codes for Environment Canada
 PROVINCE_CODES = {
     'ON': 'ON',  # Ontario
@@ -223,7 +280,7 @@ def fetch_url(url, timeout=30, headers=None):
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
 
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
+        with host_slot(url), urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
             return response.read().decode('utf-8', errors='replace')
     except urllib.error.HTTPError as e:
         print_safe(f"  ! HTTP {e.code} fetching {url}")
@@ -253,7 +310,7 @@ def fetch_binary(url, timeout=60):
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
 
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
+        with host_slot(url), urllib.request.urlopen(req, timeout=timeout, context=ctx) as response:
             return response.read()
     except Exception as e:
         print_safe(f"  ! Error fetching binary {url}: {e}")
@@ -373,63 +430,11 @@ def fetch_nohrsc_historical(year, month, day):
     Fetch historical NOHRSC snow cover and depth for a specific date.
     Uses the NSA archive URL format: /nsa/index.html?year=YYYY&month=MM&day=DD
 
+    Past dates are served from the shared NOHRSC cache (fetch_nohrsc_archive).
+
     Returns dict with 'cover' and 'depth_inches', or None if not available.
     """
-    url = f"https://www.nohrsc.noaa.gov/nsa/index.html?year={year}&month={month}&day={day}"
-    content = fetch_url(url, timeout=15)
-
-    result = {'cover': None, 'depth_inches': None}
-
-    if content:
-        # Look for "Area Covered By Snow" pattern
-        match = re.search(
-            r'Area\s+Covered\s+By\s+Snow[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*%',
-            content, re.IGNORECASE
-        )
-        if match:
-            result['cover'] = float(match.group(1))
-        else:
-            # Fallback pattern
-            match = re.search(
-                r'Area\s+Covered[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*%',
-                content, re.IGNORECASE
-            )
-            if match:
-                result['cover'] = float(match.group(1))
-
-        # Look for average depth - format varies:
-        # Current page: "Average Snow Depth:</td><td...>X.X in</td>"
-        # Historical: "Snow Depth</th>...<tr><td>Average:</td><td>X.X in</td>"
-        depth_match = re.search(
-            r'(?:Average\s+)?Snow\s+Depth[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*in',
-            content, re.IGNORECASE
-        )
-        if depth_match:
-            result['depth_inches'] = float(depth_match.group(1))
-        else:
-            # Look for "Snow Depth" header followed by "Average:" row
-            depth_section = re.search(
-                r'Snow\s+Depth.*?Average[:\s]*</td>\s*<td[^>]*>\s*(\d+(?:\.\d+)?)\s*in',
-                content, re.IGNORECASE | re.DOTALL
-            )
-            if depth_section:
-                depth = float(depth_section.group(1))
-                if 0 < depth < 50:  # Reasonable average depth range
-                    result['depth_inches'] = depth
-            else:
-                # Fallback depth pattern
-                depth_fallback = re.search(
-                    r'Snow\s+Depth[^<]*<[^>]*>[^<]*(\d+(?:\.\d+)?)\s*in',
-                    content, re.IGNORECASE
-                )
-                if depth_fallback:
-                    depth = float(depth_fallback.group(1))
-                    if 0 < depth < 50:  # Reasonable average depth range
-                        result['depth_inches'] = depth
-
-    if result['cover'] is not None:
-        return result
-    return None
+    return fetch_nohrsc_day(year, month, day)
 
 
 def fetch_prior_year_history(current_history):
@@ -448,15 +453,20 @@ def fetch_prior_year_history(current_history):
     prior_history = []
     depth_values = []
 
-    for entry in current_history:
-        try:
-            # Parse current date and get same date last year
-            current_date = datetime.strptime(entry['date'], '%Y-%m-%d')
-            prior_date = current_date.replace(year=current_date.year - 1)
+    def fetch_prior(entry):
+        # Parse current date and get same date last year
+        current_date = datetime.strptime(entry['date'], '%Y-%m-%d')
+        prior_date = current_date.replace(year=current_date.year - 1)
+        return prior_date, fetch_nohrsc_historical(prior_date.year, prior_date.month, prior_date.day)
 
-            data = fetch_nohrsc_historical(
-                prior_date.year, prior_date.month, prior_date.day
-            )
+    # Dates are fetched concurrently (host_slot limits the load on NOHRSC)
+    # and reported in order
+    with ThreadPoolExecutor(max_workers=COLLECT_WORKERS) as executor:
+        futures = [executor.submit(fetch_prior, entry) for entry in current_history]
+
+    for entry, future in zip(current_history, futures):
+        try:
+            prior_date, data = future.result()
 
             if data is not None:
                 prior_history.append({
@@ -479,6 +489,8 @@ def fetch_prior_year_history(current_history):
                 'value': None
             })
 
+    print_safe(f"  NOHRSC cache: {NOHRSC_CACHE_STATS['hits']} hits, {NOHRSC_CACHE_STATS['fetched']} fetched")
+
     # Calculate average depth from prior year
     prior_depth_avg = None
     if depth_values:
@@ -895,37 +907,32 @@ def fetch_ims_snow_data():
         print_safe(f"  Trying {check_date.strftime('%Y-%m-%d')} (DOY {doy})...")
 
         grid = fetch_ims_file(year, doy)
-        if grid:
-            print_safe(f"  IMS grid loaded: {len(grid)}x{len(grid[0])}")
-
-            # Calculate USA snow cover
-            usa_bounds = REGION_BOUNDS.get('usa')
-            if usa_bounds:
-                usa_stats = calculate_snow_cover_percentage(grid, usa_bounds)
-                if usa_stats:
-                    result['usa_cover'] = usa_stats['cover']
-                    print_safe(f"  USA cover: {usa_stats['cover']}% ({usa_stats['snow_cells']:,} snow / {usa_stats['land_cells']:,} land)")
-
-            # Calculate Canada snow cover - THIS IS THE REAL DATA
-            canada_bounds = REGION_BOUNDS.get('canada')
-            if canada_bounds:
-                canada_stats = calculate_snow_cover_percentage(grid, canada_bounds)
-                if canada_stats:
-                    result['canada_cover'] = canada_stats['cover']
-                    print_safe(f"  Canada cover: {canada_stats['cover']}% ({canada_stats['snow_cells']:,} snow / {canada_stats['land_cells']:,} land)")
-
-            # Calculate regional breakdowns
+        if grid is not None:
+            print_safe(f"  IMS grid loaded: {grid.shape[0]}x{grid.shape[1]}")
+
+            # USA, Canada and all regional breakdowns in one pass over the grid
             regional_keys = [
                 'rocky_mountain', 'pacific_northwest', 'pacific_southwest',
                 'midwest', 'northeast', 'southeast',
                 'british_columbia', 'alberta', 'ontario', 'quebec', 'atlantic'
             ]
+            covers = compute_region_covers(grid, ['usa', 'canada'] + regional_keys)
+
+            usa_stats = covers.get('usa')
+            if usa_stats:
+                result['usa_cover'] = usa_stats['cover']
+                print_safe(f"  USA cover: {usa_stats['cover']}% ({usa_stats['snow_cells']:,} snow / {usa_stats['land_cells']:,} land)")
+
+            # Canada snow cover - THIS IS THE REAL DATA
+            canada_stats = covers.get('canada')
+            if canada_stats:
+                result['canada_cover'] = canada_stats['cover']
+                print_safe(f"  Canada cover: {canada_stats['cover']}% ({canada_stats['snow_cells']:,} snow / {canada_stats['land_cells']:,} land)")
+
             for region_key in regional_keys:
-                bounds = REGION_BOUNDS.get(region_key)
-                if bounds:
-                    stats = calculate_snow_cover_percentage(grid, bounds)
-                    if stats:
-                        result['regions'][region_key] = stats['cover']
+                stats = covers.get(region_key)
+                if stats:
+                    result['regions'][region_key] = stats['cover']
 
             result['date'] = check_date.strftime('%Y-%m-%d')
             return result
@@ -940,22 +947,18 @@ def fetch_ims_metro_snow_cover(grid, metros):
 
     Args:
         grid: IMS data grid
-        metros: List of metro dictionaries with lat/lng
+        metros: List of metro dictionaries with lat/lon
 
     Returns:
         Dict mapping metro city name to snow cover percentage
     """
-    metro_covers = {}
-
-    for metro in metros:
-        city = metro.get('city')
-        lat = metro.get('lat')
-        lng = metro.get('lng')
+    metro_index = build_metro_index(metros, resolution_for_grid(grid))
+    covers = compute_metro_covers(grid, metro_index, radii_km=(50,))
 
-        if city and lat and lng:
-            cover = get_metro_snow_cover(grid, lat, lng, radius_km=50)
-            if cover is not None:
-                metro_covers[city] = cover
+    metro_covers = {}
+    for city, cover in zip(metro_index['names'], covers[:, 0].tolist()):
+        if city and cover == cover:  # NaN = outside the grid
+            metro_covers[city] = cover
 
     return metro_covers
 
@@ -1127,74 +1130,161 @@ def fetch_nws_snow_data(lat, lon):
 # Open-Meteo Temperature Data
 # ============================================
 
-def fetch_openmeteo_temperature(lat, lon, city_name=None):
+def fetch_openmeteo_multi(base_url, locations, params, timeout=30):
     """
-    Fetch current temperature and historical normal from Open-Meteo API.
+    Query an Open-Meteo endpoint for many locations with comma-separated
+    latitude/longitude lists, OPENMETEO_MAX_LOCATIONS per request.
 
-    Returns dict with:
-    - temp_c: Current temperature in Celsius
-    - temp_f: Current temperature in Fahrenheit
-    - normal_c: 30-day historical average for this time of year
-    - anomaly_c: Departure from normal (temp_c - normal_c)
-    - anomaly_f: Departure from normal in Fahrenheit
+    Args:
+        base_url: Endpoint URL (forecast or archive)
+        locations: List of (lat, lon) tuples
+        params: Other query parameters (dict)
+
+    Returns:
+        List of per-location response dicts in location order (None for
+        locations whose request failed)
     """
-    result = {
+    responses = []
+    for i in range(0, len(locations), OPENMETEO_MAX_LOCATIONS):
+        chunk = locations[i:i + OPENMETEO_MAX_LOCATIONS]
+        query = {
+            'latitude': ','.join(str(lat) for lat, _ in chunk),
+            'longitude': ','.join(str(lon) for _, lon in chunk),
+        }
+        query.update(params)
+        data = fetch_json(f"{base_url}?{urllib.parse.urlencode(query, safe=',')}", timeout=timeout)
+
+        # A single location comes back as an object, several as a list
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list) or len(data) != len(chunk):
+            if data is not None:
+                print_safe(f"  ! Open-Meteo returned {len(data) if isinstance(data, list) else 'no'} results for {len(chunk)} locations")
+            data = [None] * len(chunk)
+        responses.extend(data)
+    return responses
+
+
+def load_openmeteo_normals():
+    """Load cached Open-Meteo normals ({'lat,lon': {'YYYY-DDD': normal_c}})"""
+    try:
+        with open(OPENMETEO_NORMALS_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != OPENMETEO_NORMALS_VERSION:
+        return {}
+    return cache.get('normals', {})
+
+
+def save_openmeteo_normals(normals, today):
+    """Save cached normals, dropping days older than OPENMETEO_NORMALS_KEEP_DAYS"""
+    oldest = (today - timedelta(days=OPENMETEO_NORMALS_KEEP_DAYS)).strftime('%Y-%j')
+    pruned = {}
+    for key, days in normals.items():
+        kept = {day: value for day, value in days.items() if day >= oldest}
+        if kept:
+            pruned[key] = kept
+    try:
+        os.makedirs(SNOW_CACHE_DIR, exist_ok=True)
+        tmp_path = OPENMETEO_NORMALS_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': OPENMETEO_NORMALS_VERSION, 'normals': pruned}, f)
+        os.replace(tmp_path, OPENMETEO_NORMALS_PATH)
+    except OSError as e:
+        print_safe(f"  ! Could not save Open-Meteo normals cache: {e}")
+
+
+def fetch_metro_temperatures(locations, today=None):
+    """
+    Fetch current temperature and historical normal for many locations.
+
+    Current temperatures come from batched forecast requests. The "normal" is
+    the mean of the same 30-day window last year, from batched archive
+    requests; it only changes with the date, so it is cached per location and
+    day of year and only fetched for locations missing from the cache.
+
+    Args:
+        locations: List of (lat, lon) tuples
+        today: Date the normals are for (default: now)
+
+    Returns:
+        List of dicts in location order, each with:
+        - temp_c: Current temperature in Celsius
+        - temp_f: Current temperature in Fahrenheit
+        - normal_c: 30-day historical average for this time of year
+        - anomaly_c: Departure from normal (temp_c - normal_c)
+        - anomaly_f: Departure from normal in Fahrenheit
+    """
+    today = today or datetime.now()
+    results = [{
         'temp_c': None,
         'temp_f': None,
         'normal_c': None,
         'anomaly_c': None,
         'anomaly_f': None
-    }
-
-    try:
-        # Get current temperature
-        current_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m&temperature_unit=celsius&timezone=auto"
-        current_data = fetch_json(current_url, timeout=15)
-
+    } for _ in locations]
+
+    # Get current temperatures
+    current = fetch_openmeteo_multi(OPENMETEO_FORECAST_URL, locations, {
+        'current': 'temperature_2m',
+        'temperature_unit': 'celsius',
+        'timezone': 'auto',
+    }, timeout=15)
+    for result, current_data in zip(results, current):
         if current_data and 'current' in current_data:
             temp_c = current_data['current'].get('temperature_2m')
             if temp_c is not None:
                 result['temp_c'] = round(temp_c, 1)
                 result['temp_f'] = round(temp_c * 9/5 + 32, 1)
 
-        # Get historical data for the same period last year to calculate "normal"
-        # Fetch 30 days of data from last year for this time period
-        today = datetime.now()
-        # Calculate dates relative to today, then shift back one year
-        start_date = today - timedelta(days=15)
-        end_date = today + timedelta(days=14)  # Use 14 to avoid future dates in edge cases
-        # Shift to last year
-        start_date = start_date.replace(year=start_date.year - 1)
-        end_date = end_date.replace(year=end_date.year - 1)
-
-        # Format dates - ensure start is before end
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
-
-        # Use Open-Meteo Historical API for climate normals
-        historical_url = f"https://archive-api.open-meteo.com/v1/archive?latitude={lat}&longitude={lon}&start_date={start_str}&end_date={end_str}&daily=temperature_2m_mean&timezone=auto"
-        historical_data = fetch_json(historical_url, timeout=15)
-
-        if historical_data and 'daily' in historical_data:
-            temps = historical_data['daily'].get('temperature_2m_mean', [])
-            valid_temps = [t for t in temps if t is not None]
-            if valid_temps:
-                normal_c = sum(valid_temps) / len(valid_temps)
-                result['normal_c'] = round(normal_c, 1)
-
-                # Calculate anomaly if we have current temp
-                if result['temp_c'] is not None:
-                    anomaly_c = result['temp_c'] - result['normal_c']
-                    result['anomaly_c'] = round(anomaly_c, 1)
-                    result['anomaly_f'] = round(anomaly_c * 9/5, 1)
+    # Get historical data for the same period last year to calculate "normal"
+    day_key = today.strftime('%Y-%j')
+    normals = load_openmeteo_normals()
+    keys = [f"{lat},{lon}" for lat, lon in locations]
+    missing = [i for i, key in enumerate(keys) if day_key not in normals.get(key, {})]
 
-    except Exception as e:
-        if city_name:
-            print_safe(f"    ! Open-Meteo error for {city_name}: {e}")
-        else:
-            print_safe(f"    ! Open-Meteo error: {e}")
+    if missing:
+        try:
+            # Calculate dates relative to today, then shift back one year
+            start_date = today - timedelta(days=15)
+            end_date = today + timedelta(days=14)  # Use 14 to avoid future dates in edge cases
+            start_date = start_date.replace(year=start_date.year - 1)
+            end_date = end_date.replace(year=end_date.year - 1)
+        except ValueError as e:
+            print_safe(f"    ! Open-Meteo normal window error: {e}")
+            missing = []
+
+    if missing:
+        historical = fetch_openmeteo_multi(OPENMETEO_ARCHIVE_URL, [locations[i] for i in missing], {
+            'start_date': start_date.strftime('%Y-%m-%d'),
+            'end_date': end_date.strftime('%Y-%m-%d'),
+            'daily': 'temperature_2m_mean',
+            'timezone': 'auto',
+        }, timeout=15)
+        for i, historical_data in zip(missing, historical):
+            if historical_data and 'daily' in historical_data:
+                temps = historical_data['daily'].get('temperature_2m_mean', [])
+                valid_temps = [t for t in temps if t is not None]
+                if valid_temps:
+                    normals.setdefault(keys[i], {})[day_key] = round(sum(valid_temps) / len(valid_temps), 1)
+        save_openmeteo_normals(normals, today)
+
+    for result, key in zip(results, keys):
+        normal_c = normals.get(key, {}).get(day_key)
+        if normal_c is None:
+            continue
+        result['normal_c'] = normal_c
 
-    return result
+        # Calculate anomaly if we have current temp
+        if result['temp_c'] is not None:
+            anomaly_c = result['temp_c'] - normal_c
+            result['anomaly_c'] = round(anomaly_c, 1)
+            result['anomaly_f'] = round(anomaly_c * 9/5, 1)
+
+    print_safe(f"  Open-Meteo: {len(locations)} locations, {len(locations) - len(missing)} normals cached, "
+               f"{len(missing)} fetched")
+    return results
 
 
 def fetch_country_temperature_anomaly(metros, country):
@@ -1476,281 +1566,417 @@ def append_todays_data(season_data, usa_cover, canada_cover, usa_depth=None):
 
 
 # ============================================
-# Main Data Collection
+# Task Graph (concurrent collection)
 # ============================================
 
-def collect_snow_data():
+def run_task_graph(tasks, max_workers=COLLECT_WORKERS, stop=None):
     """
-    Collect snow cover data from all sources
-    Returns complete data structure for dashboard
+    Run tasks concurrently, each as soon as the tasks it depends on are done.
+
+    Args:
+        tasks: Dict of name -> (func, deps); func is called with the dict of
+            results so far (its deps are always in it)
+        max_workers: Threads
+        stop: Optional stop(name, result) predicate; when it returns True no
+            further tasks are started
+
+    Returns:
+        (results, timings): results maps name -> return value for the tasks
+        that ran; timings maps name -> (start, end) in seconds since the
+        graph started
     """
-    print_safe("=" * 60)
-    print_safe("Snow Cover Data Collection")
-    print_safe(f"Timestamp: {datetime.now().isoformat()}")
-    print_safe("=" * 60)
+    results = {}
+    timings = {}
+    graph_start = time.perf_counter()
+    pending = dict(tasks)
+    running = {}
+
+    def timed(name, func):
+        start = time.perf_counter() - graph_start
+        try:
+            return func(results)
+        finally:
+            timings[name] = (start, time.perf_counter() - graph_start)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        stopped = False
+        while pending or running:
+            if not stopped:
+                for name in [n for n, (_, deps) in pending.items() if all(d in results for d in deps)]:
+                    func, _ = pending.pop(name)
+                    running[executor.submit(timed, name, func)] = name
+
+            if not running:
+                break  # stopped, or remaining deps can never be met
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                if stop is not None and stop(name, results[name]):
+                    stopped = True
+
+    return results, timings
+
+
+def stage_wall_time(timings, names):
+    """Wall-clock seconds from the first start to the last end of the named tasks."""
+    spans = [timings[name] for name in names if name in timings]
+    if not spans:
+        return 0.0
+    return max(end for _, end in spans) - min(start for start, _ in spans)
 
-    today = datetime.now()
 
-    # ========== Fetch Real Data ==========
+# ============================================
+# Main Data Collection
+# ============================================
 
-    # 1. NOHRSC U.S. Snow Statistics (primary source for USA)
-    nohrsc_data = fetch_nohrsc_snow_statistics()
+def collect_metro(metro, today):
+    """
+    Collect snow depth and estimated cover for one metro area.
 
-    # 2. NOAA IMS - REAL satellite data for USA and Canada
-    # This is the PRIMARY source for Canada snow cover
-    ims_data = fetch_ims_snow_data()
+    Returns:
+        Metro dict for the dashboard output; 'temperature' is filled in by
+        collect_snow_data from the batched Open-Meteo lookup
+    """
+    city_name = metro['city']
+    print_safe(f"  {city_name}...", )
 
-    # 3. Rutgers Global Snow Lab - North America extent (backup)
-    rutgers_data = fetch_rutgers_snow_extent()
+    snow_data = None
+    depth_inches = 0  # Store numeric depth in inches for sorting
+    cover = 0
 
-    # 4. Copernicus CLMS Snow Cover Extent (backup)
-    copernicus_data = fetch_copernicus_snow_data()
+    if metro['country'] == 'usa':
+        # Use NWS API
+        snow_data = fetch_nws_snow_data(metro['lat'], metro['lon'])
 
-    # ========== Determine U.S. Snow Cover ==========
+        if snow_data:
+            depth_m = snow_data.get('snow_depth_m')
+            temp_c = snow_data.get('temperature_c')
+            condition = snow_data.get('condition')
 
-    # Priority: 1) NOHRSC (most reliable for US), 2) IMS, 3) Copernicus, 4) Error
-    if nohrsc_data.get('cover_percent') is not None:
-        usa_cover = nohrsc_data['cover_percent']
-        usa_source = 'NOHRSC'
-    elif ims_data.get('usa_cover') is not None:
-        usa_cover = ims_data['usa_cover']
-        usa_source = 'NOAA IMS'
-    elif copernicus_data.get('usa_cover') is not None:
-        usa_cover = copernicus_data['usa_cover']
-        usa_source = 'Copernicus SCE'
+            if depth_m is not None:
+                depth_inches = depth_m * 39.37
+                cover = estimate_snow_cover_from_depth(depth_inches, temp_c, metro['lat'], condition)
+            else:
+                cover = estimate_snow_cover_from_depth(None, temp_c, metro['lat'], condition)
+                # Estimate depth from cover
+                if cover == 0:
+                    depth_inches = 0
+                elif cover < 20:
+                    depth_inches = 0.25  # Trace
+                elif cover < 50:
+                    depth_inches = int(1 + cover/20)
+                else:
+                    depth_inches = int(4 + cover/15)
+        else:
+            # Fallback estimate
+            cover = estimate_snow_cover_from_depth(None, None, metro['lat'])
+            if cover == 0:
+                depth_inches = 0
+            elif cover < 30:
+                depth_inches = 0.25  # Trace
+            else:
+                depth_inches = int(2 + cover/20)
+
+    else:  # Canada
+        # Use Environment Canada
+        province = metro.get('province', 'ON')
+        site = metro.get('site', '')
+
+        snow_data = fetch_envcan_conditions(province, site)
+
+        if snow_data and snow_data.get('snow_on_ground_cm') is not None:
+            depth_cm = snow_data['snow_on_ground_cm']
+            temp_c = snow_data.get('temperature_c')
+            condition = snow_data.get('condition')
+
+            depth_inches = depth_cm / 2.54
+            cover = estimate_snow_cover_from_depth(depth_inches, temp_c, metro['lat'], condition)
+        elif snow_data and snow_data.get('temperature_c') is not None:
+            temp_c = snow_data['temperature_c']
+            condition = snow_data.get('condition')
+            cover = estimate_snow_cover_from_depth(None, temp_c, metro['lat'], condition)
+
+            if cover == 0:
+                depth_inches = 0
+            elif cover < 30:
+                depth_inches = 0.25  # Trace
+            else:
+                depth_inches = (5 + cover/8) / 2.54  # Convert estimated cm to inches
+        else:
+            # Fallback estimate
+            cover = estimate_snow_cover_from_depth(None, None, metro['lat'])
+            if cover == 0:
+                depth_inches = 0
+            elif cover < 30:
+                depth_inches = 0.25  # Trace
+            else:
+                depth_inches = (10 + cover/5) / 2.54  # Convert estimated cm to inches
+
+    # Determine trend based on season patterns (deterministic, not random)
+    # In winter months, snow is building; in spring, melting
+    if today.month in [11, 12, 1]:
+        metro_trend = 'up'  # Winter accumulation
+    elif today.month in [3, 4]:
+        metro_trend = 'down'  # Spring melt
     else:
-        print_safe("ERROR: No real USA snow cover data available!")
-        print_safe("All data sources failed. Cannot generate valid output.")
-        return None
+        metro_trend = 'stable'  # Transitional periods
 
-    print_safe(f"\nU.S. Snow Cover: {usa_cover:.1f}% (Source: {usa_source})")
+    # Store numeric depth in both inches and cm for sorting and display
+    depth_cm = round(depth_inches * 2.54, 1)
 
-    # ========== Determine Canada Snow Cover ==========
-    # IMPORTANT: Use ONLY real satellite data - NO derived/synthetic data!
+    # Metro history is not used for sparklines anymore - we use national data
+    # Keep empty list for backwards compatibility
+    metro_history = []
 
-    # Priority: 1) IMS (best for Canada), 2) Copernicus, 3) Error
-    if ims_data.get('canada_cover') is not None:
-        # IMS provides REAL satellite-derived Canada snow cover
-        canada_cover = ims_data['canada_cover']
-        canada_source = 'NOAA IMS'
-    elif copernicus_data.get('canada_cover') is not None:
-        canada_cover = copernicus_data['canada_cover']
-        canada_source = 'Copernicus SCE'
-    else:
-        print_safe("ERROR: No real Canada snow cover data available!")
-        print_safe("IMS and Copernicus both failed. Cannot generate valid output.")
-        return None
+    return {
+        'city': city_name,
+        'region': metro['region'],
+        'country': metro['country'],
+        'lat': metro['lat'],
+        'lng': metro['lon'],  # Use 'lng' to match D3 prototype convention
+        'cover': round(cover),
+        'depthInches': round(depth_inches, 1),  # Numeric for sorting
+        'depthCm': depth_cm,  # Numeric for sorting
+        'trend': metro_trend,
+        'history': metro_history,
+        'temperature': None,
+        'skiMarket': metro.get('skiMarket', False),
+        'importance': metro.get('importance', 100)  # Population in thousands
+    }
 
-    print_safe(f"Canada Snow Cover: {canada_cover:.1f}% (Source: {canada_source})")
 
-    # ========== Calculate Combined ==========
+def fetch_canada_prior_year_history(usa_prior_year_history):
+    """
+    Fetch REAL prior year Canada snow cover from IMS for the dates of the
+    USA prior year history (IMS has daily data going back to 1997).
 
-    total_area = USA_LAND_AREA_SQ_KM + CANADA_LAND_AREA_SQ_KM
-    combined_cover = (
-        (usa_cover * USA_LAND_AREA_SQ_KM) +
-        (canada_cover * CANADA_LAND_AREA_SQ_KM)
-    ) / total_area
+    Days are fetched concurrently and returned in order.
 
-    print_safe(f"Combined Cover: {combined_cover:.1f}%")
+    Returns:
+        List of {'date': 'YYYY-MM-DD', 'value': float or None}
+    """
+    entries = [entry for entry in usa_prior_year_history if entry['date']]
 
-    # ========== Load and Update Season Data ==========
-    # Use REAL accumulated data from the season file, NOT synthetic data
+    def fetch_day(entry):
+        try:
+            # Parse the prior year date
+            prior_date = datetime.strptime(entry['date'], '%Y-%m-%d')
+            year = prior_date.year
+            doy = prior_date.timetuple().tm_yday
+
+            # Fetch IMS grid for this date
+            grid = fetch_ims_file(year, doy)
+            if grid is not None:
+                canada_bounds = REGION_BOUNDS.get('canada')
+                if canada_bounds:
+                    stats = calculate_snow_cover_percentage(grid, canada_bounds)
+                    canada_value = stats['cover'] if stats else None
+                else:
+                    canada_value = None
+            else:
+                canada_value = None
+        except Exception as e:
+            print_safe(f"  Warning: Could not fetch IMS for {entry['date']}: {e}")
+            canada_value = None
+        return canada_value
 
-    print_safe("\n" + "=" * 40)
-    print_safe("Loading season data...")
+    with ThreadPoolExecutor(max_workers=COLLECT_WORKERS) as executor:
+        values = list(executor.map(fetch_day, entries))
 
-    season_data = load_season_data()
-    if season_data is None:
-        print_safe("ERROR: No season data file found!")
-        print_safe("Run backfill_current_season.py first to create the data file.")
-        # Create minimal structure to avoid crashes
-        season_data = {
-            'usa': [],
-            'canada': [],
-            'season': '2025-2026'
-        }
+    return [{'date': entry['date'], 'value': value} for entry, value in zip(entries, values)]
 
-    # Get depth from NOHRSC if available
-    usa_depth = nohrsc_data.get('avg_depth_inches')
 
-    # Append today's real data to the season file
-    season_data = append_todays_data(season_data, usa_cover, canada_cover, usa_depth)
+def collect_snow_data():
+    """
+    Collect snow cover data from all sources
+    Returns complete data structure for dashboard
+    """
+    print_safe("=" * 60)
+    print_safe("Snow Cover Data Collection")
+    print_safe(f"Timestamp: {datetime.now().isoformat()}")
+    print_safe("=" * 60)
 
-    # Save updated season data
-    save_season_data(season_data)
+    today = datetime.now()
 
-    # Get history from real accumulated data
-    usa_history = [{'date': e['date'], 'value': e['value']} for e in season_data.get('usa', [])]
-    canada_history = [{'date': e['date'], 'value': e['value']} for e in season_data.get('canada', [])]
+    # ========== Fetch Real Data ==========
+    # The national sources and the metro lookups are independent and run
+    # concurrently. Source selection and the season file wait for the
+    # national sources; prior year history waits for the season data.
+
+    def determine_covers(results):
+        nohrsc_data, ims_data, copernicus_data = results['nohrsc'], results['ims'], results['copernicus']
+
+        # ========== Determine U.S. Snow Cover ==========
+
+        # Priority: 1) NOHRSC (most reliable for US), 2) IMS, 3) Copernicus, 4) Error
+        if nohrsc_data.get('cover_percent') is not None:
+            usa_cover = nohrsc_data['cover_percent']
+            usa_source = 'NOHRSC'
+        elif ims_data.get('usa_cover') is not None:
+            usa_cover = ims_data['usa_cover']
+            usa_source = 'NOAA IMS'
+        elif copernicus_data.get('usa_cover') is not None:
+            usa_cover = copernicus_data['usa_cover']
+            usa_source = 'Copernicus SCE'
+        else:
+            print_safe("ERROR: No real USA snow cover data available!")
+            print_safe("All data sources failed. Cannot generate valid output.")
+            return None
 
-    print_safe(f"Season data: {len(usa_history)} days (from {usa_history[0]['date'] if usa_history else 'N/A'} to {usa_history[-1]['date'] if usa_history else 'N/A'})")
-    print_safe("=" * 40 + "\n")
+        print_safe(f"\nU.S. Snow Cover: {usa_cover:.1f}% (Source: {usa_source})")
 
-    # Calculate week-over-week change from REAL data
-    usa_last_week = usa_history[-8]['value'] if len(usa_history) >= 8 else usa_cover
-    canada_last_week = canada_history[-8]['value'] if len(canada_history) >= 8 else canada_cover
+        # ========== Determine Canada Snow Cover ==========
+        # IMPORTANT: Use ONLY real satellite data - NO derived/synthetic data!
 
-    usa_trend, usa_change = calculate_trend(usa_cover, usa_last_week)
-    canada_trend, canada_change = calculate_trend(canada_cover, canada_last_week)
+        # Priority: 1) IMS (best for Canada), 2) Copernicus, 3) Error
+        if ims_data.get('canada_cover') is not None:
+            # IMS provides REAL satellite-derived Canada snow cover
+            canada_cover = ims_data['canada_cover']
+            canada_source = 'NOAA IMS'
+        elif copernicus_data.get('canada_cover') is not None:
+            canada_cover = copernicus_data['canada_cover']
+            canada_source = 'Copernicus SCE'
+        else:
+            print_safe("ERROR: No real Canada snow cover data available!")
+            print_safe("IMS and Copernicus both failed. Cannot generate valid output.")
+            return None
 
-    # ========== Collect Metro Area Data ==========
+        print_safe(f"Canada Snow Cover: {canada_cover:.1f}% (Source: {canada_source})")
 
-    print_safe(f"\nCollecting metro area data...")
-    metros = []
+        # ========== Calculate Combined ==========
 
-    for metro in METRO_AREAS:
-        city_name = metro['city']
-        print_safe(f"  {city_name}...", )
+        total_area = USA_LAND_AREA_SQ_KM + CANADA_LAND_AREA_SQ_KM
+        combined_cover = (
+            (usa_cover * USA_LAND_AREA_SQ_KM) +
+            (canada_cover * CANADA_LAND_AREA_SQ_KM)
+        ) / total_area
 
-        snow_data = None
-        depth_inches = 0  # Store numeric depth in inches for sorting
-        cover = 0
+        print_safe(f"Combined Cover: {combined_cover:.1f}%")
 
-        if metro['country'] == 'usa':
-            # Use NWS API
-            snow_data = fetch_nws_snow_data(metro['lat'], metro['lon'])
+        # ========== Load and Update Season Data ==========
+        # Use REAL accumulated data from the season file, NOT synthetic data
 
-            if snow_data:
-                depth_m = snow_data.get('snow_depth_m')
-                temp_c = snow_data.get('temperature_c')
-                condition = snow_data.get('condition')
+        print_safe("\n" + "=" * 40)
+        print_safe("Loading season data...")
 
-                if depth_m is not None:
-                    depth_inches = depth_m * 39.37
-                    cover = estimate_snow_cover_from_depth(depth_inches, temp_c, metro['lat'], condition)
-                else:
-                    cover = estimate_snow_cover_from_depth(None, temp_c, metro['lat'], condition)
-                    # Estimate depth from cover
-                    if cover == 0:
-                        depth_inches = 0
-                    elif cover < 20:
-                        depth_inches = 0.25  # Trace
-                    elif cover < 50:
-                        depth_inches = int(1 + cover/20)
-                    else:
-                        depth_inches = int(4 + cover/15)
-            else:
-                # Fallback estimate
-                cover = estimate_snow_cover_from_depth(None, None, metro['lat'])
-                if cover == 0:
-                    depth_inches = 0
-                elif cover < 30:
-                    depth_inches = 0.25  # Trace
-                else:
-                    depth_inches = int(2 + cover/20)
+        season_data = load_season_data()
+        if season_data is None:
+            print_safe("ERROR: No season data file found!")
+            print_safe("Run backfill_current_season.py first to create the data file.")
+            # Create minimal structure to avoid crashes
+            season_data = {
+                'usa': [],
+                'canada': [],
+                'season': '2025-2026'
+            }
 
-        else:  # Canada
-            # Use Environment Canada
-            province = metro.get('province', 'ON')
-            site = metro.get('site', '')
+        # Get depth from NOHRSC if available
+        usa_depth = nohrsc_data.get('avg_depth_inches')
 
-            snow_data = fetch_envcan_conditions(province, site)
+        # Append today's real data to the season file
+        season_data = append_todays_data(season_data, usa_cover, canada_cover, usa_depth)
 
-            if snow_data and snow_data.get('snow_on_ground_cm') is not None:
-                depth_cm = snow_data['snow_on_ground_cm']
-                temp_c = snow_data.get('temperature_c')
-                condition = snow_data.get('condition')
+        # Save updated season data
+        save_season_data(season_data)
 
-                depth_inches = depth_cm / 2.54
-                cover = estimate_snow_cover_from_depth(depth_inches, temp_c, metro['lat'], condition)
-            elif snow_data and snow_data.get('temperature_c') is not None:
-                temp_c = snow_data['temperature_c']
-                condition = snow_data.get('condition')
-                cover = estimate_snow_cover_from_depth(None, temp_c, metro['lat'], condition)
+        # Get history from real accumulated data
+        usa_history = [{'date': e['date'], 'value': e['value']} for e in season_data.get('usa', [])]
+        canada_history = [{'date': e['date'], 'value': e['value']} for e in season_data.get('canada', [])]
 
-                if cover == 0:
-                    depth_inches = 0
-                elif cover < 30:
-                    depth_inches = 0.25  # Trace
-                else:
-                    depth_inches = (5 + cover/8) / 2.54  # Convert estimated cm to inches
-            else:
-                # Fallback estimate
-                cover = estimate_snow_cover_from_depth(None, None, metro['lat'])
-                if cover == 0:
-                    depth_inches = 0
-                elif cover < 30:
-                    depth_inches = 0.25  # Trace
-                else:
-                    depth_inches = (10 + cover/5) / 2.54  # Convert estimated cm to inches
-
-        # Determine trend based on season patterns (deterministic, not random)
-        # In winter months, snow is building; in spring, melting
-        if today.month in [11, 12, 1]:
-            metro_trend = 'up'  # Winter accumulation
-        elif today.month in [3, 4]:
-            metro_trend = 'down'  # Spring melt
-        else:
-            metro_trend = 'stable'  # Transitional periods
-
-        # Store numeric depth in both inches and cm for sorting and display
-        depth_cm = round(depth_inches * 2.54, 1)
-
-        # Metro history is not used for sparklines anymore - we use national data
-        # Keep empty list for backwards compatibility
-        metro_history = []
-
-        # Fetch temperature and anomaly data from Open-Meteo
-        temp_data = fetch_openmeteo_temperature(metro['lat'], metro['lon'], city_name)
-        # Small delay to avoid rate limiting (Open-Meteo is free but has soft limits)
-        time.sleep(0.3)
-
-        metros.append({
-            'city': city_name,
-            'region': metro['region'],
-            'country': metro['country'],
-            'lat': metro['lat'],
-            'lng': metro['lon'],  # Use 'lng' to match D3 prototype convention
-            'cover': round(cover),
-            'depthInches': round(depth_inches, 1),  # Numeric for sorting
-            'depthCm': depth_cm,  # Numeric for sorting
-            'trend': metro_trend,
-            'history': metro_history,
-            'temperature': temp_data,
-            'skiMarket': metro.get('skiMarket', False),
-            'importance': metro.get('importance', 100)  # Population in thousands
-        })
+        print_safe(f"Season data: {len(usa_history)} days (from {usa_history[0]['date'] if usa_history else 'N/A'} to {usa_history[-1]['date'] if usa_history else 'N/A'})")
+        print_safe("=" * 40 + "\n")
 
-    # Sort metros by snow cover descending
-    metros.sort(key=lambda x: x['cover'], reverse=True)
+        # Calculate week-over-week change from REAL data
+        usa_last_week = usa_history[-8]['value'] if len(usa_history) >= 8 else usa_cover
+        canada_last_week = canada_history[-8]['value'] if len(canada_history) >= 8 else canada_cover
 
-    # ========== Fetch Prior Year History (Real Data) ==========
-    # Fetch real prior year data from NOHRSC for USA
-    print_safe("\nFetching prior year data for comparison...")
-    usa_prior_year_history, usa_prior_depth_avg = fetch_prior_year_history(usa_history[-30:] if len(usa_history) > 30 else usa_history)
-
-    # Fetch REAL prior year data from IMS for Canada
-    # IMS has daily data going back to 1997
-    canada_prior_year_history = []
-    if usa_prior_year_history:
-        print_safe("Fetching real IMS data for Canada prior year history...")
-        for entry in usa_prior_year_history:
-            if entry['date']:
-                try:
-                    # Parse the prior year date
-                    prior_date = datetime.strptime(entry['date'], '%Y-%m-%d')
-                    year = prior_date.year
-                    doy = prior_date.timetuple().tm_yday
-
-                    # Fetch IMS grid for this date
-                    grid = fetch_ims_file(year, doy)
-                    if grid:
-                        canada_bounds = REGION_BOUNDS.get('canada')
-                        if canada_bounds:
-                            stats = calculate_snow_cover_percentage(grid, canada_bounds)
-                            canada_value = stats['cover'] if stats else None
-                        else:
-                            canada_value = None
-                    else:
-                        canada_value = None
-                except Exception as e:
-                    print_safe(f"  Warning: Could not fetch IMS for {entry['date']}: {e}")
-                    canada_value = None
+        usa_trend, usa_change = calculate_trend(usa_cover, usa_last_week)
+        canada_trend, canada_change = calculate_trend(canada_cover, canada_last_week)
 
-                canada_prior_year_history.append({
-                    'date': entry['date'],
-                    'value': canada_value
-                })
+        return {
+            'usa_cover': usa_cover,
+            'usa_source': usa_source,
+            'canada_cover': canada_cover,
+            'canada_source': canada_source,
+            'combined_cover': combined_cover,
+            'usa_history': usa_history,
+            'canada_history': canada_history,
+            'usa_trend': usa_trend,
+            'usa_change': usa_change,
+            'canada_change': canada_change,
+        }
+
+    def fetch_prior_years(results):
+        usa_history = results['covers']['usa_history']
+
+        # Fetch real prior year data from NOHRSC for USA
+        print_safe("\nFetching prior year data for comparison...")
+        usa_prior_year_history, usa_prior_depth_avg = fetch_prior_year_history(usa_history[-30:] if len(usa_history) > 30 else usa_history)
+
+        # Fetch REAL prior year data from IMS for Canada
+        canada_prior_year_history = []
+        if usa_prior_year_history:
+            print_safe("Fetching real IMS data for Canada prior year history...")
+            canada_prior_year_history = fetch_canada_prior_year_history(usa_prior_year_history)
+
+        return usa_prior_year_history, usa_prior_depth_avg, canada_prior_year_history
+
+    tasks = {
+        # 1. NOHRSC U.S. Snow Statistics (primary source for USA)
+        'nohrsc': (lambda results: fetch_nohrsc_snow_statistics(), []),
+        # 2. NOAA IMS - REAL satellite data for USA and Canada
+        # This is the PRIMARY source for Canada snow cover
+        'ims': (lambda results: fetch_ims_snow_data(), []),
+        # 3. Rutgers Global Snow Lab - North America extent (backup)
+        'rutgers': (lambda results: fetch_rutgers_snow_extent(), []),
+        # 4. Copernicus CLMS Snow Cover Extent (backup)
+        'copernicus': (lambda results: fetch_copernicus_snow_data(), []),
+        'covers': (determine_covers, ['nohrsc', 'ims', 'copernicus']),
+        'prior_year': (fetch_prior_years, ['covers']),
+        # Temperature and anomaly for every metro, in a few Open-Meteo requests
+        'temperatures': (lambda results: fetch_metro_temperatures(
+            [(metro['lat'], metro['lon']) for metro in METRO_AREAS], today), []),
+    }
+    metro_tasks = [f"metro:{i}" for i in range(len(METRO_AREAS))]
+    for name, metro in zip(metro_tasks, METRO_AREAS):
+        tasks[name] = (lambda results, metro=metro: collect_metro(metro, today), [])
+
+    print_safe(f"Collecting national sources and {len(METRO_AREAS)} metro areas concurrently...")
+    # No point fetching prior year data when there is no valid cover
+    results, timings = run_task_graph(tasks, stop=lambda name, result: name == 'covers' and result is None)
+
+    national = ['nohrsc', 'ims', 'rutgers', 'copernicus']
+    print_safe("\nStage timings (wall clock):")
+    print_safe(f"  National sources: {stage_wall_time(timings, national):.1f}s (" +
+               ", ".join(f"{name} {stage_wall_time(timings, [name]):.1f}s" for name in national) + ")")
+    print_safe(f"  Metro areas: {stage_wall_time(timings, metro_tasks):.1f}s ({len(metro_tasks)} metros)")
+    print_safe(f"  Metro temperatures: {stage_wall_time(timings, ['temperatures']):.1f}s")
+    print_safe(f"  Season data: {stage_wall_time(timings, ['covers']):.1f}s")
+    print_safe(f"  Prior year history: {stage_wall_time(timings, ['prior_year']):.1f}s")
+    print_safe(f"  Total: {stage_wall_time(timings, list(timings)):.1f}s")
+
+    covers = results['covers']
+    if covers is None:
+        return None
+
+    nohrsc_data = results['nohrsc']
+    rutgers_data = results['rutgers']
+    copernicus_data = results['copernicus']
+    usa_cover, usa_source = covers['usa_cover'], covers['usa_source']
+    canada_cover, canada_source = covers['canada_cover'], covers['canada_source']
+    combined_cover = covers['combined_cover']
+    usa_history, canada_history = covers['usa_history'], covers['canada_history']
+    usa_trend, usa_change = covers['usa_trend'], covers['usa_change']
+    canada_change = covers['canada_change']
+
+    # Metros in METRO_AREAS order, then sorted by snow cover descending
+    metros = [results[name] for name in metro_tasks]
+    for metro, temp_data in zip(metros, results['temperatures']):
+        metro['temperature'] = temp_data
+    metros.sort(key=lambda x: x['cover'], reverse=True)
+
+    usa_prior_year_history, usa_prior_depth_avg, canada_prior_year_history = results['prior_year']
 
     # ========== Build Output ==========
 
@@ -1870,46 +2096,251 @@ def save_snow_data(data):
     return output_path
 
 # ============================================
-# Temperature History Update
+# Temperature History Store
 # ============================================
 
-def update_temperature_history():
+def _float32_values(column):
+    """float32 column -> list of floats (shortest repr, so 12.3 stays 12.3), NaN -> None"""
+    return [None if value != value else float(str(value)) for value in column]
+
+
+def load_temperature_index(store_dir=None):
     """
-    Incrementally update temperature-history.json with recent data.
+    Load the temperature store index (metros.json).
 
-    Fetches from Open-Meteo Archive API for any missing dates since the last
-    update. This keeps the temperature anomaly chart current without needing
-    manual backfill runs.
+    Returns:
+        Dict with 'meta' (top-level fields of the exported JSON) and 'metros'
+        ({city: {'id', 'last_date', 'lat', 'lng', 'normals', ...}}), or None
+        if the store does not exist yet
+    """
+    path = os.path.join(store_dir or TEMPERATURE_STORE_DIR, 'metros.json')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != TEMPERATURE_STORE_VERSION:
+        print_safe(f"  ! Ignoring temperature store index with version {index.get('version')}")
+        return None
+    return index
 
-    Called from main() after snow data collection.
+
+def save_temperature_index(index, store_dir=None):
+    """Save the temperature store index atomically"""
+    store_dir = store_dir or TEMPERATURE_STORE_DIR
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, 'metros.json')
+    index['version'] = TEMPERATURE_STORE_VERSION
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def load_temperature_partition(year, store_dir=None):
     """
-    temp_file = 'static/data/temperature-history.json'
+    Load one year of the temperature store.
 
-    if not os.path.exists(temp_file):
-        print_safe("  ! temperature-history.json not found — run backfill_current_season_temp.py first")
-        return
+    Returns:
+        Dict of columns sorted by (metro, date): 'metro' (int16 metro id),
+        'date' (datetime64[D]), 'temp_c', 'normal_c', 'anomaly_c' (float32,
+        NaN where unknown). Empty columns if the year has no data.
+    """
+    path = os.path.join(store_dir or TEMPERATURE_STORE_DIR, f'{year}.npz')
+    if not os.path.exists(path):
+        return {name: np.empty(0, dtype=dtype) for name, dtype in TEMPERATURE_STORE_COLUMNS.items()}
+    with np.load(path) as data:
+        return {name: data[name].astype(dtype) for name, dtype in TEMPERATURE_STORE_COLUMNS.items()}
+
+
+def save_temperature_partition(year, table, store_dir=None):
+    """Save one year of the temperature store atomically"""
+    store_dir = store_dir or TEMPERATURE_STORE_DIR
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, f'{year}.npz')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **table)
+    os.replace(tmp_path, path)
+
+
+def temperature_store_years(store_dir=None):
+    """Years with a partition in the store, ascending"""
+    store_dir = store_dir or TEMPERATURE_STORE_DIR
+    if not os.path.isdir(store_dir):
+        return []
+    return sorted(int(name[:-4]) for name in os.listdir(store_dir)
+                  if name.endswith('.npz') and name[:-4].isdigit())
+
+
+def append_temperature_history(index, rows_by_city, store_dir=None):
+    """
+    Append daily rows to the store. Only the year partitions the new rows
+    fall in are rewritten; the index's last_date is advanced per metro.
+
+    Args:
+        index: Store index from load_temperature_index (updated in place)
+        rows_by_city: {city: [(date_str, temp_c, normal_c or None,
+            anomaly_c or None), ...]}; rows on or before a metro's last_date
+            are ignored
+
+    Returns:
+        Number of rows appended
+    """
+    by_year = {}
+    for city, rows in rows_by_city.items():
+        metro = index['metros'][city]
+        last_date = metro.get('last_date') or ''
+        for date_str, temp_c, normal_c, anomaly_c in rows:
+            if date_str > last_date:
+                by_year.setdefault(int(date_str[:4]), []).append(
+                    (metro['id'], date_str, temp_c, normal_c, anomaly_c))
+        new_dates = [row[0] for row in rows if row[0] > last_date]
+        if new_dates:
+            metro['last_date'] = max(new_dates)
+
+    appended = 0
+    for year, rows in sorted(by_year.items()):
+        table = load_temperature_partition(year, store_dir)
+        new = {
+            'metro': np.array([row[0] for row in rows], dtype=np.int16),
+            'date': np.array([row[1] for row in rows], dtype='datetime64[D]'),
+        }
+        for i, name in enumerate(('temp_c', 'normal_c', 'anomaly_c'), start=2):
+            new[name] = np.array([np.nan if row[i] is None else row[i] for row in rows], dtype=np.float32)
+        table = {name: np.concatenate([table[name], new[name]]) for name in TEMPERATURE_STORE_COLUMNS}
+        order = np.lexsort((table['date'], table['metro']))
+        save_temperature_partition(year, {name: column[order] for name, column in table.items()}, store_dir)
+        appended += len(rows)
+    return appended
+
+
+def temperature_json_sha1(json_path):
+    """SHA-1 of a temperature-history.json, or None if it cannot be read"""
+    try:
+        with open(json_path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def import_temperature_history_json(json_path, store_dir=None):
+    """
+    Build the store from temperature-history.json, replacing any existing
+    partitions (first run, lost cache, or a JSON changed outside the store).
 
+    Returns:
+        The new store index, or None if the JSON could not be read
+    """
     try:
-        with open(temp_file, 'r', encoding='utf-8') as f:
+        with open(json_path, 'r', encoding='utf-8') as f:
             temp_data = json.load(f)
     except Exception as e:
         print_safe(f"  ! Could not load temperature history: {e}")
-        return
+        return None
+
+    for year in temperature_store_years(store_dir):
+        os.remove(os.path.join(store_dir or TEMPERATURE_STORE_DIR, f'{year}.npz'))
+
+    index = {'meta': {key: value for key, value in temp_data.items() if key != 'metros'}, 'metros': {}}
+    rows_by_city = {}
+    for metro_id, (city, data) in enumerate(temp_data.get('metros', {}).items()):
+        index['metros'][city] = dict({'id': metro_id, 'last_date': None},
+                                     **{key: value for key, value in data.items() if key != 'history'})
+        rows_by_city[city] = [(e['date'], e.get('temp_c'), e.get('normal_c'), e.get('anomaly_c'))
+                              for e in sorted(data.get('history', []), key=lambda x: x['date'])]
+
+    count = append_temperature_history(index, rows_by_city, store_dir)
+    index['exported_sha1'] = temperature_json_sha1(json_path)
+    save_temperature_index(index, store_dir)
+    print_safe(f"  Imported {count} days for {len(index['metros'])} metros into {store_dir or TEMPERATURE_STORE_DIR}")
+    return index
+
+
+def export_temperature_history_json(index, json_path, store_dir=None):
+    """
+    Write temperature-history.json for the site from the store.
 
-    metro_data = temp_data.get('metros', {})
+    Entries carry normal_c/anomaly_c only when they are known, as the
+    incremental update always wrote them. The file's SHA-1 is recorded in
+    the index as 'exported_sha1'; the caller saves the index.
+    """
+    histories = {metro['id']: [] for metro in index['metros'].values()}
+    for year in temperature_store_years(store_dir):
+        table = load_temperature_partition(year, store_dir)
+        dates = table['date'].astype(str).tolist()
+        metro_ids = table['metro'].tolist()
+        columns = [(name, _float32_values(table[name])) for name in ('temp_c', 'normal_c', 'anomaly_c')]
+        for i, (metro_id, date_str) in enumerate(zip(metro_ids, dates)):
+            entry = {'date': date_str}
+            for name, values in columns:
+                if values[i] is not None or name == 'temp_c':
+                    entry[name] = values[i]
+            histories.setdefault(metro_id, []).append(entry)
+
+    temp_data = dict(index.get('meta', {}))
+    temp_data['metros'] = {}
+    for city, metro in index['metros'].items():
+        data = {key: value for key, value in metro.items() if key not in ('id', 'last_date')}
+        data['history'] = histories[metro['id']]
+        temp_data['metros'][city] = data
+
+    # json.dumps (C encoder) is several times faster than streaming json.dump.
+    # No indent — file is 9MB, indentation would make it huge
+    text = json.dumps(temp_data).encode('utf-8')
+    tmp_path = json_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(text)
+    os.replace(tmp_path, json_path)
+    index['exported_sha1'] = hashlib.sha1(text).hexdigest()
+
+
+# ============================================
+# Temperature History Update
+# ============================================
+
+def update_temperature_history():
+    """
+    Incrementally update the temperature history with recent data.
+
+    Fetches from Open-Meteo Archive API for any missing dates since the last
+    update. This keeps the temperature anomaly chart current without needing
+    manual backfill runs.
+
+    New days are appended to the columnar store in TEMPERATURE_STORE_DIR
+    (only the current year's partition and the index are rewritten), and
+    temperature-history.json is re-exported from the store for the site.
+    The store is (re)built from temperature-history.json when it is missing
+    or the JSON differs from its last export.
+
+    Called from main() after snow data collection.
+    """
+    temp_file = TEMPERATURE_HISTORY_JSON
+
+    index = load_temperature_index()
+    if index is not None and os.path.exists(temp_file) and \
+            index.get('exported_sha1') != temperature_json_sha1(temp_file):
+        print_safe("  temperature-history.json changed since the store's last export")
+        index = None
+    if index is None:
+        if not os.path.exists(temp_file):
+            print_safe("  ! temperature-history.json not found — run backfill_current_season_temp.py first")
+            return
+        print_safe("  Building temperature history store from temperature-history.json...")
+        index = import_temperature_history_json(temp_file)
+        if index is None:
+            return
+
+    metro_data = index.get('metros', {})
     if not metro_data:
-        print_safe("  ! No metro data in temperature history file")
+        print_safe("  ! No metro data in temperature history store")
         return
 
     # Open-Meteo archive has a ~2-day lag
     end_date = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
 
     # Find the latest date across all metros to determine what needs fetching
-    latest_dates = []
-    for city, data in metro_data.items():
-        history = data.get('history', [])
-        if history:
-            latest_dates.append(history[-1]['date'])
+    latest_dates = [data['last_date'] for data in metro_data.values() if data.get('last_date')]
 
     if not latest_dates:
         print_safe("  ! No existing history entries found")
@@ -1928,71 +2359,63 @@ def update_temperature_history():
     days_to_fetch = (datetime.strptime(end_date, '%Y-%m-%d') - start_date_dt).days + 1
     print_safe(f"  Fetching {days_to_fetch} days ({start_date} to {end_date}) for {len(metro_data)} metros")
 
-    updated_count = 0
+    # Metros that share a start date are fetched together in batched requests
+    batches = {}
     for city, data in metro_data.items():
         lat = data.get('lat')
         lng = data.get('lng')
         if lat is None or lng is None:
             continue
 
-        # Skip if this metro is already current
-        history = data.get('history', [])
-        existing_dates = {e['date'] for e in history}
-        if end_date in existing_dates:
-            continue
-
         # Determine this metro's start date (day after its latest entry)
-        if history:
-            metro_start = (datetime.strptime(history[-1]['date'], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        last_date = data.get('last_date')
+        if last_date:
+            metro_start = (datetime.strptime(last_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
         else:
             metro_start = start_date
 
+        # Skip if this metro is already current
         if metro_start > end_date:
             continue
 
-        # Fetch from Open-Meteo Archive
-        url = (f"https://archive-api.open-meteo.com/v1/archive?"
-               f"latitude={lat}&longitude={lng}"
-               f"&start_date={metro_start}&end_date={end_date}"
-               f"&daily=temperature_2m_mean&timezone=auto")
+        batches.setdefault(metro_start, []).append(city)
 
-        api_data = fetch_json(url, timeout=15)
-        if api_data and 'daily' in api_data:
+    rows_by_city = {}
+    for metro_start, cities in sorted(batches.items()):
+        # Fetch from Open-Meteo Archive
+        responses = fetch_openmeteo_multi(
+            OPENMETEO_ARCHIVE_URL,
+            [(metro_data[city]['lat'], metro_data[city]['lng']) for city in cities],
+            {'start_date': metro_start, 'end_date': end_date,
+             'daily': 'temperature_2m_mean', 'timezone': 'auto'},
+            timeout=15)
+
+        for city, api_data in zip(cities, responses):
+            if not (api_data and 'daily' in api_data):
+                continue
             times = api_data['daily'].get('time', [])
             temps = api_data['daily'].get('temperature_2m_mean', [])
-            new_count = 0
+            normals = metro_data[city].get('normals', {})
+            rows = []
             for i, date_str in enumerate(times):
-                if i < len(temps) and temps[i] is not None and date_str not in existing_dates:
-                    entry = {
-                        'date': date_str,
-                        'temp_c': round(temps[i], 1)
-                    }
+                if i < len(temps) and temps[i] is not None:
                     # Calculate anomaly if normals are available
-                    normals = data.get('normals', {})
                     md = date_str[5:]  # "MM-DD"
                     if md in normals:
-                        entry['normal_c'] = normals[md]
-                        entry['anomaly_c'] = round(temps[i] - normals[md], 1)
-                    history.append(entry)
-                    new_count += 1
-            if new_count > 0:
-                updated_count += 1
-
-        time.sleep(0.3)  # Rate limiting
-
-    if updated_count > 0:
-        # Sort all histories by date
-        for city, data in metro_data.items():
-            data['history'].sort(key=lambda x: x['date'])
+                        rows.append((date_str, round(temps[i], 1), normals[md], round(temps[i] - normals[md], 1)))
+                    else:
+                        rows.append((date_str, round(temps[i], 1), None, None))
+            if rows:
+                rows_by_city[city] = rows
 
+    appended = append_temperature_history(index, rows_by_city)
+    if appended > 0:
         # Update metadata
-        temp_data['generated'] = datetime.now().strftime('%Y-%m-%d %H:%M') + ' UTC'
-
-        # Save
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(temp_data, f)  # No indent — file is 9MB, indentation would make it huge
+        index.setdefault('meta', {})['generated'] = datetime.now().strftime('%Y-%m-%d %H:%M') + ' UTC'
+        export_temperature_history_json(index, temp_file)
+        save_temperature_index(index)
 
-        print_safe(f"  OK Updated {updated_count} metros through {end_date}")
+        print_safe(f"  OK Updated {len(rows_by_city)} metros through {end_date} ({appended} days appended)")
     else:
         print_safe(f"  No new temperature data to add")
 
@@ -2029,4 +2452,14 @@ def main():
         return 1
 
 if __name__ == '__main__':
+    if '--export-temperature-history' in sys.argv:
+        # Rebuild temperature-history.json from the store without fetching
+        index = load_temperature_index()
+        if index is None:
+            print_safe(f"No temperature history store in {TEMPERATURE_STORE_DIR}")
+            sys.exit(1)
+        export_temperature_history_json(index, TEMPERATURE_HISTORY_JSON)
+        save_temperature_index(index)
+        print_safe(f"Exported {len(index['metros'])} metros to {TEMPERATURE_HISTORY_JSON}")
+        sys.exit(0)
     sys.exit(main())